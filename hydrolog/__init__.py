@@ -12,7 +12,7 @@ A modular library providing tools for:
 __version__ = "0.7.0"
 __author__ = "Piotr de Bever"
 
-from hydrolog.exceptions import HydrologError, InvalidParameterError, CalculationError
+from typing import Any
 
 __all__ = [
     "__version__",
@@ -20,3 +20,16 @@ __all__ = [
     "InvalidParameterError",
     "CalculationError",
 ]
+
+_EXCEPTIONS = frozenset({"HydrologError", "InvalidParameterError", "CalculationError"})
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exception re-exports on first access (PEP 562)."""
+    if name in _EXCEPTIONS:
+        from hydrolog import exceptions
+
+        value = getattr(exceptions, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
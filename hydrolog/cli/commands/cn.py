@@ -1,23 +1,42 @@
 """CLI command for Curve Number lookup."""
 
 import argparse
+import sys
+from functools import cache
+from typing import Final
 
-from hydrolog.runoff import (
-    HydrologicCondition,
-    LandCover,
-    get_cn,
-    get_cn_range,
-    list_land_covers,
-)
+# Table separators
+_SEP20: Final[str] = "─" * 20
+_SEP35: Final[str] = "─" * 35
+_SEP50: Final[str] = "─" * 50
+
+
+@cache
+def _list_text() -> str:
+    """Render the 'cn list' table (TR-55 covers are static, so only once)."""
+    from hydrolog.runoff import list_land_covers_by_category
+
+    lines = ["Available Land Cover Types (TR-55)", _SEP50]
+    current: str | None = None
+    for category, name, value in list_land_covers_by_category():
+        if category != current:
+            lines.append(f"\n{category}:")
+            current = category
+        lines.append(f"  {value:20} ({name})")
+    lines.append(f"\n{_SEP50}")
+    lines.append("Note: Some covers require --condition (poor/fair/good)")
+    return "\n".join(lines) + "\n"
 
 
 def register_parser(subparsers: argparse._SubParsersAction) -> None:
-    """Register the 'cn' command parser."""
+    """Register the 'cn' command parser (no-op if already registered)."""
+    if "cn" in subparsers.choices:
+        return
+
     parser = subparsers.add_parser(
         "cn",
         help="Curve Number lookup (TR-55)",
         description="Look up Curve Number values from USDA TR-55 tables.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Subcommands:
   lookup  Look up CN for specific HSG and land cover
@@ -48,23 +67,23 @@ Examples:
     )
     lookup.add_argument(
         "--hsg",
-        type=str,
+        type=str.upper,
         required=True,
-        choices=["A", "B", "C", "D", "a", "b", "c", "d"],
+        choices=("A", "B", "C", "D"),
         metavar="HSG",
         help="Hydrologic Soil Group (A, B, C, or D)",
     )
     lookup.add_argument(
         "--cover",
-        type=str,
+        type=str.lower,
         required=True,
         metavar="TYPE",
         help="Land cover type (use 'hydrolog cn list' to see options)",
     )
     lookup.add_argument(
         "--condition",
-        type=str,
-        choices=["poor", "fair", "good"],
+        type=str.lower,
+        choices=("poor", "fair", "good"),
         default=None,
         metavar="COND",
         help="Hydrologic condition (poor, fair, good) - required for some covers",
@@ -87,7 +106,7 @@ Examples:
     )
     range_cmd.add_argument(
         "--cover",
-        type=str,
+        type=str.lower,
         required=True,
         metavar="TYPE",
         help="Land cover type",
@@ -105,85 +124,62 @@ def _show_help(args: argparse.Namespace) -> int:
 
 def _run_lookup(args: argparse.Namespace) -> int:
     """Execute CN lookup."""
-    hsg = args.hsg.upper()
-    cover = args.cover.lower()
+    from hydrolog.runoff import HydrologicCondition, get_cn
+
+    hsg = args.hsg
+    cover = args.cover
     condition = args.condition
 
     # Parse condition
     cond_enum = None
     if condition:
-        cond_enum = HydrologicCondition(condition.lower())
+        cond_enum = HydrologicCondition(condition)
 
     cn = get_cn(hsg, cover, cond_enum)
 
-    print(f"Curve Number Lookup (TR-55)")
-    print(f"{'─' * 35}")
-    print(f"  HSG:        {hsg}")
-    print(f"  Land cover: {cover}")
+    lines = [
+        "Curve Number Lookup (TR-55)",
+        _SEP35,
+        f"  HSG:        {hsg}",
+        f"  Land cover: {cover}",
+    ]
     if condition:
-        print(f"  Condition:  {condition}")
-    print(f"{'─' * 35}")
-    print(f"  CN = {cn}")
+        lines.append(f"  Condition:  {condition}")
+    lines.append(_SEP35)
+    lines.append(f"  CN = {cn}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
 
 def _run_list(args: argparse.Namespace) -> int:
     """List available land cover types."""
-    covers = list_land_covers()
-
-    print("Available Land Cover Types (TR-55)")
-    print(f"{'─' * 50}")
-
-    # Group by category
-    agricultural = ["FALLOW", "ROW_CROPS", "SMALL_GRAIN", "PASTURE", "MEADOW"]
-    natural = ["BRUSH", "FOREST", "HERBACEOUS"]
-    developed = [
-        "FARMSTEAD",
-        "RESIDENTIAL_LOW",
-        "RESIDENTIAL_MEDIUM",
-        "RESIDENTIAL_HIGH",
-        "COMMERCIAL",
-        "INDUSTRIAL",
-        "OPEN_SPACE",
-    ]
-    impervious = ["PAVED", "GRAVEL", "DIRT"]
-    water = ["WATER"]
-
-    def print_category(name: str, items: list) -> None:
-        print(f"\n{name}:")
-        for item in items:
-            if item in covers:
-                print(f"  {covers[item]:20} ({item})")
-
-    print_category("Agricultural", agricultural)
-    print_category("Natural", natural)
-    print_category("Developed", developed)
-    print_category("Impervious", impervious)
-    print_category("Water", water)
-
-    print(f"\n{'─' * 50}")
-    print("Note: Some covers require --condition (poor/fair/good)")
+    sys.stdout.write(_list_text())
 
     return 0
 
 
 def _run_range(args: argparse.Namespace) -> int:
     """Show CN range for a land cover type."""
-    cover = args.cover.lower()
+    from hydrolog.runoff import get_cn_range
+
+    cover = args.cover
     ranges = get_cn_range(cover)
 
-    print(f"CN Range for '{cover}'")
-    print(f"{'─' * 35}")
-    print(f"  {'HSG':<5} {'Min':<6} {'Max':<6}")
-    print(f"  {'─' * 20}")
+    lines = [
+        f"CN Range for '{cover}'",
+        _SEP35,
+        f"  {'HSG':<5} {'Min':<6} {'Max':<6}",
+        f"  {_SEP20}",
+    ]
 
     for hsg in ["A", "B", "C", "D"]:
         if hsg in ranges:
             min_cn, max_cn = ranges[hsg]
             if min_cn == max_cn:
-                print(f"  {hsg:<5} {min_cn:<6}")
+                lines.append(f"  {hsg:<5} {min_cn:<6}")
             else:
-                print(f"  {hsg:<5} {min_cn:<6} {max_cn:<6}")
+                lines.append(f"  {hsg:<5} {min_cn:<6} {max_cn:<6}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
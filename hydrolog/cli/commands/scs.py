@@ -1,17 +1,64 @@
 """CLI command for SCS-CN runoff calculation."""
 
 import argparse
+import io
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final, Mapping
 
-from hydrolog.runoff import AMC, SCSCN
+if TYPE_CHECKING:
+    from hydrolog.runoff import AMC, SCSCN
+
+# Table separators
+_SEP40: Final[str] = "─" * 40
+
+# Report layout for 'scs' (filled with %-formatting in _run_scs)
+_SCS_OUT_TMPL: Final[str] = (
+    "SCS-CN Runoff Calculation\n"
+    f"{_SEP40}\n"
+    "  Input:\n"
+    "    Precipitation (P):     %.2f mm\n"
+    "    Curve Number (CN-II):  %d\n"
+    "    AMC:                   %s (%s)\n"
+    "    Ia coefficient:        %s\n"
+    f"{_SEP40}\n"
+    "  Results:\n"
+    "    Adjusted CN:           %d\n"
+    "    Max retention (S):     %.2f mm\n"
+    "    Initial abstraction:   %.2f mm\n"
+    "    Effective precip (Pe): %.2f mm\n"
+    "    Runoff coefficient:    %.3f\n"
+    f"{_SEP40}\n"
+    "\n%s\n"
+)
+
+# Accepted --amc spellings mapped to AMC member names
+_AMC_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "I": "I",
+        "1": "I",
+        "II": "II",
+        "2": "II",
+        "III": "III",
+        "3": "III",
+    }
+)
+
+
+def _parse_amc(value: str) -> str:
+    """Normalize an --amc value to an AMC member name (checked by choices)."""
+    return _AMC_MAP.get(value, value)
 
 
 def register_parser(subparsers: argparse._SubParsersAction) -> None:
-    """Register the 'scs' command parser."""
+    """Register the 'scs' command parser (no-op if already registered)."""
+    if "scs" in subparsers.choices:
+        return
+
     parser = subparsers.add_parser(
         "scs",
         help="SCS-CN runoff calculation",
         description="Calculate effective precipitation using SCS Curve Number method.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 AMC (Antecedent Moisture Condition):
   I   - Dry conditions (lowest runoff potential)
@@ -22,6 +69,11 @@ Examples:
   hydrolog scs --cn 72 --precipitation 50
   hydrolog scs --cn 80 --precipitation 75 --amc III
   hydrolog scs --cn 65 --precipitation 100 --ia 0.1
+  hydrolog scs --cn 72 --precipitation-file hyetograph.txt > runoff.csv
+
+Hyetograph file:
+  Whitespace-separated text, one interval per line; the last column is
+  the precipitation depth [mm] (e.g. "time_min depth_mm" or just depths).
 """,
     )
 
@@ -33,18 +85,23 @@ Examples:
         metavar="CN",
         help="Curve Number for AMC-II (1-100)",
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "-P",
         "--precipitation",
         type=float,
-        required=True,
         metavar="MM",
         help="Total precipitation [mm]",
     )
+    source.add_argument(
+        "--precipitation-file",
+        metavar="PATH",
+        help="Hyetograph file; prints the effective precipitation series as CSV",
+    )
     parser.add_argument(
         "--amc",
-        type=str,
-        choices=["I", "II", "III", "1", "2", "3"],
+        type=_parse_amc,
+        choices=("I", "II", "III"),
         default="II",
         metavar="AMC",
         help="Antecedent Moisture Condition (I, II, III) - default: II",
@@ -62,47 +119,66 @@ Examples:
 
 def _run_scs(args: argparse.Namespace) -> int:
     """Execute SCS-CN calculation."""
-    # Parse AMC
-    amc_map = {
-        "I": AMC.I,
-        "1": AMC.I,
-        "II": AMC.II,
-        "2": AMC.II,
-        "III": AMC.III,
-        "3": AMC.III,
-    }
-    amc = amc_map[args.amc]
+    from hydrolog.runoff import AMC, SCSCN
+
+    amc = AMC[args.amc]
 
     # Create calculator and compute
     scs = SCSCN(cn=args.cn, ia_coefficient=args.ia)
+
+    if args.precipitation_file is not None:
+        return _run_scs_series(scs, amc, args.precipitation_file)
+
     result = scs.effective_precipitation(
         precipitation_mm=args.precipitation,
         amc=amc,
     )
 
-    # Calculate runoff coefficient
-    c = result.total_effective_mm / args.precipitation if args.precipitation > 0 else 0
-
-    print(f"SCS-CN Runoff Calculation")
-    print(f"{'─' * 40}")
-    print(f"  Input:")
-    print(f"    Precipitation (P):     {args.precipitation:.2f} mm")
-    print(f"    Curve Number (CN-II):  {args.cn}")
-    print(f"    AMC:                   {amc.name} ({amc.value})")
-    print(f"    Ia coefficient:        {args.ia}")
-    print(f"{'─' * 40}")
-    print(f"  Results:")
-    print(f"    Adjusted CN:           {result.cn_adjusted}")
-    print(f"    Max retention (S):     {result.retention_mm:.2f} mm")
-    print(f"    Initial abstraction:   {result.initial_abstraction_mm:.2f} mm")
-    print(f"    Effective precip (Pe): {result.total_effective_mm:.2f} mm")
-    print(f"    Runoff coefficient:    {c:.3f}")
-    print(f"{'─' * 40}")
-
     # Summary
     if args.precipitation > result.initial_abstraction_mm:
-        print(f"\n  P > Ia: Runoff occurs")
+        summary = "  P > Ia: Runoff occurs"
     else:
-        print(f"\n  P <= Ia: No runoff (all precipitation abstracted)")
+        summary = "  P <= Ia: No runoff (all precipitation abstracted)"
+
+    sys.stdout.write(
+        _SCS_OUT_TMPL
+        % (
+            args.precipitation,
+            args.cn,
+            amc.name,
+            amc.value,
+            args.ia,
+            result.cn_adjusted,
+            result.retention_mm,
+            result.initial_abstraction_mm,
+            result.total_effective_mm,
+            result.runoff_coefficient,
+            summary,
+        )
+    )
+
+    return 0
+
+
+def _run_scs_series(scs: "SCSCN", amc: "AMC", path: str) -> int:
+    """Compute and print the effective precipitation series for a hyetograph."""
+    import numpy as np
+
+    precipitation = np.loadtxt(path, dtype=np.float64, usecols=-1, ndmin=1)
+    result = scs.effective_precipitation(precipitation, amc=amc)
+
+    table = np.column_stack(
+        (np.arange(1, precipitation.size + 1), precipitation, result.effective_mm)
+    )
+    buffer = io.StringIO()
+    np.savetxt(
+        buffer,
+        table,
+        fmt=("%d", "%.3f", "%.3f"),
+        delimiter=",",
+        header="step,precipitation_mm,effective_mm",
+        comments="",
+    )
+    sys.stdout.write(buffer.getvalue())
 
     return 0
@@ -1,17 +1,161 @@
 """CLI command for concentration time calculation."""
 
 import argparse
-
-from hydrolog.time import ConcentrationTime
+import sys
+from functools import partial
+from typing import Any, Callable, Final
+
+# Table separators
+_SEP35: Final[str] = "─" * 35
+
+# Result footer shared by all methods (filled with %-formatting)
+_TC_RESULT_TMPL: Final[str] = f"{_SEP35}\n  Tc = %.1f min (%.2f h)\n"
+
+# Report body for 'tc kerby-kirpich', followed by _TC_RESULT_TMPL
+_KERBY_KIRPICH_TMPL: Final[str] = (
+    "Kerby-Kirpich Time of Concentration\n"
+    f"{_SEP35}\n"
+    "  Overland flow:\n"
+    "    Length:      %.2f km\n"
+    "    Slope:       %.4f m/m\n"
+    "    Retardance:  %.2f\n"
+    "    t_overland = %.1f min\n"
+    "  Channel flow:\n"
+    "    Length:      %.2f km\n"
+    "    Slope:       %.4f m/m\n"
+    "    t_channel  = %.1f min\n"
+)
+
+# Output field: (label, ConcentrationTime kwarg, argparse dest, format spec, unit)
+_TcField = tuple[str, str, str, str, str]
+
+# Single-formula methods: ConcentrationTime method -> (title, fields)
+_TC_SPEC: Final[dict[str, tuple[str, tuple[_TcField, ...]]]] = {
+    "kirpich": (
+        "Kirpich",
+        (
+            ("Channel length:  ", "length_km", "length", ".2f", " km"),
+            ("Channel slope:   ", "slope_m_per_m", "slope", ".4f", " m/m"),
+        ),
+    ),
+    "nrcs": (
+        "NRCS",
+        (
+            ("Flow path length: ", "length_km", "length", ".2f", " km"),
+            ("Watershed slope:  ", "slope_m_per_m", "slope", ".4f", " m/m"),
+            ("Curve Number:     ", "cn", "cn", "", ""),
+        ),
+    ),
+    "giandotti": (
+        "Giandotti",
+        (
+            ("Watershed area:      ", "area_km2", "area", ".2f", " km²"),
+            ("Main channel length: ", "length_km", "length", ".2f", " km"),
+            ("Mean elevation:      ", "elevation_diff_m", "elevation", ".1f", " m"),
+        ),
+    ),
+    "faa": (
+        "FAA",
+        (
+            ("Overland flow length: ", "length_km", "length", ".2f", " km"),
+            ("Overland slope:       ", "slope_m_per_m", "slope", ".4f", " m/m"),
+            ("Runoff coefficient:   ", "runoff_coeff", "runoff_coeff", ".2f", ""),
+        ),
+    ),
+    "kerby": (
+        "Kerby",
+        (
+            ("Overland flow length: ", "length_km", "length", ".2f", " km"),
+            ("Overland slope:       ", "slope_m_per_m", "slope", ".4f", " m/m"),
+            ("Retardance (N):       ", "retardance", "retardance", ".2f", ""),
+        ),
+    ),
+}
+
+# Method input: (flags, metavar, help, type); every input is required
+_ArgSpec = tuple[tuple[str, ...], str, str, Callable[[str], Any]]
+
+_OVERLAND_ARGS: Final[tuple[_ArgSpec, ...]] = (
+    (("-L", "--length"), "KM", "Overland flow length [km]", float),
+    (("-S", "--slope"), "M/M", "Average overland slope [m/m]", float),
+)
+_RETARDANCE_ARG: Final[_ArgSpec] = (
+    ("-N", "--retardance"),
+    "N",
+    "Kerby retardance roughness coefficient (0.02-0.80)",
+    float,
+)
+
+# Method subcommand -> (help, description, inputs), in help display order
+_METHODS: Final[dict[str, tuple[str, str, tuple[_ArgSpec, ...]]]] = {
+    "kirpich": (
+        "Kirpich formula",
+        "Calculate Tc using Kirpich formula for small agricultural watersheds.",
+        (
+            (("-L", "--length"), "KM", "Channel length [km]", float),
+            (("-S", "--slope"), "M/M", "Average channel slope [m/m]", float),
+        ),
+    ),
+    "nrcs": (
+        "NRCS equation",
+        "Calculate Tc using NRCS equation (requires Curve Number).",
+        (
+            (("-L", "--length"), "KM", "Flow path length [km]", float),
+            (("-S", "--slope"), "M/M", "Average watershed slope [m/m]", float),
+            (("-CN", "--cn"), "CN", "Curve Number (1-100)", int),
+        ),
+    ),
+    "giandotti": (
+        "Giandotti formula",
+        "Calculate Tc using Giandotti formula for larger watersheds.",
+        (
+            (("-A", "--area"), "KM2", "Watershed area [km²]", float),
+            (("-L", "--length"), "KM", "Main channel length [km]", float),
+            (("-H", "--elevation"), "M", "Mean elevation above outlet [m]", float),
+        ),
+    ),
+    "faa": (
+        "FAA method",
+        "Calculate Tc using FAA method for overland flow.",
+        (
+            *_OVERLAND_ARGS,
+            (
+                ("-C", "--runoff-coeff"),
+                "C",
+                "Rational method runoff coefficient (0-1)",
+                float,
+            ),
+        ),
+    ),
+    "kerby": (
+        "Kerby formula",
+        "Calculate Tc using Kerby formula for shallow overland flow.",
+        (*_OVERLAND_ARGS, _RETARDANCE_ARG),
+    ),
+    "kerby-kirpich": (
+        "Kerby-Kirpich composite method",
+        "Calculate Tc using Kerby-Kirpich composite method "
+        "(overland + channel flow).",
+        (
+            (("-OL", "--ov-length"), "KM", "Overland flow length [km]", float),
+            (("-OS", "--ov-slope"), "M/M", "Overland slope [m/m]", float),
+            _RETARDANCE_ARG,
+            (("-CL", "--ch-length"), "KM", "Channel length [km]", float),
+            (("-CS", "--ch-slope"), "M/M", "Channel slope [m/m]", float),
+        ),
+    ),
+}
 
 
 def register_parser(subparsers: argparse._SubParsersAction) -> None:
-    """Register the 'tc' command parser."""
+    """Register the 'tc' command parser (no-op if already registered)."""
+    if "tc" in subparsers.choices:
+        return
+
     parser = subparsers.add_parser(
         "tc",
         help="Calculate time of concentration",
         description="Calculate watershed time of concentration using various methods.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Methods:
   kirpich        Kirpich formula (small agricultural watersheds)
@@ -39,208 +183,18 @@ Examples:
         metavar="<method>",
     )
 
-    # Kirpich method
-    kirpich = method_parsers.add_parser(
-        "kirpich",
-        help="Kirpich formula",
-        description="Calculate Tc using Kirpich formula for small agricultural watersheds.",
-    )
-    kirpich.add_argument(
-        "-L",
-        "--length",
-        type=float,
-        required=True,
-        metavar="KM",
-        help="Channel length [km]",
-    )
-    kirpich.add_argument(
-        "-S",
-        "--slope",
-        type=float,
-        required=True,
-        metavar="M/M",
-        help="Average channel slope [m/m]",
-    )
-    kirpich.set_defaults(func=_run_kirpich)
-
-    # NRCS method
-    nrcs = method_parsers.add_parser(
-        "nrcs",
-        help="NRCS equation",
-        description="Calculate Tc using NRCS equation (requires Curve Number).",
-    )
-    nrcs.add_argument(
-        "-L",
-        "--length",
-        type=float,
-        required=True,
-        metavar="KM",
-        help="Flow path length [km]",
-    )
-    nrcs.add_argument(
-        "-S",
-        "--slope",
-        type=float,
-        required=True,
-        metavar="M/M",
-        help="Average watershed slope [m/m]",
-    )
-    nrcs.add_argument(
-        "-CN",
-        "--cn",
-        type=int,
-        required=True,
-        metavar="CN",
-        help="Curve Number (1-100)",
-    )
-    nrcs.set_defaults(func=_run_nrcs)
-
-    # Giandotti method
-    giandotti = method_parsers.add_parser(
-        "giandotti",
-        help="Giandotti formula",
-        description="Calculate Tc using Giandotti formula for larger watersheds.",
-    )
-    giandotti.add_argument(
-        "-A",
-        "--area",
-        type=float,
-        required=True,
-        metavar="KM2",
-        help="Watershed area [km²]",
-    )
-    giandotti.add_argument(
-        "-L",
-        "--length",
-        type=float,
-        required=True,
-        metavar="KM",
-        help="Main channel length [km]",
-    )
-    giandotti.add_argument(
-        "-H",
-        "--elevation",
-        type=float,
-        required=True,
-        metavar="M",
-        help="Mean elevation above outlet [m]",
-    )
-    giandotti.set_defaults(func=_run_giandotti)
-
-    # FAA method
-    faa = method_parsers.add_parser(
-        "faa",
-        help="FAA method",
-        description="Calculate Tc using FAA method for overland flow.",
-    )
-    faa.add_argument(
-        "-L",
-        "--length",
-        type=float,
-        required=True,
-        metavar="KM",
-        help="Overland flow length [km]",
-    )
-    faa.add_argument(
-        "-S",
-        "--slope",
-        type=float,
-        required=True,
-        metavar="M/M",
-        help="Average overland slope [m/m]",
-    )
-    faa.add_argument(
-        "-C",
-        "--runoff-coeff",
-        type=float,
-        required=True,
-        metavar="C",
-        help="Rational method runoff coefficient (0-1)",
-    )
-    faa.set_defaults(func=_run_faa)
-
-    # Kerby method
-    kerby = method_parsers.add_parser(
-        "kerby",
-        help="Kerby formula",
-        description="Calculate Tc using Kerby formula for shallow overland flow.",
-    )
-    kerby.add_argument(
-        "-L",
-        "--length",
-        type=float,
-        required=True,
-        metavar="KM",
-        help="Overland flow length [km]",
-    )
-    kerby.add_argument(
-        "-S",
-        "--slope",
-        type=float,
-        required=True,
-        metavar="M/M",
-        help="Average overland slope [m/m]",
-    )
-    kerby.add_argument(
-        "-N",
-        "--retardance",
-        type=float,
-        required=True,
-        metavar="N",
-        help="Kerby retardance roughness coefficient (0.02-0.80)",
-    )
-    kerby.set_defaults(func=_run_kerby)
-
-    # Kerby-Kirpich composite method
-    kerby_kirpich = method_parsers.add_parser(
-        "kerby-kirpich",
-        help="Kerby-Kirpich composite method",
-        description=(
-            "Calculate Tc using Kerby-Kirpich composite method "
-            "(overland + channel flow)."
-        ),
-    )
-    kerby_kirpich.add_argument(
-        "-OL",
-        "--ov-length",
-        type=float,
-        required=True,
-        metavar="KM",
-        help="Overland flow length [km]",
-    )
-    kerby_kirpich.add_argument(
-        "-OS",
-        "--ov-slope",
-        type=float,
-        required=True,
-        metavar="M/M",
-        help="Overland slope [m/m]",
-    )
-    kerby_kirpich.add_argument(
-        "-N",
-        "--retardance",
-        type=float,
-        required=True,
-        metavar="N",
-        help="Kerby retardance roughness coefficient (0.02-0.80)",
-    )
-    kerby_kirpich.add_argument(
-        "-CL",
-        "--ch-length",
-        type=float,
-        required=True,
-        metavar="KM",
-        help="Channel length [km]",
-    )
-    kerby_kirpich.add_argument(
-        "-CS",
-        "--ch-slope",
-        type=float,
-        required=True,
-        metavar="M/M",
-        help="Channel slope [m/m]",
-    )
-    kerby_kirpich.set_defaults(func=_run_kerby_kirpich)
+    for name, (help_text, description, arguments) in _METHODS.items():
+        method = method_parsers.add_parser(
+            name, help=help_text, description=description
+        )
+        for flags, metavar, arg_help, arg_type in arguments:
+            method.add_argument(
+                *flags, type=arg_type, required=True, metavar=metavar, help=arg_help
+            )
+        if name in _TC_SPEC:
+            method.set_defaults(func=partial(_run_tc, name))
+        else:
+            method.set_defaults(func=_run_kerby_kirpich)
 
     parser.set_defaults(func=_show_help, parser=parser)
 
@@ -251,101 +205,31 @@ def _show_help(args: argparse.Namespace) -> int:
     return 0
 
 
-def _run_kirpich(args: argparse.Namespace) -> int:
-    """Execute Kirpich calculation."""
-    tc = ConcentrationTime.kirpich(
-        length_km=args.length,
-        slope_m_per_m=args.slope,
-    )
-
-    print("Kirpich Time of Concentration")
-    print("─" * 35)
-    print(f"  Channel length:  {args.length:.2f} km")
-    print(f"  Channel slope:   {args.slope:.4f} m/m")
-    print("─" * 35)
-    print(f"  Tc = {tc:.1f} min ({tc / 60:.2f} h)")
-
-    return 0
-
-
-def _run_nrcs(args: argparse.Namespace) -> int:
-    """Execute NRCS calculation."""
-    tc = ConcentrationTime.nrcs(
-        length_km=args.length,
-        slope_m_per_m=args.slope,
-        cn=args.cn,
-    )
-
-    print("NRCS Time of Concentration")
-    print("─" * 35)
-    print(f"  Flow path length: {args.length:.2f} km")
-    print(f"  Watershed slope:  {args.slope:.4f} m/m")
-    print(f"  Curve Number:     {args.cn}")
-    print("─" * 35)
-    print(f"  Tc = {tc:.1f} min ({tc / 60:.2f} h)")
-
-    return 0
-
-
-def _run_giandotti(args: argparse.Namespace) -> int:
-    """Execute Giandotti calculation."""
-    tc = ConcentrationTime.giandotti(
-        area_km2=args.area,
-        length_km=args.length,
-        elevation_diff_m=args.elevation,
-    )
-
-    print("Giandotti Time of Concentration")
-    print("─" * 35)
-    print(f"  Watershed area:      {args.area:.2f} km²")
-    print(f"  Main channel length: {args.length:.2f} km")
-    print(f"  Mean elevation:      {args.elevation:.1f} m")
-    print("─" * 35)
-    print(f"  Tc = {tc:.1f} min ({tc / 60:.2f} h)")
-
-    return 0
-
+def _run_tc(method: str, args: argparse.Namespace) -> int:
+    """Execute a single-formula Tc calculation described in _TC_SPEC."""
+    from hydrolog.time import ConcentrationTime
 
-def _run_faa(args: argparse.Namespace) -> int:
-    """Execute FAA calculation."""
-    tc = ConcentrationTime.faa(
-        length_km=args.length,
-        slope_m_per_m=args.slope,
-        runoff_coeff=args.runoff_coeff,
+    title, fields = _TC_SPEC[method]
+    values = [getattr(args, dest) for _, _, dest, _, _ in fields]
+    tc = getattr(ConcentrationTime, method)(
+        **{field[1]: value for field, value in zip(fields, values)}
     )
 
-    print("FAA Time of Concentration")
-    print("─" * 35)
-    print(f"  Overland flow length: {args.length:.2f} km")
-    print(f"  Overland slope:       {args.slope:.4f} m/m")
-    print(f"  Runoff coefficient:   {args.runoff_coeff:.2f}")
-    print("─" * 35)
-    print(f"  Tc = {tc:.1f} min ({tc / 60:.2f} h)")
-
-    return 0
-
-
-def _run_kerby(args: argparse.Namespace) -> int:
-    """Execute Kerby calculation."""
-    tc = ConcentrationTime.kerby(
-        length_km=args.length,
-        slope_m_per_m=args.slope,
-        retardance=args.retardance,
+    lines = [f"{title} Time of Concentration", _SEP35]
+    lines.extend(
+        f"  {label}{value:{spec}}{unit}"
+        for (label, _, _, spec, unit), value in zip(fields, values)
     )
-
-    print("Kerby Time of Concentration")
-    print("─" * 35)
-    print(f"  Overland flow length: {args.length:.2f} km")
-    print(f"  Overland slope:       {args.slope:.4f} m/m")
-    print(f"  Retardance (N):       {args.retardance:.2f}")
-    print("─" * 35)
-    print(f"  Tc = {tc:.1f} min ({tc / 60:.2f} h)")
+    lines.append(_TC_RESULT_TMPL % (tc, tc / 60))
+    sys.stdout.write("\n".join(lines))
 
     return 0
 
 
 def _run_kerby_kirpich(args: argparse.Namespace) -> int:
     """Execute Kerby-Kirpich composite calculation."""
+    from hydrolog.time import ConcentrationTime
+
     # Compute individual components for display
     t_overland = ConcentrationTime.kerby(
         length_km=args.ov_length,
@@ -363,18 +247,18 @@ def _run_kerby_kirpich(args: argparse.Namespace) -> int:
 
     t_channel = tc - t_overland
 
-    print("Kerby-Kirpich Time of Concentration")
-    print("─" * 35)
-    print("  Overland flow:")
-    print(f"    Length:      {args.ov_length:.2f} km")
-    print(f"    Slope:       {args.ov_slope:.4f} m/m")
-    print(f"    Retardance:  {args.retardance:.2f}")
-    print(f"    t_overland = {t_overland:.1f} min")
-    print("  Channel flow:")
-    print(f"    Length:      {args.ch_length:.2f} km")
-    print(f"    Slope:       {args.ch_slope:.4f} m/m")
-    print(f"    t_channel  = {t_channel:.1f} min")
-    print("─" * 35)
-    print(f"  Tc = {tc:.1f} min ({tc / 60:.2f} h)")
+    sys.stdout.write(
+        _KERBY_KIRPICH_TMPL
+        % (
+            args.ov_length,
+            args.ov_slope,
+            args.retardance,
+            t_overland,
+            args.ch_length,
+            args.ch_slope,
+            t_channel,
+        )
+        + _TC_RESULT_TMPL % (tc, tc / 60)
+    )
 
     return 0
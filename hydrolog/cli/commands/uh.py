@@ -1,18 +1,107 @@
 """CLI command for unit hydrograph generation."""
 
 import argparse
+import io
+import re
 import sys
+from typing import TYPE_CHECKING, Final, Optional
 
-from hydrolog.runoff import ClarkIUH, NashIUH, SCSUnitHydrograph, SnyderUH
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from hydrolog.runoff import UnitHydrographBatchResult
+
+# Table separators
+_SEP26: Final[str] = "─" * 26
+_SEP40: Final[str] = "─" * 40
+
+# Characters escaped in --json output
+_NON_ASCII: Final[re.Pattern[str]] = re.compile(r"[^\x00-\x7f]")
+
+
+def _parse_float_list(value: str) -> list[float]:
+    """Parse a comma-separated list of numbers (e.g. '45,60.5,120')."""
+    try:
+        return [float(item) for item in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected comma-separated numbers, got {value!r}"
+        ) from None
+
+
+def _require(args: argparse.Namespace, **options: str) -> None:
+    """Report a usage error if any option (dest=flag) is missing.
+
+    These options are only required outside catalogue mode, so argparse
+    cannot enforce them itself.
+    """
+    missing = [flag for dest, flag in options.items() if getattr(args, dest) is None]
+    if missing:
+        args.parser.error(f"{', '.join(missing)} required unless --input-csv is given")
+
+
+def _reject_in_catalogue(args: argparse.Namespace, **options: str) -> None:
+    """Report a usage error if a per-watershed option (dest=flag) is given.
+
+    In catalogue mode these values come from the --input-csv columns, so a
+    command-line value would otherwise be silently ignored.
+    """
+    given = [flag for dest, flag in options.items() if getattr(args, dest) is not None]
+    if given:
+        args.parser.error(
+            f"{', '.join(given)} cannot be used with --input-csv "
+            "(taken from the CSV columns)"
+        )
+
+
+def _check_output_flags(
+    args: argparse.Namespace, grouped: bool, grouped_flags: str
+) -> None:
+    """Reject output flags that the selected mode would silently ignore.
+
+    Batch and catalogue output is always CSV (so --csv is redundant but
+    honoured), while --output-csv only applies to that CSV.
+    """
+    if grouped and args.json:
+        args.parser.error(f"--json cannot be used with {grouped_flags}")
+    if not grouped and args.output_csv is not None:
+        args.parser.error(f"--output-csv requires {grouped_flags}")
+
+
+def _read_catalogue(path: str, required: tuple[str, ...]) -> "np.ndarray":
+    """Read a watershed catalogue CSV (header row, one watershed per row)."""
+    import numpy as np
+
+    from hydrolog.exceptions import InvalidParameterError
+
+    try:
+        table = np.genfromtxt(
+            path, delimiter=",", names=True, dtype=np.float64, ndmin=1
+        )
+    except IndexError:
+        # An empty file has no header line to take the names from
+        table = np.empty(0)
+    # Without a header there are no field names: every column is missing
+    names = table.dtype.names or ()
+    missing = [name for name in required if name not in names]
+    if missing:
+        raise InvalidParameterError(
+            f"{path}: missing column(s) {', '.join(missing)} "
+            f"(expected header with {', '.join(required)})"
+        )
+    return table
 
 
 def register_parser(subparsers: argparse._SubParsersAction) -> None:
-    """Register the 'uh' command parser."""
+    """Register the 'uh' command parser (no-op if already registered)."""
+    if "uh" in subparsers.choices:
+        return
+
     parser = subparsers.add_parser(
         "uh",
         help="Generate unit hydrograph",
         description="Generate unit hydrograph using various methods.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Methods:
   scs     SCS dimensionless unit hydrograph
@@ -25,10 +114,26 @@ Examples:
   hydrolog uh nash --area 45 --n 3 --k 30 --timestep 5
   hydrolog uh clark --area 45 --tc 60 --r 30 --timestep 5
   hydrolog uh snyder --area 100 --L 15 --Lc 8 --timestep 30
+  hydrolog uh scs --area-list 12,45,80 --tc-list 40,90,150 --timestep 5
+  hydrolog uh nash --input-csv catchments.csv --output-csv uh.csv
 
 Output options:
   --csv    Output as CSV (time, discharge)
   --json   Output as JSON
+
+Batch mode (scs):
+  --area-list / --tc-list compute many hydrographs in one call (a single
+  value is reused for every watershed); output is CSV with one column per
+  watershed.
+
+Catalogue mode (scs, nash):
+  --input-csv reads one watershed per row from a CSV file with a header
+  naming the parameters (scs: area,tc; nash: area,n,k and optionally
+  duration) and computes all of them in one vectorized call. Options for
+  parameters read from the CSV are rejected.
+  --output-csv writes the batch CSV to a file instead of stdout.
+  Batch and catalogue output is always CSV (--json is rejected), and
+  --output-csv is only accepted in these modes.
 """,
     )
 
@@ -41,15 +146,38 @@ Output options:
     )
 
     # Common arguments function
-    def add_common_args(p: argparse.ArgumentParser) -> None:
-        p.add_argument(
+    def add_common_args(
+        p: argparse.ArgumentParser, batch: bool = False, catalogue: bool = False
+    ) -> None:
+        grouped = batch or catalogue
+        area = p.add_mutually_exclusive_group(required=True) if grouped else p
+        area.add_argument(
             "-A",
             "--area",
             type=float,
-            required=True,
+            required=not grouped,
             metavar="KM2",
             help="Watershed area [km²]",
         )
+        if batch:
+            area.add_argument(
+                "--area-list",
+                type=_parse_float_list,
+                metavar="KM2,...",
+                help="Comma-separated watershed areas [km²] (batch mode)",
+            )
+        if catalogue:
+            area.add_argument(
+                "--input-csv",
+                metavar="PATH",
+                help="CSV file with one watershed per row (catalogue mode)",
+            )
+        if grouped:
+            p.add_argument(
+                "--output-csv",
+                metavar="PATH",
+                help="Write batch CSV to a file instead of stdout (batch mode only)",
+            )
         p.add_argument(
             "-dt",
             "--timestep",
@@ -83,16 +211,23 @@ Output options:
         help="SCS dimensionless UH",
         description="Generate SCS (NRCS) dimensionless unit hydrograph.",
     )
-    add_common_args(scs)
-    scs.add_argument(
+    add_common_args(scs, batch=True, catalogue=True)
+    # Required unless --input-csv is given (checked in _run_scs)
+    scs_tc = scs.add_mutually_exclusive_group()
+    scs_tc.add_argument(
         "-Tc",
         "--tc",
         type=float,
-        required=True,
         metavar="MIN",
         help="Time of concentration [min]",
     )
-    scs.set_defaults(func=_run_scs)
+    scs_tc.add_argument(
+        "--tc-list",
+        type=_parse_float_list,
+        metavar="MIN,...",
+        help="Comma-separated times of concentration [min] (batch mode)",
+    )
+    scs.set_defaults(func=_run_scs, parser=scs)
 
     # Nash method
     nash = method_parsers.add_parser(
@@ -100,12 +235,12 @@ Output options:
         help="Nash cascade IUH",
         description="Generate Nash cascade unit hydrograph.",
     )
-    add_common_args(nash)
+    add_common_args(nash, catalogue=True)
+    # --n and --k are required unless --input-csv is given (checked in _run_nash)
     nash.add_argument(
         "-n",
         "--n",
         type=float,
-        required=True,
         metavar="N",
         help="Number of reservoirs (shape parameter)",
     )
@@ -113,11 +248,10 @@ Output options:
         "-k",
         "--k",
         type=float,
-        required=True,
         metavar="MIN",
         help="Storage constant K [min]",
     )
-    nash.set_defaults(func=_run_nash)
+    nash.set_defaults(func=_run_nash, parser=nash)
 
     # Clark method
     clark = method_parsers.add_parser(
@@ -192,16 +326,51 @@ def _show_help(args: argparse.Namespace) -> int:
     return 0
 
 
+def _peak(ordinates: "NDArray[np.float64]") -> tuple[int, float]:
+    """Return index and value of the (first) peak ordinate."""
+    peak_idx = int(ordinates.argmax())
+    return peak_idx, float(ordinates[peak_idx])
+
+
+def _dumps_json(data: dict) -> str:
+    """Serialize to 2-space indented, ASCII-only JSON, using orjson when installed.
+
+    NumPy arrays are written straight from their buffers by orjson; the
+    stdlib fallback converts them with ``tolist()``. orjson always emits
+    UTF-8, so non-ASCII characters (``km²``, ``m³`` in the parameter names)
+    are escaped afterwards to keep the stdlib's ``\\uXXXX`` output.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(data, indent=2, default=lambda a: a.tolist())
+
+    text = orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+    if text.isascii():
+        return text
+    # Non-ASCII characters only occur inside JSON strings, where the
+    # stdlib escape (with surrogate pairs past the BMP) is valid as is
+    import json
+
+    return _NON_ASCII.sub(lambda match: json.dumps(match.group())[1:-1], text)
+
+
 def _format_output(
-    times: list,
-    ordinates: list,
+    times: "NDArray[np.float64]",
+    ordinates: "NDArray[np.float64]",
     method: str,
     params: dict,
+    peak_idx: int,
+    peak_val: float,
     csv: bool = False,
     json_out: bool = False,
 ) -> str:
-    """Format output based on requested format."""
-    import json
+    """Format output based on requested format (peak precomputed by _peak)."""
+    import numpy as np
 
     if json_out:
         output = {
@@ -212,62 +381,92 @@ def _format_output(
                 "ordinates_m3s_per_mm": ordinates,
             },
         }
-        return json.dumps(output, indent=2)
+        return _dumps_json(output)
 
     if csv:
-        lines = ["time_min,discharge_m3s_per_mm"]
-        for t, q in zip(times, ordinates):
-            lines.append(f"{t:.1f},{q:.4f}")
-        return "\n".join(lines)
+        buffer = io.StringIO()
+        np.savetxt(
+            buffer,
+            np.column_stack((times, ordinates)),
+            fmt=("%.1f", "%.4f"),
+            delimiter=",",
+            header="time_min,discharge_m3s_per_mm",
+            comments="",
+        )
+        # Drop savetxt's final newline; the caller terminates the output
+        return buffer.getvalue()[:-1]
 
     # Default: table format
-    lines = [
-        f"Unit Hydrograph ({method})",
-        "─" * 40,
-    ]
+    n = len(times)
+
+    # Determine which indices to show: first 5, around peak, last 3
+    # (np.unique sorts and de-duplicates in one C-level pass)
+    show_indices = np.unique(
+        np.concatenate(
+            (
+                np.arange(min(5, n)),
+                np.arange(max(0, peak_idx - 2), min(n, peak_idx + 3)),
+                np.arange(max(0, n - 3), n),
+            )
+        )
+    )
+    n_gaps = int(np.count_nonzero(np.diff(show_indices) > 1))
+
+    # Preallocate: 2 title rows + params + 3 header rows, data rows with
+    # "..." gap rows, 3 footer rows
+    lines: list[str] = [""] * (8 + len(params) + show_indices.size + n_gaps)
+    lines[0] = f"Unit Hydrograph ({method})"
+    lines[1] = _SEP40
+    row = 2
     for key, value in params.items():
         if isinstance(value, float):
-            lines.append(f"  {key}: {value:.2f}")
+            lines[row] = f"  {key}: {value:.2f}"
         else:
-            lines.append(f"  {key}: {value}")
-    lines.append("─" * 40)
-    lines.append(f"  {'Time [min]':<12} {'Q [m³/s/mm]':<12}")
-    lines.append(f"  {'─' * 26}")
-
-    # Show first 10, peak area, and last 5
-    peak_idx = ordinates.index(max(ordinates))
-    n = len(times)
+            lines[row] = f"  {key}: {value}"
+        row += 1
+    lines[row] = _SEP40
+    lines[row + 1] = f"  {'Time [min]':<12} {'Q [m³/s/mm]':<12}"
+    lines[row + 2] = f"  {_SEP26}"
+    row += 3
 
-    # Determine which indices to show
-    show_indices = set()
-    # First 5
-    for i in range(min(5, n)):
-        show_indices.add(i)
-    # Around peak
-    for i in range(max(0, peak_idx - 2), min(n, peak_idx + 3)):
-        show_indices.add(i)
-    # Last 3
-    for i in range(max(0, n - 3), n):
-        show_indices.add(i)
-
-    sorted_indices = sorted(show_indices)
     prev_i = -1
-    for i in sorted_indices:
+    for i in show_indices.tolist():
         if prev_i >= 0 and i > prev_i + 1:
-            lines.append("  ...")
+            lines[row] = "  ..."
+            row += 1
         marker = " *" if i == peak_idx else ""
-        lines.append(f"  {times[i]:<12.1f} {ordinates[i]:<12.4f}{marker}")
+        lines[row] = f"  {times[i]:<12.1f} {ordinates[i]:<12.4f}{marker}"
+        row += 1
         prev_i = i
 
-    lines.append("─" * 40)
-    lines.append(f"  Peak: {max(ordinates):.4f} m³/s/mm at {times[peak_idx]:.1f} min")
-    lines.append(f"  (* marks peak)")
+    lines[row] = _SEP40
+    lines[row + 1] = f"  Peak: {peak_val:.4f} m³/s/mm at {times[peak_idx]:.1f} min"
+    lines[row + 2] = "  (* marks peak)"
 
     return "\n".join(lines)
 
 
 def _run_scs(args: argparse.Namespace) -> int:
     """Execute SCS unit hydrograph generation."""
+    from hydrolog.runoff import SCSUnitHydrograph
+
+    batch_mode = args.area_list is not None or args.tc_list is not None
+    _check_output_flags(
+        args,
+        grouped=batch_mode or args.input_csv is not None,
+        grouped_flags="--area-list/--tc-list or --input-csv",
+    )
+    if args.input_csv is not None:
+        _reject_in_catalogue(args, tc="--tc", tc_list="--tc-list")
+        table = _read_catalogue(args.input_csv, ("area", "tc"))
+        batch = SCSUnitHydrograph.generate_batch(
+            area_km2=table["area"], tc_min=table["tc"], timestep_min=args.timestep
+        )
+        return _write_batch_csv(batch, args.output_csv)
+    if batch_mode:
+        return _run_scs_batch(args)
+    _require(args, tc="--tc/--tc-list")
+
     uh = SCSUnitHydrograph(area_km2=args.area, tc_min=args.tc)
     result = uh.generate(timestep_min=args.timestep)
 
@@ -279,20 +478,70 @@ def _run_scs(args: argparse.Namespace) -> int:
         "Peak discharge [m³/s/mm]": result.peak_discharge_m3s,
     }
 
+    peak_idx, peak_val = _peak(result.ordinates_m3s)
     output = _format_output(
-        times=result.times_min.tolist(),
-        ordinates=result.ordinates_m3s.tolist(),
+        times=result.times_min,
+        ordinates=result.ordinates_m3s,
         method="SCS",
         params=params,
+        peak_idx=peak_idx,
+        peak_val=peak_val,
         csv=args.csv,
         json_out=args.json,
     )
-    print(output)
+    sys.stdout.write(output + "\n")
+    return 0
+
+
+def _run_scs_batch(args: argparse.Namespace) -> int:
+    """Generate SCS unit hydrographs for many watersheds and print them as CSV."""
+    from hydrolog.runoff import SCSUnitHydrograph
+
+    if args.tc_list is None:
+        _require(args, tc="--tc/--tc-list")
+    areas = args.area_list if args.area_list is not None else args.area
+    tcs = args.tc_list if args.tc_list is not None else args.tc
+    result = SCSUnitHydrograph.generate_batch(
+        area_km2=areas, tc_min=tcs, timestep_min=args.timestep
+    )
+    return _write_batch_csv(result, args.output_csv)
+
+
+def _write_batch_csv(
+    result: "UnitHydrographBatchResult", path: Optional[str] = None
+) -> int:
+    """Write a batch result as wide CSV (one column per watershed)."""
+    import numpy as np
+
+    n = result.n_hydrographs
+    buffer = io.StringIO()
+    np.savetxt(
+        buffer,
+        np.column_stack((result.times_min, result.ordinates_m3s.T)),
+        fmt=["%.1f"] + ["%.4f"] * n,
+        delimiter=",",
+        header="time_min," + ",".join(f"q{i}_m3s_per_mm" for i in range(1, n + 1)),
+        comments="",
+    )
+    if path is None:
+        sys.stdout.write(buffer.getvalue())
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(buffer.getvalue())
     return 0
 
 
 def _run_nash(args: argparse.Namespace) -> int:
     """Execute Nash unit hydrograph generation."""
+    from hydrolog.runoff import NashIUH
+
+    _check_output_flags(
+        args, grouped=args.input_csv is not None, grouped_flags="--input-csv"
+    )
+    if args.input_csv is not None:
+        return _run_nash_catalogue(args)
+    _require(args, n="--n", k="--k")
+
     iuh = NashIUH(n=args.n, k_min=args.k)
 
     duration = args.duration if args.duration else args.timestep
@@ -313,20 +562,46 @@ def _run_nash(args: argparse.Namespace) -> int:
         "Peak discharge [m³/s/mm]": result.peak_discharge_m3s,
     }
 
+    peak_idx, peak_val = _peak(result.ordinates_m3s)
     output = _format_output(
-        times=result.times_min.tolist(),
-        ordinates=result.ordinates_m3s.tolist(),
+        times=result.times_min,
+        ordinates=result.ordinates_m3s,
         method="Nash",
         params=params,
+        peak_idx=peak_idx,
+        peak_val=peak_val,
         csv=args.csv,
         json_out=args.json,
     )
-    print(output)
+    sys.stdout.write(output + "\n")
     return 0
 
 
+def _run_nash_catalogue(args: argparse.Namespace) -> int:
+    """Generate Nash unit hydrographs for every row of --input-csv."""
+    from hydrolog.runoff import NashIUH
+
+    _reject_in_catalogue(args, n="--n", k="--k")
+    table = _read_catalogue(args.input_csv, ("area", "n", "k"))
+    if "duration" in (table.dtype.names or ()):
+        _reject_in_catalogue(args, duration="--duration")
+        duration = table["duration"]
+    else:
+        duration = args.duration if args.duration else args.timestep
+    result = NashIUH.to_unit_hydrograph_batch(
+        n=table["n"],
+        k_min=table["k"],
+        area_km2=table["area"],
+        duration_min=duration,
+        timestep_min=args.timestep,
+    )
+    return _write_batch_csv(result, args.output_csv)
+
+
 def _run_clark(args: argparse.Namespace) -> int:
     """Execute Clark unit hydrograph generation."""
+    from hydrolog.runoff import ClarkIUH
+
     iuh = ClarkIUH(tc_min=args.tc, r_min=args.r)
 
     duration = args.duration if args.duration else args.timestep
@@ -347,20 +622,25 @@ def _run_clark(args: argparse.Namespace) -> int:
         "Peak discharge [m³/s/mm]": result.peak_discharge_m3s,
     }
 
+    peak_idx, peak_val = _peak(result.ordinates_m3s)
     output = _format_output(
-        times=result.times_min.tolist(),
-        ordinates=result.ordinates_m3s.tolist(),
+        times=result.times_min,
+        ordinates=result.ordinates_m3s,
         method="Clark",
         params=params,
+        peak_idx=peak_idx,
+        peak_val=peak_val,
         csv=args.csv,
         json_out=args.json,
     )
-    print(output)
+    sys.stdout.write(output + "\n")
     return 0
 
 
 def _run_snyder(args: argparse.Namespace) -> int:
     """Execute Snyder unit hydrograph generation."""
+    from hydrolog.runoff import SnyderUH
+
     uh = SnyderUH(
         area_km2=args.area,
         L_km=args.L,
@@ -388,13 +668,16 @@ def _run_snyder(args: argparse.Namespace) -> int:
         "Peak discharge [m³/s/mm]": result.peak_discharge_m3s,
     }
 
+    peak_idx, peak_val = _peak(result.ordinates_m3s)
     output = _format_output(
-        times=result.times_min.tolist(),
-        ordinates=result.ordinates_m3s.tolist(),
+        times=result.times_min,
+        ordinates=result.ordinates_m3s,
         method="Snyder",
         params=params,
+        peak_idx=peak_idx,
+        peak_val=peak_val,
         csv=args.csv,
         json_out=args.json,
     )
-    print(output)
+    sys.stdout.write(output + "\n")
     return 0
@@ -9,18 +9,38 @@ Provides command-line interface for hydrological calculations:
 
 import argparse
 import sys
-from typing import Optional, Sequence
+from functools import cache
+from typing import Any, Optional, Sequence
 
 from hydrolog import __version__
-from hydrolog.cli.commands import cn, scs, tc, uh
 
 
+class _HydrologParser(argparse.ArgumentParser):
+    """ArgumentParser that keeps description/epilog layout by default.
+
+    Subparsers inherit the parser class, so every command and method
+    parser shares the raw-description formatter without repeating it.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("formatter_class", argparse.RawDescriptionHelpFormatter)
+        super().__init__(*args, **kwargs)
+
+
+@cache
 def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser with subcommands."""
-    parser = argparse.ArgumentParser(
+    """Create the main argument parser with subcommands.
+
+    The parser tree is built once per process and reused by every
+    ``main()`` call. argparse parsers are not safe for concurrent
+    ``parse_args`` calls, so drive ``main(argv)`` from one thread.
+    """
+    # Imported here so that importing hydrolog.cli stays cheap
+    from hydrolog.cli.commands import cn, scs, tc, uh
+
+    parser = _HydrologParser(
         prog="hydrolog",
         description="Hydrolog - Python library for hydrological calculations",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   hydrolog tc kirpich --length 2.5 --slope 0.02
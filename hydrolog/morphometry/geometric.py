@@ -1,12 +1,21 @@
 """Geometric parameters and shape indicators for watershed analysis."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import chain
 import math
+from operator import itemgetter
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 from hydrolog.exceptions import InvalidParameterError
 
+# Extracts (area_km2, perimeter_km, length_km) from a dict in one call
+_get_apl = itemgetter("area_km2", "perimeter_km", "length_km")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ShapeIndicators:
     """
     Shape indicators for a watershed.
@@ -36,8 +45,113 @@ class ShapeIndicators:
     elongation_ratio: float
     lemniscate_ratio: float
 
+    @staticmethod
+    def from_arrays(
+        area_km2: ArrayLike,
+        perimeter_km: ArrayLike,
+        length_km: ArrayLike,
+    ) -> dict[str, NDArray[np.float64]]:
+        """
+        Calculate all shape indicators for many watersheds at once.
+
+        Vectorized counterpart of :meth:`WatershedGeometry.get_shape_indicators`
+        (same formulas, element-wise); inputs are broadcast against each other.
+
+        Parameters
+        ----------
+        area_km2 : ArrayLike
+            Watershed areas [km²]. Must be positive.
+        perimeter_km : ArrayLike
+            Watershed perimeters [km]. Must be positive.
+        length_km : ArrayLike
+            Watershed lengths [km]. Must be positive.
+
+        Returns
+        -------
+        dict[str, NDArray[np.float64]]
+            Indicator arrays keyed by the ShapeIndicators field names.
+
+        Raises
+        ------
+        InvalidParameterError
+            If any value is not positive.
+
+        Examples
+        --------
+        >>> indicators = ShapeIndicators.from_arrays(
+        ...     area_km2=[45.0, 12.0], perimeter_km=[32.0, 15.0], length_km=[12.0, 5.0]
+        ... )
+        >>> indicators["form_factor"]
+        array([0.3125, 0.48  ])
+        """
+        area = np.asarray(area_km2, dtype=np.float64)
+        perimeter = np.asarray(perimeter_km, dtype=np.float64)
+        length = np.asarray(length_km, dtype=np.float64)
+        for name, values in (
+            ("area_km2", area),
+            ("perimeter_km", perimeter),
+            ("length_km", length),
+        ):
+            if not np.all(values > 0):
+                raise InvalidParameterError(f"all {name} values must be positive")
+
+        # Same derivation from Cf and Cz as WatershedGeometry
+        cf = area / (length * length)
+        cz = perimeter / (2.0 * np.sqrt(math.pi * area))
+        return {
+            "form_factor": cf,
+            "compactness_coefficient": cz,
+            "circularity_ratio": 1.0 / (cz * cz),
+            "elongation_ratio": np.sqrt((4.0 / math.pi) * cf),
+            "lemniscate_ratio": 0.25 / cf,
+        }
+
+    @staticmethod
+    def from_records(
+        records: Iterable[Mapping[str, Any]],
+    ) -> dict[str, NDArray[np.float64]]:
+        """
+        Calculate shape indicators for a list of watershed dictionaries.
+
+        Each record needs the same keys as :meth:`WatershedGeometry.from_dict`
+        (extra keys are ignored). Values are packed into one (n, 3) array
+        and passed to :meth:`from_arrays`, without creating a
+        WatershedGeometry per record.
+
+        Parameters
+        ----------
+        records : Iterable[Mapping[str, Any]]
+            Watershed dictionaries (e.g. a JSON list from Hydrograf).
+
+        Returns
+        -------
+        dict[str, NDArray[np.float64]]
+            Indicator arrays keyed by the ShapeIndicators field names,
+            in record order.
+
+        Raises
+        ------
+        KeyError
+            If a record is missing a required key.
+        InvalidParameterError
+            If any value is not positive.
 
-@dataclass
+        Examples
+        --------
+        >>> records = [
+        ...     {"area_km2": 45.0, "perimeter_km": 32.0, "length_km": 12.0},
+        ...     {"area_km2": 12.0, "perimeter_km": 15.0, "length_km": 5.0},
+        ... ]
+        >>> ShapeIndicators.from_records(records)["lemniscate_ratio"]
+        array([0.8       , 0.52083333])
+        """
+        values = np.fromiter(
+            chain.from_iterable(map(_get_apl, records)), dtype=np.float64
+        ).reshape(-1, 3)
+        return ShapeIndicators.from_arrays(values[:, 0], values[:, 1], values[:, 2])
+
+
+@dataclass(slots=True, frozen=True)
 class GeometricParameters:
     """
     Basic geometric parameters of a watershed.
@@ -60,19 +174,28 @@ class GeometricParameters:
     width_km: float
 
 
+@dataclass(slots=True, frozen=True)
 class WatershedGeometry:
     """
     Calculate geometric parameters and shape indicators for a watershed.
 
+    Instances are immutable; all shape indicators are computed once at
+    construction from the form factor and the compactness coefficient.
+
     Parameters
     ----------
     area_km2 : float
-        Watershed area [km²].
+        Watershed area [km²]. Must be positive.
     perimeter_km : float
-        Watershed perimeter [km].
+        Watershed perimeter [km]. Must be positive.
     length_km : float
         Watershed length - the longest dimension from outlet
-        to the most distant point on the divide [km].
+        to the most distant point on the divide [km]. Must be positive.
+
+    Raises
+    ------
+    InvalidParameterError
+        If any parameter is not positive.
 
     Examples
     --------
@@ -91,6 +214,13 @@ class WatershedGeometry:
     >>> geom = WatershedGeometry.from_dict(data)
     """
 
+    area_km2: float
+    perimeter_km: float
+    length_km: float
+
+    # Shape indicators, derived once in __post_init__
+    _indicators: ShapeIndicators = field(init=False, repr=False, compare=False)
+
     @classmethod
     def from_dict(cls, data: dict) -> "WatershedGeometry":
         """
@@ -130,47 +260,37 @@ class WatershedGeometry:
         ...         "elevation_min_m": 150.0, "source": "Hydrograf"}
         >>> geom = WatershedGeometry.from_dict(data)
         """
-        return cls(
-            area_km2=data["area_km2"],
-            perimeter_km=data["perimeter_km"],
-            length_km=data["length_km"],
-        )
-
-    def __init__(
-        self,
-        area_km2: float,
-        perimeter_km: float,
-        length_km: float,
-    ) -> None:
-        """
-        Initialize watershed geometry calculator.
-
-        Parameters
-        ----------
-        area_km2 : float
-            Watershed area [km²]. Must be positive.
-        perimeter_km : float
-            Watershed perimeter [km]. Must be positive.
-        length_km : float
-            Watershed length [km]. Must be positive.
+        area_km2, perimeter_km, length_km = _get_apl(data)
+        return cls(area_km2, perimeter_km, length_km)
 
-        Raises
-        ------
-        InvalidParameterError
-            If any parameter is not positive.
-        """
-        if area_km2 <= 0:
-            raise InvalidParameterError(f"area_km2 must be positive, got {area_km2}")
-        if perimeter_km <= 0:
+    def __post_init__(self) -> None:
+        """Validate parameters and precompute the shape indicators."""
+        if self.area_km2 <= 0:
+            raise InvalidParameterError(
+                f"area_km2 must be positive, got {self.area_km2}"
+            )
+        if self.perimeter_km <= 0:
             raise InvalidParameterError(
-                f"perimeter_km must be positive, got {perimeter_km}"
+                f"perimeter_km must be positive, got {self.perimeter_km}"
+            )
+        if self.length_km <= 0:
+            raise InvalidParameterError(
+                f"length_km must be positive, got {self.length_km}"
             )
-        if length_km <= 0:
-            raise InvalidParameterError(f"length_km must be positive, got {length_km}")
 
-        self.area_km2 = area_km2
-        self.perimeter_km = perimeter_km
-        self.length_km = length_km
+        # All indicators follow from Cf = A/L² and Cz = P/(2·sqrt(πA)):
+        # Ck = 1/Cz², Ce = sqrt(4·Cf/π), Cl = 1/(4·Cf)
+        cf = self.area_km2 / (self.length_km * self.length_km)
+        cz = self.perimeter_km / (2.0 * math.sqrt(math.pi * self.area_km2))
+        indicators = ShapeIndicators(
+            form_factor=cf,
+            compactness_coefficient=cz,
+            circularity_ratio=1.0 / (cz * cz),
+            elongation_ratio=math.sqrt((4.0 / math.pi) * cf),
+            lemniscate_ratio=0.25 / cf,
+        )
+        # Frozen dataclass: bypass __setattr__ for the derived field
+        object.__setattr__(self, "_indicators", indicators)
 
     @property
     def width_km(self) -> float:
@@ -216,8 +336,7 @@ class WatershedGeometry:
         Higher form factors indicate higher peak flows
         for similar rainfall events.
         """
-        cf: float = self.area_km2 / (self.length_km**2)
-        return cf
+        return self._indicators.form_factor
 
     def compactness_coefficient(self) -> float:
         """
@@ -237,10 +356,7 @@ class WatershedGeometry:
         - Cz = 1.12: Square watershed
         - Cz > 1.5: Very elongated watershed
         """
-        # Circumference of a circle with area A: C = 2 * sqrt(π * A)
-        circle_circumference = 2.0 * math.sqrt(math.pi * self.area_km2)
-        cz: float = self.perimeter_km / circle_circumference
-        return cz
+        return self._indicators.compactness_coefficient
 
     def circularity_ratio(self) -> float:
         """
@@ -259,8 +375,7 @@ class WatershedGeometry:
         - Ck < 1.0: More elongated shape
         - Ck ≈ 0.785: Square watershed
         """
-        ck: float = (4.0 * math.pi * self.area_km2) / (self.perimeter_km**2)
-        return ck
+        return self._indicators.circularity_ratio
 
     def elongation_ratio(self) -> float:
         """
@@ -279,10 +394,7 @@ class WatershedGeometry:
         - Ce = 0.6-0.8: Elongated watershed
         - Ce < 0.6: Very elongated watershed
         """
-        # Diameter of circle with area A: D = 2 * sqrt(A/π)
-        circle_diameter = 2.0 * math.sqrt(self.area_km2 / math.pi)
-        ce: float = circle_diameter / self.length_km
-        return ce
+        return self._indicators.elongation_ratio
 
     def lemniscate_ratio(self) -> float:
         """
@@ -300,8 +412,7 @@ class WatershedGeometry:
         - Cl > 1.0: Elongated watershed
         - Cl < 0.785: Compact watershed
         """
-        cl: float = (self.length_km**2) / (4.0 * self.area_km2)
-        return cl
+        return self._indicators.lemniscate_ratio
 
     def get_shape_indicators(self) -> ShapeIndicators:
         """
@@ -310,7 +421,8 @@ class WatershedGeometry:
         Returns
         -------
         ShapeIndicators
-            Dataclass with all shape indicators.
+            Dataclass with all shape indicators (an immutable instance
+            shared by repeated calls).
 
         Examples
         --------
@@ -318,10 +430,4 @@ class WatershedGeometry:
         >>> indicators = geom.get_shape_indicators()
         >>> print(f"Compactness: {indicators.compactness_coefficient:.2f}")
         """
-        return ShapeIndicators(
-            form_factor=self.form_factor(),
-            compactness_coefficient=self.compactness_coefficient(),
-            circularity_ratio=self.circularity_ratio(),
-            elongation_ratio=self.elongation_ratio(),
-            lemniscate_ratio=self.lemniscate_ratio(),
-        )
+        return self._indicators
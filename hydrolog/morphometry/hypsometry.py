@@ -1,15 +1,42 @@
 """Hypsometric curve analysis for watershed characterization."""
 
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, DTypeLike, NDArray
 
 from hydrolog.exceptions import InvalidParameterError
+from hydrolog.morphometry.terrain import _weighted_sum
 
+# Weighted DEMs larger than this build the curve from a histogram (O(N), no
+# sort) unless the sorted profile already exists; equal-area DEMs always do
+_BUCKET_MIN_CELLS = 1_000_000
 
-@dataclass
+# Curve resolution used by generate_curve(), hypsometric_integral() and
+# analyze() unless told otherwise; its thresholds are kept once built
+_DEFAULT_N_POINTS = 101
+
+# Percentile batches at least this large are looked up in ascending order
+# (see elevation_at_percentiles)
+_ORDERED_QUERY_MIN = 256
+
+
+@lru_cache(maxsize=64)
+def _relative_heights(n_points: int) -> NDArray[np.float64]:
+    """Equally spaced relative heights h/H on [0, 1] (read-only, shared).
+
+    The curve thresholds are linspace(min, max), so their relative heights
+    do not depend on the DEM and are built once per resolution.
+    """
+    heights = np.linspace(0.0, 1.0, n_points)
+    heights.setflags(write=False)
+    return heights
+
+
+@dataclass(slots=True, frozen=True)
 class HypsometricResult:
     """
     Result of hypsometric curve analysis.
@@ -58,6 +85,10 @@ class HypsometricCurve:
     cell_areas : NDArray[np.float64], optional
         Area of each DEM cell [km²]. If not provided, assumes
         uniform cell sizes.
+    dtype : DTypeLike, optional
+        Floating-point type used to store the cell arrays, by default
+        float64. ``np.float32`` halves memory and bandwidth for very large
+        DEMs; totals and cumulative areas are still accumulated in float64.
 
     Notes
     -----
@@ -74,10 +105,26 @@ class HypsometricCurve:
     >>> print(f"Hypsometric integral: {result.hypsometric_integral:.3f}")
     """
 
+    __slots__ = (
+        "elevations",
+        "cell_areas",
+        "_uniform_areas",
+        "_integer_elevations",
+        "_level_areas",
+        "_total_area",
+        "_elevation_min",
+        "_elevation_max",
+        "_relief",
+        "_sorted",
+        "_default_thresholds",
+        "_curve_cache",
+    )
+
     def __init__(
         self,
         elevations: NDArray[np.float64],
         cell_areas: Optional[NDArray[np.float64]] = None,
+        dtype: DTypeLike = np.float64,
     ) -> None:
         """
         Initialize hypsometric curve analysis.
@@ -88,54 +135,131 @@ class HypsometricCurve:
             Array of elevation values from DEM [m a.s.l.].
         cell_areas : NDArray[np.float64], optional
             Area of each DEM cell [km²].
+        dtype : DTypeLike, optional
+            Storage type of the cell arrays (float64 or float32),
+            by default float64.
 
         Raises
         ------
         InvalidParameterError
-            If elevations array is empty or has invalid values.
+            If elevations array is empty or has invalid values, or dtype
+            is not a floating-point type.
         """
-        self.elevations = np.asarray(elevations, dtype=np.float64).flatten()
+        if not np.issubdtype(dtype, np.floating):
+            raise InvalidParameterError(
+                f"dtype must be a floating-point type, got {np.dtype(dtype)}"
+            )
+
+        # ravel() returns a view of contiguous input of the right dtype (no
+        # copy of a large DEM); the arrays are never modified in place
+        elevations = np.asarray(elevations)
+        self.elevations = np.ravel(elevations.astype(dtype, copy=False))
 
         if len(self.elevations) == 0:
             raise InvalidParameterError("elevations array cannot be empty")
 
         if cell_areas is not None:
-            self.cell_areas = np.asarray(cell_areas, dtype=np.float64).flatten()
+            self.cell_areas = np.ravel(np.asarray(cell_areas, dtype=dtype))
             if len(self.cell_areas) != len(self.elevations):
                 raise InvalidParameterError(
                     f"cell_areas length ({len(self.cell_areas)}) must match "
                     f"elevations length ({len(self.elevations)})"
                 )
-            if np.any(self.cell_areas <= 0):
+            # One min() reduction, no N-sized boolean temporary (size > 0 here)
+            if self.cell_areas.min() <= 0:
                 raise InvalidParameterError("all cell_areas must be positive")
         else:
             # Uniform cell areas
             self.cell_areas = np.ones_like(self.elevations)
+        self._uniform_areas = cell_areas is None
+        # Integer DEMs (e.g. centimetre rasters) can be binned per level
+        self._integer_elevations = np.issubdtype(elevations.dtype, np.integer)
+
+        # Summary reductions are accumulated in float64 whatever the dtype
+        self._total_area = float(np.sum(self.cell_areas, dtype=np.float64))
+
+        # Extremes are read by every curve; reduce the DEM once
+        self._elevation_min = float(np.min(self.elevations))
+        self._elevation_max = float(np.max(self.elevations))
+        self._relief = self._elevation_max - self._elevation_min
+
+        # Sorted elevation profile, built on first use by _sorted_profile()
+        self._sorted: Optional[
+            tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+        ] = None
+
+        # Area at or above each integer level, built on first use by
+        # _integer_level_areas()
+        self._level_areas: Optional[NDArray[np.float64]] = None
+
+        # Elevation thresholds of the default curve, built on first use
+        self._default_thresholds: Optional[NDArray[np.float64]] = None
 
-        self._total_area = float(np.sum(self.cell_areas))
+        # generate_curve() results keyed by n_points
+        self._curve_cache: dict[
+            int, tuple[NDArray[np.float64], NDArray[np.float64]]
+        ] = {}
 
     @property
     def elevation_min(self) -> float:
         """Minimum elevation [m a.s.l.]."""
-        return float(np.min(self.elevations))
+        return self._elevation_min
 
     @property
     def elevation_max(self) -> float:
         """Maximum elevation [m a.s.l.]."""
-        return float(np.max(self.elevations))
+        return self._elevation_max
 
     @property
     def relief(self) -> float:
         """Total relief H = max - min [m]."""
-        return self.elevation_max - self.elevation_min
+        return self._relief
 
     @property
     def total_area(self) -> float:
         """Total watershed area [km²]."""
         return self._total_area
 
+    def _sorted_profile(
+        self,
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Return the sorted elevation profile (computed once).
+
+        Returns
+        -------
+        tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]
+            Elevations sorted ascending, the area at or above each of them
+            (summed from the top, followed by a 0.0 sentinel for "past the
+            highest cell") and, in descending elevation order, the
+            cumulative percentage of area above.
+        """
+        if self._sorted is None:
+            # Peak memory is three N-sized arrays: the permutation, the sorted
+            # elevations and the area buffer (areas are gathered straight
+            # into it and summed in place; the permutation is dropped before
+            # the percentages are allocated)
+            order = np.argsort(self.elevations, kind="stable")
+            elev_sorted_asc = self.elevations[order]
+            area_above = np.empty(elev_sorted_asc.size + 1, dtype=np.float64)
+            area_above[-1] = 0.0
+            if self.cell_areas.dtype == np.float64:
+                # mode="clip" (indices are valid anyway) avoids the buffered
+                # copy np.take makes for out= in its default mode
+                np.take(self.cell_areas, order, out=area_above[:-1], mode="clip")
+            else:
+                area_above[:-1] = self.cell_areas[order]
+            del order
+            # Summed from the top, in place over the reversed positions
+            area_desc = area_above[-2::-1]
+            np.cumsum(area_desc, out=area_desc)
+            percent_above_desc = np.divide(area_desc, self._total_area)
+            percent_above_desc *= 100.0
+            self._sorted = (elev_sorted_asc, area_above, percent_above_desc)
+        return self._sorted
+
     def generate_curve(
-        self, n_points: int = 101
+        self, n_points: int = _DEFAULT_N_POINTS
     ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
         """
         Generate hypsometric curve data.
@@ -154,27 +278,143 @@ class HypsometricCurve:
         -----
         relative_height = (elevation - min) / relief
         relative_area = cumulative_area_above / total_area
+
+        The curve is computed once per ``n_points`` and cached; each call
+        returns fresh copies of the cached arrays.
         """
+        rel_heights, rel_areas = self._cached_curve(n_points)
+        return rel_heights.copy(), rel_areas.copy()
+
+    def _cached_curve(
+        self, n_points: int
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Return the (shared, cached) curve arrays for ``n_points``."""
         if n_points < 2:
             raise InvalidParameterError(f"n_points must be >= 2, got {n_points}")
 
-        # Create elevation thresholds
-        elev_thresholds = np.linspace(self.elevation_min, self.elevation_max, n_points)
+        cached = self._curve_cache.get(n_points)
+        if cached is None:
+            cached = self._compute_curve(n_points)
+            self._curve_cache[n_points] = cached
+        return cached
 
-        # Calculate cumulative area above each threshold
-        cumulative_areas = np.zeros(n_points, dtype=np.float64)
+    def _integer_level_areas(self) -> Optional[NDArray[np.float64]]:
+        """
+        Return the area at or above each integer elevation level.
 
-        for i, threshold in enumerate(elev_thresholds):
-            mask = self.elevations >= threshold
-            cumulative_areas[i] = np.sum(self.cell_areas[mask])
+        Returns
+        -------
+        NDArray[np.float64] or None
+            Entry ``i`` is the area of cells at or above ``min + i``, with a
+            trailing 0.0 for "above the maximum"; None unless the DEM was
+            given as integers with fewer levels than cells (otherwise the
+            per-level table would outgrow the DEM itself).
+        """
+        if self._level_areas is None:
+            # Checked first: a float DEM may hold NaN/inf (nodata), whose
+            # relief has no integer level count
+            if not self._integer_elevations:
+                return None
+            n_levels = int(self.relief) + 1
+            if n_levels > self.elevations.size:
+                return None
+            # Zero-based level of every cell; O(N), no sort
+            levels = self.elevations.astype(np.intp)
+            levels -= int(self.elevation_min)
+            weights = None if self._uniform_areas else self.cell_areas
+            level_areas = np.zeros(n_levels + 1, dtype=np.float64)
+            level_areas[:-1] = np.bincount(levels, weights=weights, minlength=n_levels)
+            del levels
+            # Summed from the top, in place
+            area_desc = level_areas[-2::-1]
+            np.cumsum(area_desc, out=area_desc)
+            self._level_areas = level_areas
+        return self._level_areas
+
+    def _elevation_thresholds(self, n_points: int) -> NDArray[np.float64]:
+        """Return ``n_points`` equally spaced elevations from min to max."""
+        if n_points != _DEFAULT_N_POINTS:
+            return np.linspace(self.elevation_min, self.elevation_max, n_points)
+        if self._default_thresholds is None:
+            self._default_thresholds = np.linspace(
+                self.elevation_min, self.elevation_max, n_points
+            )
+        return self._default_thresholds
 
-        # Convert to relative values
-        relative_heights = (elev_thresholds - self.elevation_min) / self.relief
+    def _compute_curve(
+        self, n_points: int
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Evaluate the hypsometric curve at ``n_points`` thresholds."""
+        # Create elevation thresholds (searched in the storage dtype, so a
+        # float32 DEM is not upcast to a float64 copy)
+        elev_thresholds = self._elevation_thresholds(n_points)
+        search_thresholds = elev_thresholds.astype(self.elevations.dtype, copy=False)
+
+        level_areas = self._integer_level_areas() if self._sorted is None else None
+        use_histogram = self._sorted is None and (
+            self._uniform_areas or self.elevations.size > _BUCKET_MIN_CELLS
+        )
+        if not math.isfinite(self.relief):
+            # NaN/inf cells (nodata) leave no finite range to bucket or
+            # search; compare directly (NaN is never >= a threshold)
+            cumulative_areas = np.array(
+                [
+                    self.cell_areas[self.elevations >= threshold].sum(dtype=np.float64)
+                    for threshold in search_thresholds
+                ]
+            )
+        elif level_areas is not None:
+            # Integer elevations: a cell is at or above a threshold exactly
+            # when its level is at or above the threshold rounded up
+            levels = np.ceil(search_thresholds).astype(np.intp)
+            levels -= int(self.elevation_min)
+            cumulative_areas = level_areas[levels]
+        elif use_histogram and self.relief > 0:
+            # Area between consecutive thresholds in one O(N) pass (cell
+            # counts for equal areas); np.histogram uses the same linspace
+            # edges and corrects boundary cells, so ">= threshold" is exact.
+            # Its last bin is closed, so cells at the maximum are split off.
+            weights = None if self._uniform_areas else self.cell_areas
+            hist, _ = np.histogram(
+                self.elevations,
+                bins=n_points - 1,
+                range=(self.elevation_min, self.elevation_max),
+                weights=weights,
+            )
+            at_max = self.elevations == self.elevations.dtype.type(self.elevation_max)
+            top_area = (
+                float(np.count_nonzero(at_max))
+                if weights is None
+                else float(self.cell_areas[at_max].sum(dtype=np.float64))
+            )
+            bucket_areas = np.empty(n_points, dtype=np.float64)
+            bucket_areas[:-1] = hist
+            bucket_areas[-2] -= top_area
+            bucket_areas[-1] = top_area
+            cumulative_areas = np.cumsum(bucket_areas[::-1])[::-1]
+        elif use_histogram:
+            # Flat DEM: every threshold has the whole area at or above it
+            cumulative_areas = np.full(n_points, self.total_area)
+        else:
+            # Cumulative area above each threshold: the first sorted
+            # elevation >= threshold indexes the area summed from the top
+            # (the sentinel gives 0 past the end), so one search and one
+            # gather allocate nothing beyond the n_points result
+            elev_sorted_asc, area_above, _ = self._sorted_profile()
+            idx = np.searchsorted(elev_sorted_asc, search_thresholds, side="left")
+            cumulative_areas = area_above[idx]
+
+        # Convert to relative values (a flat or non-finite DEM keeps its
+        # undefined heights)
+        if 0 < self.relief < math.inf:
+            relative_heights = _relative_heights(n_points)
+        else:
+            relative_heights = (elev_thresholds - self.elevation_min) / self.relief
         relative_areas = cumulative_areas / self.total_area
 
         return relative_heights, relative_areas
 
-    def hypsometric_integral(self, n_points: int = 101) -> float:
+    def hypsometric_integral(self, n_points: int = _DEFAULT_N_POINTS) -> float:
         """
         Calculate hypsometric integral.
 
@@ -198,11 +438,20 @@ class HypsometricCurve:
         - HI = 0.4-0.6: Mature stage (S-shaped curve)
         - HI < 0.4: Old stage (concave curve)
         """
-        rel_heights, rel_areas = self.generate_curve(n_points)
-
-        # Integrate using trapezoidal rule
-        # Note: we integrate area (y) against height (x)
-        hi: float = float(np.trapezoid(rel_areas, rel_heights))
+        return self._integrate(self._cached_curve(n_points)[1])
+
+    def _integrate(self, rel_areas: NDArray[np.float64]) -> float:
+        """Integrate the curve with the trapezoidal rule."""
+        if not 0 < self.relief < math.inf:
+            # Relative heights of a flat DEM (0/0) or one with NaN/inf cells
+            # are undefined, and so is the integral over them
+            return float("nan")
+        # Note: we integrate area (y) against height (x). The heights are
+        # equally spaced on [0, 1] (linspace thresholds), so the rule is
+        # dx · (y[0]/2 + y[1:-1] + y[-1]/2) with dx = 1/(n - 1)
+        dx = 1.0 / (rel_areas.size - 1)
+        inner = float(rel_areas[1:-1].sum())
+        hi: float = dx * (0.5 * float(rel_areas[0] + rel_areas[-1]) + inner)
         return hi
 
     def elevation_at_percentile(self, percentile: float) -> float:
@@ -230,23 +479,97 @@ class HypsometricCurve:
                 f"percentile must be in range 0-100, got {percentile}"
             )
 
-        # Sort elevations in descending order with their areas
-        sorted_indices = np.argsort(self.elevations)[::-1]
-        sorted_elevations = self.elevations[sorted_indices]
-        sorted_areas = self.cell_areas[sorted_indices]
+        return float(self.elevation_at_percentiles([percentile])[0])
+
+    def elevation_at_percentiles(self, percentiles: ArrayLike) -> NDArray[np.float64]:
+        """
+        Find elevations at several area percentiles at once.
+
+        All percentiles are resolved with one vectorized search over the
+        sorted profile (or one multi-rank selection when cell areas are
+        equal and the DEM has not been sorted yet).
+
+        Parameters
+        ----------
+        percentiles : ArrayLike
+            Percentiles of area (0-100), any shape.
 
-        # Calculate cumulative area percentage
-        cumulative_area = np.cumsum(sorted_areas)
-        cumulative_percent = (cumulative_area / self.total_area) * 100.0
+        Returns
+        -------
+        NDArray[np.float64]
+            Elevations [m a.s.l.], same shape as ``percentiles``.
 
-        # Find elevation where cumulative percentage reaches target
-        target = percentile
-        idx = np.searchsorted(cumulative_percent, target)
+        Raises
+        ------
+        InvalidParameterError
+            If any percentile is outside 0-100.
 
-        if idx >= len(sorted_elevations):
-            return float(sorted_elevations[-1])
+        Examples
+        --------
+        >>> hypso = HypsometricCurve(np.linspace(100, 500, 101))
+        >>> hypso.elevation_at_percentiles([10, 50, 90])
+        array([460., 300., 140.])
+        """
+        targets = np.asarray(percentiles, dtype=np.float64)
+        if not np.all((targets >= 0) & (targets <= 100)):
+            raise InvalidParameterError(
+                f"percentiles must be in range 0-100, got {targets}"
+            )
 
-        return float(sorted_elevations[idx])
+        if self._uniform_areas and self._sorted is None:
+            # k-th highest == (n-1-k)-th lowest; one introselect for all ranks
+            n = self.elevations.size
+            ranks = (
+                n
+                - 1
+                - np.array(
+                    [self._uniform_rank(p) for p in targets.ravel().tolist()],
+                    dtype=np.intp,
+                )
+            )
+            selected = np.partition(self.elevations, ranks)[ranks]
+            return selected.reshape(targets.shape).astype(np.float64, copy=False)
+
+        # Presorted (descending) elevations and cumulative area percentage
+        elev_sorted_asc, _, percent_above_desc = self._sorted_profile()
+        sorted_elevations = elev_sorted_asc[::-1]
+
+        # Find elevations where cumulative percentage reaches the targets
+        # (past the end: the lowest elevation)
+        if targets.size < _ORDERED_QUERY_MIN:
+            # A 0-d target gives a scalar index, so the clip is not in place
+            idx = np.clip(
+                np.searchsorted(percent_above_desc, targets),
+                0,
+                sorted_elevations.size - 1,
+            )
+            return np.asarray(sorted_elevations[idx], dtype=np.float64)
+
+        # Large batches: search and gather in ascending target order, so both
+        # walk the profile front to back (neighbouring queries share cache
+        # lines) instead of jumping around a profile larger than the cache;
+        # the results are scattered back to the caller's order
+        flat = targets.ravel()
+        order = np.argsort(flat)
+        idx = np.searchsorted(percent_above_desc, flat[order])
+        np.clip(idx, 0, sorted_elevations.size - 1, out=idx)
+        elevations = np.empty(flat.size, dtype=np.float64)
+        elevations[order] = sorted_elevations[idx]
+        return elevations.reshape(targets.shape)
+
+    def _uniform_rank(self, percentile: float) -> int:
+        """Descending rank k of the percentile cell for equal cell areas."""
+        n = self.elevations.size
+
+        # With equal areas the k-th highest cell (0-based) has (k+1)/n·100 %
+        # of the area above it; find the first k reaching the target, using
+        # the same floating-point expression as the sorted lookup
+        k = max(math.ceil(percentile * n / 100.0) - 1, 0)
+        while k > 0 and (k / n) * 100.0 >= percentile:
+            k -= 1
+        while k < n - 1 and ((k + 1) / n) * 100.0 < percentile:
+            k += 1
+        return k
 
     def mean_elevation(self) -> float:
         """
@@ -257,10 +580,17 @@ class HypsometricCurve:
         float
             Mean elevation [m a.s.l.].
         """
-        mean_elev: float = float(np.average(self.elevations, weights=self.cell_areas))
+        if self._uniform_areas:
+            # Equal areas: a plain mean, no pass over the unit weights
+            return float(np.mean(self.elevations, dtype=np.float64))
+
+        # Single multiply-add pass over both arrays (float64 accumulation);
+        # the total area is already known
+        mean_elev: float = _weighted_sum(self.elevations, self.cell_areas)
+        mean_elev /= self._total_area
         return mean_elev
 
-    def analyze(self, n_points: int = 101) -> HypsometricResult:
+    def analyze(self, n_points: int = _DEFAULT_N_POINTS) -> HypsometricResult:
         """
         Perform complete hypsometric analysis.
 
@@ -282,10 +612,15 @@ class HypsometricCurve:
         >>> print(f"HI: {result.hypsometric_integral:.3f}")
         >>> print(f"Mean elev: {result.elevation_mean_m:.1f} m")
         """
+        # All steps share the instance's memoized state, so the DEM is sorted
+        # at most once (for a weighted median; equal areas need no sort) and
+        # the curve is computed once and reused by the integral. The median
+        # goes first so the curve can search its profile instead of also
+        # bucketing a large DEM
+        median_elev = self.elevation_at_percentile(50)
         rel_heights, rel_areas = self.generate_curve(n_points)
-        hi = self.hypsometric_integral(n_points)
+        hi = self._integrate(rel_areas)
         mean_elev = self.mean_elevation()
-        median_elev = self.elevation_at_percentile(50)
 
         return HypsometricResult(
             relative_heights=rel_heights,
@@ -3,17 +3,62 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
-from typing import TYPE_CHECKING, Any, Optional
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from hydrolog.exceptions import InvalidParameterError
+from hydrolog.time import ConcentrationTime
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 if TYPE_CHECKING:
     from hydrolog.morphometry.geometric import WatershedGeometry
     from hydrolog.morphometry.terrain import TerrainAnalysis
 
 
-@dataclass
+def _orjson_matches_stdlib(data: dict[str, Any]) -> bool:
+    """Whether orjson's indented output of ``data`` equals ``json.dumps``'s.
+
+    orjson writes UTF-8 instead of ``\\uXXXX`` escapes, ``null`` for NaN and
+    infinities, and exponents without ``+``/zero padding (``1e16`` vs
+    ``1e+16``). Floats in ``[1e-4, 1e16)`` and printable ASCII strings are
+    written identically by both.
+    """
+    for value in data.values():
+        kind = type(value)
+        if kind is float:
+            # NaN fails both comparisons
+            if value and not 1e-4 <= abs(value) < 1e16:
+                return False
+        elif kind is str:
+            if not (value.isascii() and value.isprintable()):
+                return False
+        elif kind is int:
+            if not -(2**63) <= value < 2**63:
+                return False
+        elif kind is not bool:
+            return False
+    return True
+
+
+def _loads_json(json_str: Union[str, bytes]) -> Any:
+    """Parse a JSON document, with orjson when it is installed."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # orjson is strict RFC 8259; let the stdlib accept what it
+            # always did (e.g. NaN) or raise its usual error
+            pass
+    return json.loads(json_str)
+
+
+@dataclass(slots=True)
 class WatershedParameters:
     """
     Standardized watershed parameters for hydrological calculations.
@@ -146,6 +191,9 @@ class WatershedParameters:
 
     def _validate(self) -> None:
         """Validate parameter values."""
+        # Plain inline comparisons on purpose: looping over a table of
+        # (field, predicate) pairs was about three times slower, and the
+        # messages are only formatted when a check fails.
         if self.area_km2 <= 0:
             raise InvalidParameterError(
                 f"area_km2 must be positive, got {self.area_km2}"
@@ -167,7 +215,8 @@ class WatershedParameters:
             raise InvalidParameterError(f"cn must be 0-100, got {self.cn}")
         if self.mean_slope_m_per_m is not None and self.mean_slope_m_per_m < 0:
             raise InvalidParameterError(
-                f"mean_slope_m_per_m must be non-negative, got {self.mean_slope_m_per_m}"
+                f"mean_slope_m_per_m must be non-negative, "
+                f"got {self.mean_slope_m_per_m}"
             )
         if self.channel_length_km is not None and self.channel_length_km <= 0:
             raise InvalidParameterError(
@@ -175,7 +224,8 @@ class WatershedParameters:
             )
         if self.channel_slope_m_per_m is not None and self.channel_slope_m_per_m < 0:
             raise InvalidParameterError(
-                f"channel_slope_m_per_m must be non-negative, got {self.channel_slope_m_per_m}"
+                f"channel_slope_m_per_m must be non-negative, "
+                f"got {self.channel_slope_m_per_m}"
             )
         if self.runoff_coeff is not None and (
             self.runoff_coeff <= 0 or self.runoff_coeff > 1.0
@@ -189,7 +239,8 @@ class WatershedParameters:
             )
         if self.overland_length_km is not None and self.overland_length_km <= 0:
             raise InvalidParameterError(
-                f"overland_length_km must be positive, got {self.overland_length_km}"
+                f"overland_length_km must be positive, "
+                f"got {self.overland_length_km}"
             )
         if self.overland_slope_m_per_m is not None and self.overland_slope_m_per_m < 0:
             raise InvalidParameterError(
@@ -216,7 +267,8 @@ class WatershedParameters:
         """
         Average watershed width [km].
 
-        Calculated as W = A / L.
+        Calculated as W = A / L. Not cached: the dataclass is mutable, and
+        the single division is cheaper than the bookkeeping a cache needs.
         """
         return self.area_km2 / self.length_km
 
@@ -265,42 +317,28 @@ class WatershedParameters:
         ...         "elevation_min_m": 150.0, "elevation_max_m": 520.0}
         >>> params = WatershedParameters.from_dict(data)
         """
-        # Extract only known fields
-        known_fields = {
-            "area_km2",
-            "perimeter_km",
-            "length_km",
-            "elevation_min_m",
-            "elevation_max_m",
-            "name",
-            "elevation_mean_m",
-            "mean_slope_m_per_m",
-            "channel_length_km",
-            "channel_slope_m_per_m",
-            "cn",
-            "source",
-            "crs",
-            "runoff_coeff",
-            "retardance",
-            "overland_length_km",
-            "overland_slope_m_per_m",
-            "Lc_km",
-            "manning_n",
-            "urban_pct",
-            "forest_pct",
-        }
-        filtered_data = {k: v for k, v in data.items() if k in known_fields}
+        if len(data) > len(_KNOWN_FIELDS):
+            # Payloads carrying much more than the parameters (GIS API
+            # responses with geometry, metadata, ...): look up the known
+            # fields instead of scanning every key
+            filtered_data = {k: data[k] for k in _KNOWN_FIELDS if k in data}
+        else:
+            filtered_data = {k: v for k, v in data.items() if k in _KNOWN_FIELDS}
         return cls(**filtered_data)
 
     @classmethod
-    def from_json(cls, json_str: str) -> "WatershedParameters":
+    def from_json(cls, json_str: Union[str, bytes]) -> "WatershedParameters":
         """
         Create WatershedParameters from a JSON string.
 
+        Parsed with ``orjson`` when it is installed (falling back to the
+        stdlib ``json`` module).
+
         Parameters
         ----------
-        json_str : str
-            JSON string with watershed parameters.
+        json_str : str or bytes
+            JSON document with watershed parameters (bytes are UTF-8,
+            e.g. an HTTP response body).
 
         Returns
         -------
@@ -313,8 +351,52 @@ class WatershedParameters:
         >>> json_str += '"elevation_min_m": 150.0, "elevation_max_m": 520.0}'
         >>> params = WatershedParameters.from_json(json_str)
         """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+        return cls.from_dict(_loads_json(json_str))
+
+    @classmethod
+    def from_json_array(
+        cls, json_str: Union[str, bytes]
+    ) -> list["WatershedParameters"]:
+        """
+        Create WatershedParameters for every object in a JSON array.
+
+        The whole document is parsed in one pass (with ``orjson`` when it is
+        installed), which is faster than calling :meth:`from_json` on each
+        element of a bulk GIS export.
+
+        Parameters
+        ----------
+        json_str : str or bytes
+            JSON array of objects with watershed parameters. Unknown keys
+            are ignored, as in :meth:`from_dict`.
+
+        Returns
+        -------
+        list of WatershedParameters
+            One instance per array element, in order.
+
+        Raises
+        ------
+        InvalidParameterError
+            If the document is not a JSON array or an element has invalid
+            parameters.
+
+        Examples
+        --------
+        >>> payload = ('[{"area_km2": 45.0, "perimeter_km": 32.0, '
+        ...     '"length_km": 12.0, "elevation_min_m": 150.0, '
+        ...     '"elevation_max_m": 520.0}]')
+        >>> [p.area_km2 for p in WatershedParameters.from_json_array(payload)]
+        [45.0]
+        """
+        data = _loads_json(json_str)
+        if not isinstance(data, list):
+            raise InvalidParameterError(
+                f"Expected a JSON array of watershed parameters, "
+                f"got {type(data).__name__}"
+            )
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in data]
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -333,14 +415,24 @@ class WatershedParameters:
         >>> print(d["area_km2"])
         45.0
         """
-        result = asdict(self)
-        # Remove None values for cleaner output
-        return {k: v for k, v in result.items() if v is not None}
+        # All fields are scalars or strings, so the attributes are read
+        # directly instead of going through asdict()'s recursive copy.
+        result = {}
+        for name in _FIELD_NAMES:
+            value = getattr(self, name)
+            # Remove None values for cleaner output
+            if value is not None:
+                result[name] = value
+        return result
 
     def to_json(self, indent: Optional[int] = None) -> str:
         """
         Export to JSON string.
 
+        The text is always what ``json.dumps(self.to_dict(), indent=indent)``
+        gives (ASCII escapes, NaN kept). With ``indent=2`` it is written by
+        ``orjson`` when it is installed and its output is identical.
+
         Parameters
         ----------
         indent : int, optional
@@ -357,7 +449,41 @@ class WatershedParameters:
         ...     length_km=12.0, elevation_min_m=150.0, elevation_max_m=520.0)
         >>> json_str = params.to_json(indent=2)
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        data = self.to_dict()
+        if HAS_ORJSON and indent == 2 and _orjson_matches_stdlib(data):
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        # Compact output goes through the stdlib's C encoder anyway
+        return json.dumps(data, indent=indent)
+
+    def to_json_bytes(self, indent: Optional[int] = None) -> bytes:
+        """
+        Export to UTF-8 encoded JSON.
+
+        Same text as :meth:`to_json`, returned as ``bytes`` so it can be
+        written to a file or socket without an extra ``str`` round trip.
+        :meth:`from_json` accepts the result directly.
+
+        Parameters
+        ----------
+        indent : int, optional
+            Indentation level for pretty printing.
+
+        Returns
+        -------
+        bytes
+            UTF-8 encoded JSON with parameters.
+
+        Examples
+        --------
+        >>> params = WatershedParameters(area_km2=45.0, perimeter_km=32.0,
+        ...     length_km=12.0, elevation_min_m=150.0, elevation_max_m=520.0)
+        >>> WatershedParameters.from_json(params.to_json_bytes()) == params
+        True
+        """
+        data = self.to_dict()
+        if HAS_ORJSON and indent == 2 and _orjson_matches_stdlib(data):
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=indent).encode("ascii")
 
     def to_geometry(self) -> "WatershedGeometry":
         """
@@ -456,8 +582,6 @@ class WatershedParameters:
         ...     mean_slope_m_per_m=0.025)
         >>> tc = params.calculate_tc(method="kirpich")
         """
-        from hydrolog.time import ConcentrationTime
-
         # Determine length to use
         length_km = self.channel_length_km or self.length_km
 
@@ -470,95 +594,147 @@ class WatershedParameters:
             # Calculate from relief and length
             slope_m_per_m = self.relief_m / (length_km * 1000)
 
-        if method == "kirpich":
-            return ConcentrationTime.kirpich(
-                length_km=length_km,
-                slope_m_per_m=slope_m_per_m,
-            )
-        elif method == "nrcs":
-            if self.cn is None:
-                raise InvalidParameterError(
-                    "CN is required for NRCS method. Set cn parameter."
-                )
-            return ConcentrationTime.nrcs(
-                length_km=length_km,
-                slope_m_per_m=slope_m_per_m,
-                cn=self.cn,
-            )
-        elif method == "giandotti":
-            # elevation_diff_m = mean elevation - outlet elevation
-            elevation_mean = self.elevation_mean_m or (
-                (self.elevation_min_m + self.elevation_max_m) / 2
-            )
-            elevation_diff_m = elevation_mean - self.elevation_min_m
-            return ConcentrationTime.giandotti(
-                area_km2=self.area_km2,
-                length_km=length_km,
-                elevation_diff_m=elevation_diff_m,
-            )
-        elif method == "faa":
-            if self.runoff_coeff is None:
-                raise ValueError(
-                    "runoff_coeff is required for FAA method. "
-                    "Set the runoff_coeff parameter (0 < C <= 1.0)."
-                )
-            return ConcentrationTime.faa(
-                length_km=length_km,
-                slope_m_per_m=slope_m_per_m,
-                runoff_coeff=self.runoff_coeff,
-            )
-        elif method == "kerby":
-            if self.retardance is None:
-                raise ValueError(
-                    "retardance is required for Kerby method. "
-                    "Set the retardance parameter (0.02-0.80)."
-                )
-            return ConcentrationTime.kerby(
-                length_km=length_km,
-                slope_m_per_m=slope_m_per_m,
-                retardance=self.retardance,
-            )
-        elif method == "kerby_kirpich":
-            if self.retardance is None:
-                raise ValueError(
-                    "retardance is required for Kerby-Kirpich method. "
-                    "Set the retardance parameter (0.02-0.80)."
-                )
-            # Overland segment parameters
-            ol_length = self.overland_length_km
-            if ol_length is None:
-                raise ValueError(
-                    "overland_length_km is required for Kerby-Kirpich "
-                    "method. Set the overland_length_km parameter."
-                )
-            ol_slope = self.overland_slope_m_per_m
-            if ol_slope is None:
-                raise ValueError(
-                    "overland_slope_m_per_m is required for Kerby-Kirpich "
-                    "method. Set the overland_slope_m_per_m parameter."
-                )
-            # Channel segment parameters
-            ch_length = self.channel_length_km
-            if ch_length is None:
-                raise ValueError(
-                    "channel_length_km is required for Kerby-Kirpich "
-                    "method. Set the channel_length_km parameter."
-                )
-            ch_slope = self.channel_slope_m_per_m
-            if ch_slope is None:
-                raise ValueError(
-                    "channel_slope_m_per_m is required for Kerby-Kirpich "
-                    "method. Set the channel_slope_m_per_m parameter."
-                )
-            return ConcentrationTime.kerby_kirpich(
-                overland_length_km=ol_length,
-                overland_slope_m_per_m=ol_slope,
-                retardance=self.retardance,
-                channel_length_km=ch_length,
-                channel_slope_m_per_m=ch_slope,
-            )
-        else:
+        try:
+            tc_method = _TC_METHODS[method]
+        except (KeyError, TypeError):
             raise ValueError(
                 f"Unknown method: '{method}'. Use 'kirpich', 'nrcs', "
                 f"'giandotti', 'faa', 'kerby', or 'kerby_kirpich'."
-            )
+            ) from None
+        return tc_method(self, length_km, slope_m_per_m)
+
+
+# Concentration time methods used by WatershedParameters.calculate_tc().
+# Each takes the parameters together with the already resolved length [km]
+# and slope [m/m], validates the method-specific inputs and returns tc [min].
+
+
+def _tc_kirpich(
+    params: WatershedParameters, length_km: float, slope_m_per_m: float
+) -> float:
+    return ConcentrationTime.kirpich(
+        length_km=length_km,
+        slope_m_per_m=slope_m_per_m,
+    )
+
+
+def _tc_nrcs(
+    params: WatershedParameters, length_km: float, slope_m_per_m: float
+) -> float:
+    if params.cn is None:
+        raise InvalidParameterError("CN is required for NRCS method. Set cn parameter.")
+    return ConcentrationTime.nrcs(
+        length_km=length_km,
+        slope_m_per_m=slope_m_per_m,
+        cn=params.cn,
+    )
+
+
+def _tc_giandotti(
+    params: WatershedParameters, length_km: float, slope_m_per_m: float
+) -> float:
+    # elevation_diff_m = mean elevation - outlet elevation
+    elevation_mean = params.elevation_mean_m or (
+        (params.elevation_min_m + params.elevation_max_m) / 2
+    )
+    elevation_diff_m = elevation_mean - params.elevation_min_m
+    return ConcentrationTime.giandotti(
+        area_km2=params.area_km2,
+        length_km=length_km,
+        elevation_diff_m=elevation_diff_m,
+    )
+
+
+def _tc_faa(
+    params: WatershedParameters, length_km: float, slope_m_per_m: float
+) -> float:
+    if params.runoff_coeff is None:
+        raise ValueError(
+            "runoff_coeff is required for FAA method. "
+            "Set the runoff_coeff parameter (0 < C <= 1.0)."
+        )
+    return ConcentrationTime.faa(
+        length_km=length_km,
+        slope_m_per_m=slope_m_per_m,
+        runoff_coeff=params.runoff_coeff,
+    )
+
+
+def _tc_kerby(
+    params: WatershedParameters, length_km: float, slope_m_per_m: float
+) -> float:
+    if params.retardance is None:
+        raise ValueError(
+            "retardance is required for Kerby method. "
+            "Set the retardance parameter (0.02-0.80)."
+        )
+    return ConcentrationTime.kerby(
+        length_km=length_km,
+        slope_m_per_m=slope_m_per_m,
+        retardance=params.retardance,
+    )
+
+
+def _tc_kerby_kirpich(
+    params: WatershedParameters, length_km: float, slope_m_per_m: float
+) -> float:
+    if params.retardance is None:
+        raise ValueError(
+            "retardance is required for Kerby-Kirpich method. "
+            "Set the retardance parameter (0.02-0.80)."
+        )
+    # Overland segment parameters
+    ol_length = params.overland_length_km
+    if ol_length is None:
+        raise ValueError(
+            "overland_length_km is required for Kerby-Kirpich "
+            "method. Set the overland_length_km parameter."
+        )
+    ol_slope = params.overland_slope_m_per_m
+    if ol_slope is None:
+        raise ValueError(
+            "overland_slope_m_per_m is required for Kerby-Kirpich "
+            "method. Set the overland_slope_m_per_m parameter."
+        )
+    # Channel segment parameters
+    ch_length = params.channel_length_km
+    if ch_length is None:
+        raise ValueError(
+            "channel_length_km is required for Kerby-Kirpich "
+            "method. Set the channel_length_km parameter."
+        )
+    ch_slope = params.channel_slope_m_per_m
+    if ch_slope is None:
+        raise ValueError(
+            "channel_slope_m_per_m is required for Kerby-Kirpich "
+            "method. Set the channel_slope_m_per_m parameter."
+        )
+    return ConcentrationTime.kerby_kirpich(
+        overland_length_km=ol_length,
+        overland_slope_m_per_m=ol_slope,
+        retardance=params.retardance,
+        channel_length_km=ch_length,
+        channel_slope_m_per_m=ch_slope,
+    )
+
+
+# Looked up by method name. The keys are interned literals and str caches its
+# hash, so a lookup with a literal argument resolves by identity; interning
+# the argument on every call would only add work.
+_TC_METHODS: dict[str, Callable[[WatershedParameters, float, float], float]] = {
+    "kirpich": _tc_kirpich,
+    "nrcs": _tc_nrcs,
+    "giandotti": _tc_giandotti,
+    "faa": _tc_faa,
+    "kerby": _tc_kerby,
+    "kerby_kirpich": _tc_kerby_kirpich,
+}
+
+# Constructor arguments accepted by from_dict(); other payload keys are
+# ignored. Built once from the dataclass so it cannot drift from the fields.
+_KNOWN_FIELDS: frozenset[str] = frozenset(
+    f.name for f in fields(WatershedParameters) if f.init
+)
+
+# Fields exported by to_dict(), in declaration order.
+_FIELD_NAMES: tuple[str, ...] = tuple(f.name for f in fields(WatershedParameters))
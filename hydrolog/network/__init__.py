@@ -3,15 +3,19 @@
 This module provides tools for stream ordering and network analysis.
 """
 
-from hydrolog.network.stream_order import (
-    OrderingMethod,
-    StreamSegment,
-    NetworkStatistics,
-    StreamNetwork,
-    bifurcation_ratio,
-    drainage_density,
-    stream_frequency,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from hydrolog.network.stream_order import (
+        OrderingMethod,
+        StreamSegment,
+        NetworkStatistics,
+        StreamNetwork,
+        bifurcation_ratio,
+        drainage_density,
+        stream_frequency,
+    )
 
 __all__ = [
     "OrderingMethod",
@@ -22,3 +26,15 @@ __all__ = [
     "drainage_density",
     "stream_frequency",
 ]
+
+# All re-exports live in stream_order, imported on first access.
+_LAZY: dict[str, str] = dict.fromkeys(__all__, "hydrolog.network.stream_order")
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve re-exports on first access (PEP 562)."""
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,6 +13,12 @@ from numpy.typing import NDArray
 
 from hydrolog.exceptions import InvalidParameterError
 
+# Networks whose levels (segments ordered together: all their upstream
+# segments lie on lower levels) hold at least this many segments on average
+# are classified level by level with NumPy; deep, narrow networks (long main
+# stems with single tributaries) stay in the per-segment loop
+_VECTORIZED_MIN_LEVEL_SIZE = 32
+
 
 class OrderingMethod(Enum):
     """Stream ordering method enumeration."""
@@ -21,7 +27,7 @@ class OrderingMethod(Enum):
     SHREVE = "shreve"
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamSegment:
     """
     Represents a single stream segment in a river network.
@@ -44,7 +50,7 @@ class StreamSegment:
     order: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStatistics:
     """
     Statistics of a classified river network.
@@ -79,6 +85,43 @@ class NetworkStatistics:
     drainage_density: Optional[float] = None
 
 
+@dataclass(slots=True, frozen=True)
+class _NetworkTopology:
+    """
+    Traversal plan of a stream network, shared by every classify() call.
+
+    Attributes
+    ----------
+    segments : list[StreamSegment]
+        All segments, in the order of ``self.segments``.
+    headwater_idx : NDArray[np.intp]
+        Positions of headwater segments.
+    order_segments : list[StreamSegment]
+        Reachable non-headwater segments in topological order (by level).
+    order_idx : NDArray[np.intp]
+        Positions of ``order_segments``.
+    up_indptr, up_idx : NDArray[np.intp]
+        CSR upstream positions of ``order_segments`` (repeated upstream IDs
+        are kept, as the ordering rules count them).
+    level_bounds : NDArray[np.intp]
+        Start of each level in ``order_segments``, plus the end.
+    """
+
+    segments: list[StreamSegment]
+    headwater_idx: NDArray[np.intp]
+    order_segments: list[StreamSegment]
+    order_idx: NDArray[np.intp]
+    up_indptr: NDArray[np.intp]
+    up_idx: NDArray[np.intp]
+    level_bounds: NDArray[np.intp]
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether levels are wide enough for the NumPy pass to pay off."""
+        n_levels = len(self.level_bounds) - 1
+        return len(self.order_segments) >= _VECTORIZED_MIN_LEVEL_SIZE * n_levels
+
+
 class StreamNetwork:
     """
     River network classification and analysis.
@@ -147,6 +190,35 @@ class StreamNetwork:
 
         self.segments = {seg.segment_id: seg for seg in segments}
         self.area_km2 = area_km2
+
+        # Headwaters, reverse adjacency (segment -> segments it flows into)
+        # and the number of upstream segments each one waits for, built once
+        # so classification does not rescan the whole network
+        self._downstream: dict[int, list[int]] = {
+            seg_id: [] for seg_id in self.segments
+        }
+        self._n_upstream: dict[int, int] = {}
+        headwaters = []
+        for seg_id, seg in self.segments.items():
+            if not seg.upstream_ids:
+                headwaters.append(seg_id)
+            n_upstream = 0
+            for up_id in seg.upstream_ids:
+                downstream = self._downstream.get(up_id)
+                if downstream is None:
+                    # Unknown upstream ID: counted, but never completed
+                    n_upstream += 1
+                elif not downstream or downstream[-1] != seg_id:
+                    # Repeated IDs are listed (and awaited) once; a segment's
+                    # own entries are appended consecutively
+                    downstream.append(seg_id)
+                    n_upstream += 1
+            self._n_upstream[seg_id] = n_upstream
+        self._headwaters: tuple[int, ...] = tuple(headwaters)
+
+        self._topology: Optional[_NetworkTopology] = None
+        self._segment_counts: dict[int, int] = {}
+        self._total_lengths: dict[int, float] = {}
         self._classified = False
         self._method: Optional[OrderingMethod] = None
 
@@ -155,17 +227,59 @@ class StreamNetwork:
         """Number of segments in the network."""
         return len(self.segments)
 
-    def _find_headwaters(self) -> list[int]:
+    def _find_headwaters(self) -> tuple[int, ...]:
         """Find headwater segments (no upstream tributaries)."""
-        return [seg_id for seg_id, seg in self.segments.items() if not seg.upstream_ids]
+        return self._headwaters
 
     def _get_downstream_segments(self, segment_id: int) -> list[int]:
         """Find segments that have this segment as upstream."""
-        downstream = []
-        for seg_id, seg in self.segments.items():
-            if segment_id in seg.upstream_ids:
-                downstream.append(seg_id)
-        return downstream
+        return self._downstream[segment_id]
+
+    def _get_topology(self) -> _NetworkTopology:
+        """Return the traversal plan of the network (built on first use)."""
+        if self._topology is not None:
+            return self._topology
+
+        headwaters = self._find_headwaters()
+
+        # Kahn's algorithm, one level at a time: a segment is reached exactly
+        # once, in the round after its last upstream segment, so each round
+        # is one level. Segments with unknown upstream IDs, or on a cycle,
+        # are never reached.
+        n_pending = self._n_upstream.copy()
+        reached: list[int] = []
+        level_bounds = [0]
+        frontier: list[int] = list(headwaters)
+        while frontier:
+            next_frontier: list[int] = []
+            for seg_id in frontier:
+                for down_id in self._downstream[seg_id]:
+                    n_pending[down_id] -= 1
+                    if not n_pending[down_id]:
+                        next_frontier.append(down_id)
+            if next_frontier:
+                reached.extend(next_frontier)
+                level_bounds.append(len(reached))
+            frontier = next_frontier
+
+        position = {seg_id: i for i, seg_id in enumerate(self.segments)}
+        order_segments = [self.segments[seg_id] for seg_id in reached]
+        up_counts = [len(seg.upstream_ids) for seg in order_segments]
+        self._topology = _NetworkTopology(
+            segments=list(self.segments.values()),
+            headwater_idx=np.array(
+                [position[seg_id] for seg_id in headwaters], dtype=np.intp
+            ),
+            order_segments=order_segments,
+            order_idx=np.array([position[seg_id] for seg_id in reached], dtype=np.intp),
+            up_indptr=np.concatenate(([0], np.cumsum(up_counts, dtype=np.intp))),
+            up_idx=np.array(
+                [position[up] for seg in order_segments for up in seg.upstream_ids],
+                dtype=np.intp,
+            ),
+            level_bounds=np.array(level_bounds, dtype=np.intp),
+        )
+        return self._topology
 
     def classify(self, method: OrderingMethod = OrderingMethod.STRAHLER) -> None:
         """
@@ -178,65 +292,110 @@ class StreamNetwork:
         """
         self._method = method
 
-        # Reset all orders
-        for seg in self.segments.values():
-            seg.order = 0
-
-        # Find headwaters and assign order 1
-        headwaters = self._find_headwaters()
-        for seg_id in headwaters:
-            self.segments[seg_id].order = 1
-
-        # Process network from headwaters downstream
-        processed = set(headwaters)
-        to_process = set()
-
-        # Find initial downstream segments
-        for seg_id in headwaters:
-            to_process.update(self._get_downstream_segments(seg_id))
-
-        while to_process:
-            next_round = set()
-
-            for seg_id in to_process:
-                seg = self.segments[seg_id]
-
-                # Check if all upstream segments are processed
-                upstream_orders = []
-                all_processed = True
-                for up_id in seg.upstream_ids:
-                    if up_id not in processed:
-                        all_processed = False
-                        break
-                    upstream_orders.append(self.segments[up_id].order)
-
-                if not all_processed:
-                    next_round.add(seg_id)
-                    continue
-
-                # Calculate order based on method
-                if method == OrderingMethod.STRAHLER:
-                    seg.order = self._strahler_order(upstream_orders)
-                else:  # SHREVE
-                    seg.order = self._shreve_order(upstream_orders)
-
-                processed.add(seg_id)
-
-                # Add downstream segments
-                next_round.update(self._get_downstream_segments(seg_id))
-
-            # Remove already processed
-            to_process = next_round - processed
+        # Segments are ordered in topological order, each exactly once after
+        # all its upstream segments. Segments with unknown upstream IDs, or
+        # on a cycle, are never reached and keep order 0.
+        topology = self._get_topology()
+        if topology.vectorized:
+            # Orders are computed over the topology's index arrays and
+            # written back to every segment, so no per-segment reset is needed
+            orders = self._classify_levels(topology, method)
+        else:
+            # Reset all orders
+            for seg in topology.segments:
+                seg.order = 0
+
+            # Headwaters get order 1
+            segments = self.segments
+            for seg_id in self._find_headwaters():
+                segments[seg_id].order = 1
+
+            # Calculate order based on method
+            if method == OrderingMethod.STRAHLER:
+                order_rule = self._strahler_order
+            else:  # SHREVE
+                order_rule = self._shreve_order
+            for seg in topology.order_segments:
+                seg.order = order_rule(
+                    [segments[up_id].order for up_id in seg.upstream_ids]
+                )
+            orders = np.fromiter(
+                (seg.order for seg in topology.segments),
+                dtype=np.int64,
+                count=len(topology.segments),
+            )
 
+        self._tally_orders(topology.segments, orders)
         self._classified = True
 
+    def _tally_orders(
+        self, segments: list[StreamSegment], orders: NDArray[np.int64]
+    ) -> None:
+        """Accumulate segment counts and total lengths per assigned order."""
+        lengths = np.fromiter(
+            (seg.length_km for seg in segments), dtype=np.float64, count=len(segments)
+        )
+        counts = np.bincount(orders)
+        # bincount adds the weights in segment order: the same sums as
+        # adding up each order's lengths one segment at a time
+        total_lengths = np.bincount(orders, weights=lengths)
+
+        # Report orders by first appearance among the segments, as a
+        # per-order grouping of self.segments would; get_statistics() reuses
+        # the tallies
+        present, first_seen = np.unique(orders, return_index=True)
+        keys = present[np.argsort(first_seen)]
+        self._segment_counts = dict(zip(keys.tolist(), counts[keys].tolist()))
+        self._total_lengths = dict(zip(keys.tolist(), total_lengths[keys].tolist()))
+
+    @staticmethod
+    def _classify_levels(
+        topology: _NetworkTopology, method: OrderingMethod
+    ) -> NDArray[np.int64]:
+        """Order the network level by level over the CSR upstream arrays."""
+        orders = np.zeros(len(topology.segments), dtype=np.int64)
+        orders[topology.headwater_idx] = 1
+
+        indptr = topology.up_indptr
+        bounds = topology.level_bounds.tolist()
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            # Upstream orders of the whole level, one reduceat group each
+            first, last = indptr[start], indptr[stop]
+            upstream = orders[topology.up_idx[first:last]]
+            groups = indptr[start:stop] - first
+            if method == OrderingMethod.STRAHLER:
+                top = np.maximum.reduceat(upstream, groups)
+                sizes = np.diff(indptr[start : stop + 1])
+                n_top = np.add.reduceat(upstream == np.repeat(top, sizes), groups)
+                level_orders = top + (n_top >= 2)
+            else:  # SHREVE
+                level_orders = np.add.reduceat(upstream, groups)
+            orders[topology.order_idx[start:stop]] = level_orders
+
+        for seg, order in zip(topology.segments, orders.tolist()):
+            seg.order = order
+        return orders
+
     def _strahler_order(self, upstream_orders: list[int]) -> int:
         """Calculate Strahler order from upstream orders."""
+        if len(upstream_orders) == 2:
+            # Binary confluence, by far the most common case
+            first, second = upstream_orders
+            if first == second:
+                return first + 1
+            return first if first > second else second
         if not upstream_orders:
             return 1
 
-        max_order = max(upstream_orders)
-        count_max = upstream_orders.count(max_order)
+        # Single pass for the highest order and whether it occurs twice
+        max_order = upstream_orders[0]
+        count_max = 1
+        for order in upstream_orders[1:]:
+            if order > max_order:
+                max_order = order
+                count_max = 1
+            elif order == max_order:
+                count_max += 1
 
         if count_max >= 2:
             return max_order + 1
@@ -261,30 +420,26 @@ class StreamNetwork:
         ------
         InvalidParameterError
             If network has not been classified yet.
+
+        Notes
+        -----
+        Segment counts and lengths per order are tallied by classify(), so
+        the statistics describe the segments as of the last classification.
         """
         if not self._classified:
             raise InvalidParameterError(
                 "Network must be classified first. Call classify() method."
             )
 
-        # Group segments by order
-        orders: dict[int, list[StreamSegment]] = {}
-        for seg in self.segments.values():
-            if seg.order not in orders:
-                orders[seg.order] = []
-            orders[seg.order].append(seg)
-
-        max_order = max(orders.keys())
-
-        # Calculate counts and lengths
-        segment_counts: dict[int, int] = {}
-        total_lengths: dict[int, float] = {}
-        mean_lengths: dict[int, float] = {}
+        # Counts and lengths per order were accumulated by classify()
+        segment_counts = dict(self._segment_counts)
+        total_lengths = dict(self._total_lengths)
+        mean_lengths = {
+            order: total_lengths[order] / count
+            for order, count in segment_counts.items()
+        }
 
-        for order, segs in orders.items():
-            segment_counts[order] = len(segs)
-            total_lengths[order] = sum(s.length_km for s in segs)
-            mean_lengths[order] = total_lengths[order] / len(segs) if segs else 0.0
+        max_order = max(segment_counts)
 
         # Calculate bifurcation ratios (Rb = N_i / N_{i+1})
         bifurcation_ratios: dict[int, float] = {}
@@ -1,29 +1,34 @@
 """Precipitation module for hyetograms and interpolation."""
 
-from hydrolog.precipitation.hietogram import (
-    HietogramResult,
-    Hietogram,
-    BlockHietogram,
-    TriangularHietogram,
-    BetaHietogram,
-    EulerIIHietogram,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from hydrolog.precipitation.interpolation import (
-    Station,
-    ThiessenResult,
-    IDWResult,
-    IsohyetResult,
-    thiessen_polygons,
-    inverse_distance_weighting,
-    areal_precipitation_idw,
-    isohyet_method,
-    arithmetic_mean,
-)
+if TYPE_CHECKING:
+    from hydrolog.precipitation.hietogram import (
+        HietogramResult,
+        HietogramBatchResult,
+        Hietogram,
+        BlockHietogram,
+        TriangularHietogram,
+        BetaHietogram,
+        EulerIIHietogram,
+    )
+    from hydrolog.precipitation.interpolation import (
+        Station,
+        ThiessenResult,
+        IDWResult,
+        IsohyetResult,
+        thiessen_polygons,
+        inverse_distance_weighting,
+        areal_precipitation_idw,
+        isohyet_method,
+        arithmetic_mean,
+    )
 
 __all__ = [
     # Hietograms
     "HietogramResult",
+    "HietogramBatchResult",
     "Hietogram",
     "BlockHietogram",
     "TriangularHietogram",
@@ -40,3 +45,35 @@ __all__ = [
     "isohyet_method",
     "arithmetic_mean",
 ]
+
+# Submodule defining each re-exported name. Submodules are imported on first
+# access, so using only hyetograms does not load the interpolation code.
+_HIETOGRAM = "hydrolog.precipitation.hietogram"
+_INTERPOLATION = "hydrolog.precipitation.interpolation"
+_LAZY: dict[str, str] = {
+    "HietogramResult": _HIETOGRAM,
+    "HietogramBatchResult": _HIETOGRAM,
+    "Hietogram": _HIETOGRAM,
+    "BlockHietogram": _HIETOGRAM,
+    "TriangularHietogram": _HIETOGRAM,
+    "BetaHietogram": _HIETOGRAM,
+    "EulerIIHietogram": _HIETOGRAM,
+    "Station": _INTERPOLATION,
+    "ThiessenResult": _INTERPOLATION,
+    "IDWResult": _INTERPOLATION,
+    "IsohyetResult": _INTERPOLATION,
+    "thiessen_polygons": _INTERPOLATION,
+    "inverse_distance_weighting": _INTERPOLATION,
+    "areal_precipitation_idw": _INTERPOLATION,
+    "isohyet_method": _INTERPOLATION,
+    "arithmetic_mean": _INTERPOLATION,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve re-exports on first access (PEP 562)."""
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
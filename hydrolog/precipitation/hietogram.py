@@ -2,15 +2,113 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Tuple
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, DTypeLike, NDArray
 
 from hydrolog.exceptions import InvalidParameterError
 
 
-@dataclass
+def _triangular_weights(n_steps: int, peak_idx: int) -> NDArray[np.float64]:
+    """Unnormalized triangular shape rising to 1 at ``peak_idx``."""
+    # Rising limb (0 to peak): 1/(p+1), 2/(p+1), ..., 1
+    rising = np.arange(1, peak_idx + 2, dtype=np.float64) / (peak_idx + 1)
+
+    # Falling limb (peak to end): r/(r+1), ..., 1/(r+1)
+    remaining = n_steps - peak_idx - 1
+    falling = np.arange(remaining, 0, -1, dtype=np.float64) / (remaining + 1)
+
+    return np.concatenate((rising, falling))
+
+
+@lru_cache(maxsize=32)
+def _interval_end_times(n_steps: int, timestep_min: float) -> NDArray[np.float64]:
+    """Times at the end of each interval [min] (read-only, shared).
+
+    Every generator uses the same time axis, so it is built once per
+    (n_steps, timestep_min) instead of on every call.
+    """
+    times = np.arange(1, n_steps + 1, dtype=np.float64) * timestep_min
+    times.setflags(write=False)
+    return times
+
+
+@lru_cache(maxsize=64)
+def _beta_shape(
+    n_steps: int, a_m1: float, b_m1: float
+) -> Optional[NDArray[np.float64]]:
+    """Beta PDF at interval midpoints normalized to unit sum (read-only, shared).
+
+    ``a_m1`` and ``b_m1`` are the PDF exponents ``alpha - 1`` and
+    ``beta - 1``. Design-storm runs repeat the same (n_steps, alpha, beta),
+    so the shape is built once and only scaled per call. Returns None if
+    the PDF underflows to zero everywhere.
+    """
+    # Normalized time: 0 to 1
+    t_mid = np.arange(n_steps, dtype=np.float64)
+    t_mid += 0.5
+    t_mid /= n_steps
+
+    # Beta PDF: f(x) = x^(a-1) * (1-x)^(b-1) / B(a,b)
+    # We don't need the normalizing constant B(a,b) since we normalize anyway.
+    # Midpoints lie in [0.5/n, 1 - 0.5/n] and a-1, b-1 > -1, so each factor is
+    # at most 2n: the PDF is finite by construction (it can only underflow).
+    # The (1-x) factor reuses the t_mid buffer: two arrays instead of five.
+    weights = t_mid**a_m1
+    np.subtract(1.0, t_mid, out=t_mid)
+    t_mid **= b_m1
+    weights *= t_mid
+
+    total = weights.sum()
+    if not total > 0:
+        return None
+    weights /= total
+    weights.setflags(write=False)
+    return weights
+
+
+@lru_cache(maxsize=32)
+def _euler_ii_rank_weights(n_steps: int) -> NDArray[np.float64]:
+    """Ranked Euler II depths, highest first, unit sum (read-only, shared).
+
+    The weights depend only on the number of steps, so the power is
+    evaluated once per storm length.
+    """
+    # Exponential decay approximating the behavior of IDF curves
+    ranks = np.arange(1, n_steps + 1, dtype=np.float64)
+    weights = 1.0 / ranks**0.7  # Decay exponent ~0.7 typical for IDF
+    weights /= weights.sum()
+    weights.setflags(write=False)
+    return weights
+
+
+def _alternating_block_offsets(n_steps: int, peak_idx: int) -> NDArray[np.intp]:
+    """
+    Offsets from the peak for ranks 2..n of an alternating block storm.
+
+    Ranks go alternately before and after the peak (starting before, the
+    Euler II characteristic); once one side is full the rest continue on
+    the other side.
+    Together with the peak itself the offsets cover every step exactly
+    once.
+    """
+    n_left = peak_idx
+    n_right = n_steps - peak_idx - 1
+    n_pairs = min(n_left, n_right)
+    ranks_after_peak = np.arange(1, n_steps)
+    alternating = ranks_after_peak[: 2 * n_pairs]
+    offsets = np.empty(n_steps - 1, dtype=np.intp)
+    offsets[: 2 * n_pairs] = np.where(
+        alternating % 2 == 1, -((alternating + 1) // 2), alternating // 2
+    )
+    tail = ranks_after_peak[2 * n_pairs :] - n_pairs
+    offsets[2 * n_pairs :] = -tail if n_left > n_right else tail
+    return offsets
+
+
+@dataclass(slots=True, frozen=True)
 class HietogramResult:
     """
     Result of hyetograph generation.
@@ -18,9 +116,12 @@ class HietogramResult:
     Attributes
     ----------
     times_min : NDArray[np.float64]
-        Time values at the end of each interval [min].
-    intensities_mm : NDArray[np.float64]
-        Precipitation depths per time step [mm].
+        Time values at the end of each interval [min]. Generated results
+        share one read-only array per (n_steps, timestep_min); copy it
+        before modifying.
+    intensities_mm : NDArray[np.floating]
+        Precipitation depths per time step [mm], float64 unless another
+        ``dtype`` was requested from ``generate()``.
 
         Note: Despite the name, this field contains incremental
         precipitation depths (volume per timestep), not intensity
@@ -35,7 +136,7 @@ class HietogramResult:
     """
 
     times_min: NDArray[np.float64]
-    intensities_mm: NDArray[np.float64]
+    intensities_mm: NDArray[np.floating]
     total_mm: float
     duration_min: float
     timestep_min: float
@@ -46,11 +147,55 @@ class HietogramResult:
         return len(self.times_min)
 
     @property
-    def intensity_mm_per_h(self) -> NDArray[np.float64]:
+    def intensity_mm_per_h(self) -> NDArray[np.floating]:
         """Precipitation intensity [mm/h]."""
         return self.intensities_mm * (60.0 / self.timestep_min)
 
 
+@dataclass(slots=True, frozen=True)
+class HietogramBatchResult:
+    """
+    Result of batch hyetograph generation (many storm depths at once).
+
+    Attributes
+    ----------
+    times_min : NDArray[np.float64]
+        Time values at the end of each interval [min], shared by all rows
+        (read-only).
+    intensities_mm : NDArray[np.floating]
+        Precipitation depths per time step [mm], shape
+        (n_hietograms, n_steps). Row ``i`` distributes ``total_mm[i]``.
+        float64 unless another ``dtype`` was requested.
+    total_mm : NDArray[np.float64]
+        Total precipitation depth of each hyetograph [mm].
+    duration_min : float
+        Total duration [min].
+    timestep_min : float
+        Time step [min].
+    """
+
+    times_min: NDArray[np.float64]
+    intensities_mm: NDArray[np.floating]
+    total_mm: NDArray[np.float64]
+    duration_min: float
+    timestep_min: float
+
+    @property
+    def n_steps(self) -> int:
+        """Number of time steps."""
+        return len(self.times_min)
+
+    @property
+    def n_hietograms(self) -> int:
+        """Number of hyetographs (rows of the depth matrix)."""
+        return int(self.intensities_mm.shape[0])
+
+    @property
+    def intensity_mm_per_h(self) -> NDArray[np.floating]:
+        """Precipitation intensity [mm/h], same shape as ``intensities_mm``."""
+        return self.intensities_mm * (60.0 / self.timestep_min)
+
+
 class Hietogram(ABC):
     """
     Abstract base class for hyetograph generators.
@@ -65,6 +210,7 @@ class Hietogram(ABC):
         total_mm: float,
         duration_min: float,
         timestep_min: float = 5.0,
+        dtype: DTypeLike = np.float64,
     ) -> HietogramResult:
         """
         Generate hyetograph.
@@ -77,14 +223,117 @@ class Hietogram(ABC):
             Duration of the storm event [min].
         timestep_min : float, optional
             Time step for discretization [min], by default 5.0.
+        dtype : DTypeLike, optional
+            Floating-point type of the depths, by default float64.
+            ``np.float32`` is accurate enough for operational design
+            storms (IDF depths are known to a few significant figures)
+            and halves the size of the result; the shape is still
+            computed in float64 and the time axis stays float64.
 
         Returns
         -------
         HietogramResult
             Generated hyetograph with times and intensities.
+
+        Raises
+        ------
+        InvalidParameterError
+            If any parameter is invalid or dtype is not a floating-point
+            type.
         """
         pass
 
+    def generate_batch(
+        self,
+        total_mm: ArrayLike,
+        duration_min: float,
+        timestep_min: float = 5.0,
+        dtype: DTypeLike = np.float64,
+    ) -> HietogramBatchResult:
+        """
+        Generate hyetographs of the same shape for many storm depths.
+
+        The temporal distribution depends only on the duration, time step
+        and the generator's shape parameters, so it is computed once and
+        scaled by every depth in a single outer product. Row ``i`` matches
+        ``generate(total_mm[i], duration_min, timestep_min).intensities_mm``
+        up to floating-point rounding.
+
+        Parameters
+        ----------
+        total_mm : ArrayLike
+            Total precipitation depths [mm]. Must be positive.
+        duration_min : float
+            Duration of the storm event [min].
+        timestep_min : float, optional
+            Time step for discretization [min], by default 5.0.
+        dtype : DTypeLike, optional
+            Floating-point type of the depth matrix, by default float64.
+
+        Returns
+        -------
+        HietogramBatchResult
+            Common time axis and the (n, n_steps) matrix of depths.
+
+        Raises
+        ------
+        InvalidParameterError
+            If any depth is not positive, the duration and time step
+            are invalid, or dtype is not a floating-point type.
+
+        Examples
+        --------
+        >>> result = BlockHietogram().generate_batch([30.0, 60.0], 60.0, 10.0)
+        >>> result.intensities_mm
+        array([[ 5.,  5.,  5.,  5.,  5.,  5.],
+               [10., 10., 10., 10., 10., 10.]])
+        """
+        totals = np.ravel(np.asarray(total_mm, dtype=np.float64))
+        if not np.all(totals > 0):
+            raise InvalidParameterError("all total_mm values must be positive")
+        self._validate_dtype(dtype)
+
+        # Unit-depth hyetograph (validates duration and time step)
+        unit = self.generate(1.0, duration_min, timestep_min)
+
+        return HietogramBatchResult(
+            times_min=unit.times_min,
+            intensities_mm=np.multiply.outer(totals, unit.intensities_mm, dtype=dtype),
+            total_mm=totals,
+            duration_min=duration_min,
+            timestep_min=timestep_min,
+        )
+
+    @staticmethod
+    def _clamp_peak(n_steps: int, peak_position: float) -> int:
+        """
+        Index of the peak step for a relative peak position.
+
+        The peak is kept off the first step and inside the storm; a
+        single-step storm peaks at step 0.
+
+        Returns
+        -------
+        int
+            Peak index in ``[1, n_steps - 1]`` (0 if ``n_steps`` is 1).
+        """
+        return min(max(int(n_steps * peak_position), 1), n_steps - 1)
+
+    @staticmethod
+    def _validate_dtype(dtype: DTypeLike) -> None:
+        """
+        Check that dtype is a floating-point type.
+
+        Raises
+        ------
+        InvalidParameterError
+            If dtype is not a floating-point type.
+        """
+        if dtype is not np.float64 and not np.issubdtype(dtype, np.floating):
+            raise InvalidParameterError(
+                f"dtype must be a floating-point type, got {np.dtype(dtype)}"
+            )
+
     @staticmethod
     def _validate_params(
         total_mm: float, duration_min: float, timestep_min: float
@@ -102,6 +351,12 @@ class Hietogram(ABC):
         InvalidParameterError
             If any parameter is invalid.
         """
+        # Fast path for valid input: 0 < timestep <= duration guarantees at
+        # least one step. Anything else (including NaN) takes the detailed
+        # checks below, which keep their original order and messages.
+        if 0 < timestep_min <= duration_min and total_mm > 0:
+            return int(duration_min / timestep_min)
+
         if total_mm <= 0:
             raise InvalidParameterError(f"total_mm must be positive, got {total_mm}")
         if duration_min <= 0:
@@ -114,7 +369,8 @@ class Hietogram(ABC):
             )
         if timestep_min > duration_min:
             raise InvalidParameterError(
-                f"timestep_min ({timestep_min}) cannot exceed duration_min ({duration_min})"
+                f"timestep_min ({timestep_min}) cannot exceed "
+                f"duration_min ({duration_min})"
             )
 
         n_steps = int(duration_min / timestep_min)
@@ -146,6 +402,7 @@ class BlockHietogram(Hietogram):
         total_mm: float,
         duration_min: float,
         timestep_min: float = 5.0,
+        dtype: DTypeLike = np.float64,
     ) -> HietogramResult:
         """
         Generate block (uniform) hyetograph.
@@ -158,6 +415,8 @@ class BlockHietogram(Hietogram):
             Duration of the storm event [min].
         timestep_min : float, optional
             Time step for discretization [min], by default 5.0.
+        dtype : DTypeLike, optional
+            Floating-point type of the depths, by default float64.
 
         Returns
         -------
@@ -172,13 +431,16 @@ class BlockHietogram(Hietogram):
         Total: 30.0 mm
         """
         n_steps = self._validate_params(total_mm, duration_min, timestep_min)
+        self._validate_dtype(dtype)
 
         # Uniform distribution: equal intensity in each step
         intensity_per_step = total_mm / n_steps
-        intensities = np.full(n_steps, intensity_per_step, dtype=np.float64)
+        # Materialized rather than a broadcast view: depths of every
+        # generator are a writable array owned by the result
+        intensities = np.full(n_steps, intensity_per_step, dtype=dtype)
 
         # Time at end of each interval
-        times = np.arange(1, n_steps + 1, dtype=np.float64) * timestep_min
+        times = _interval_end_times(n_steps, timestep_min)
 
         return HietogramResult(
             times_min=times,
@@ -233,6 +495,7 @@ class TriangularHietogram(Hietogram):
         total_mm: float,
         duration_min: float,
         timestep_min: float = 5.0,
+        dtype: DTypeLike = np.float64,
     ) -> HietogramResult:
         """
         Generate triangular hyetograph.
@@ -245,6 +508,8 @@ class TriangularHietogram(Hietogram):
             Duration of the storm event [min].
         timestep_min : float, optional
             Time step for discretization [min], by default 5.0.
+        dtype : DTypeLike, optional
+            Floating-point type of the depths, by default float64.
 
         Returns
         -------
@@ -252,33 +517,22 @@ class TriangularHietogram(Hietogram):
             Generated hyetograph with triangular distribution.
         """
         n_steps = self._validate_params(total_mm, duration_min, timestep_min)
+        self._validate_dtype(dtype)
 
         # Create triangular distribution
         # Peak at relative position
-        peak_idx = int(n_steps * self.peak_position)
-        if peak_idx == 0:
-            peak_idx = 1
-        if peak_idx >= n_steps:
-            peak_idx = n_steps - 1
+        peak_idx = self._clamp_peak(n_steps, self.peak_position)
 
         # Build triangular shape
-        intensities = np.zeros(n_steps, dtype=np.float64)
-
-        # Rising limb (0 to peak)
-        for i in range(peak_idx + 1):
-            intensities[i] = (i + 1) / (peak_idx + 1)
-
-        # Falling limb (peak to end)
-        remaining = n_steps - peak_idx - 1
-        if remaining > 0:
-            for i in range(remaining):
-                intensities[peak_idx + 1 + i] = (remaining - i) / (remaining + 1)
+        intensities = _triangular_weights(n_steps, peak_idx)
 
         # Normalize to total precipitation
-        intensities = intensities / intensities.sum() * total_mm
+        intensities /= intensities.sum()
+        intensities *= total_mm
+        intensities = intensities.astype(dtype, copy=False)
 
         # Time at end of each interval
-        times = np.arange(1, n_steps + 1, dtype=np.float64) * timestep_min
+        times = _interval_end_times(n_steps, timestep_min)
 
         return HietogramResult(
             times_min=times,
@@ -342,11 +596,34 @@ class BetaHietogram(Hietogram):
         self.alpha = alpha
         self.beta = beta
 
+    @property
+    def alpha(self) -> float:
+        """Alpha parameter of the Beta distribution."""
+        return self._alpha
+
+    @alpha.setter
+    def alpha(self, value: float) -> None:
+        self._alpha = value
+        # PDF exponent, kept in step with alpha for generate()
+        self._a_m1 = value - 1.0
+
+    @property
+    def beta(self) -> float:
+        """Beta parameter of the Beta distribution."""
+        return self._beta
+
+    @beta.setter
+    def beta(self, value: float) -> None:
+        self._beta = value
+        # PDF exponent, kept in step with beta for generate()
+        self._b_m1 = value - 1.0
+
     def generate(
         self,
         total_mm: float,
         duration_min: float,
         timestep_min: float = 5.0,
+        dtype: DTypeLike = np.float64,
     ) -> HietogramResult:
         """
         Generate Beta distribution hyetograph.
@@ -359,6 +636,8 @@ class BetaHietogram(Hietogram):
             Duration of the storm event [min].
         timestep_min : float, optional
             Time step for discretization [min], by default 5.0.
+        dtype : DTypeLike, optional
+            Floating-point type of the depths, by default float64.
 
         Returns
         -------
@@ -366,27 +645,20 @@ class BetaHietogram(Hietogram):
             Generated hyetograph with Beta distribution.
         """
         n_steps = self._validate_params(total_mm, duration_min, timestep_min)
+        self._validate_dtype(dtype)
 
         # Generate Beta distribution PDF values at interval midpoints
-        # Normalized time: 0 to 1
-        t_mid = (np.arange(n_steps) + 0.5) / n_steps
-
-        # Beta PDF: f(x) = x^(a-1) * (1-x)^(b-1) / B(a,b)
-        # We don't need the normalizing constant B(a,b) since we normalize anyway
-        intensities = (t_mid ** (self.alpha - 1)) * ((1 - t_mid) ** (self.beta - 1))
-
-        # Handle edge cases where intensities might be 0 or inf
-        intensities = np.nan_to_num(intensities, nan=0.0, posinf=0.0, neginf=0.0)
+        shape = _beta_shape(n_steps, self._a_m1, self._b_m1)
 
-        # Normalize to total precipitation
-        if intensities.sum() > 0:
-            intensities = intensities / intensities.sum() * total_mm
+        # Scale to total precipitation
+        if shape is not None:
+            intensities = np.multiply(shape, total_mm, dtype=dtype)
         else:
             # Fallback to uniform if Beta gives all zeros
-            intensities = np.full(n_steps, total_mm / n_steps, dtype=np.float64)
+            intensities = np.full(n_steps, total_mm / n_steps, dtype=dtype)
 
         # Time at end of each interval
-        times = np.arange(1, n_steps + 1, dtype=np.float64) * timestep_min
+        times = _interval_end_times(n_steps, timestep_min)
 
         return HietogramResult(
             times_min=times,
@@ -396,6 +668,161 @@ class BetaHietogram(Hietogram):
             timestep_min=timestep_min,
         )
 
+    def specialize(
+        self,
+        duration_min: float,
+        timestep_min: float = 5.0,
+        dtype: DTypeLike = np.float64,
+    ) -> Callable[[float], NDArray[np.floating]]:
+        """
+        Build a depth generator for a fixed storm duration and time step.
+
+        Design-storm sweeps often keep the duration, time step, alpha and
+        beta fixed and vary only the total depth. The returned function
+        validates and computes the shape once; each call then only checks
+        the depth and scales the shape, returning the same depths as
+        ``generate(total_mm, duration_min, timestep_min, dtype)``.
+
+        Parameters
+        ----------
+        duration_min : float
+            Duration of the storm event [min].
+        timestep_min : float, optional
+            Time step for discretization [min], by default 5.0.
+        dtype : DTypeLike, optional
+            Floating-point type of the depths, by default float64.
+
+        Returns
+        -------
+        Callable[[float], NDArray[np.floating]]
+            Function mapping a total depth [mm] to depths per time step
+            [mm]. It uses alpha and beta as they were when ``specialize``
+            was called.
+
+        Raises
+        ------
+        InvalidParameterError
+            If the duration and time step are invalid or dtype is not a
+            floating-point type. The returned function raises it for a
+            non-positive depth.
+
+        Examples
+        --------
+        >>> depths = BetaHietogram(alpha=2.0, beta=5.0).specialize(60.0, 10.0)
+        >>> print(f"{depths(30.0).sum():.1f} mm")
+        30.0 mm
+        """
+        n_steps = self._validate_params(1.0, duration_min, timestep_min)
+        self._validate_dtype(dtype)
+
+        shape = _beta_shape(n_steps, self._a_m1, self._b_m1)
+
+        def depths(total_mm: float) -> NDArray[np.floating]:
+            if not total_mm > 0:
+                raise InvalidParameterError(
+                    f"total_mm must be positive, got {total_mm}"
+                )
+            if shape is None:
+                # Same uniform fallback as generate()
+                return np.full(n_steps, total_mm / n_steps, dtype=dtype)
+            return np.multiply(shape, total_mm, dtype=dtype)
+
+        return depths
+
+    @staticmethod
+    def generate_ensemble(
+        total_mm: ArrayLike,
+        alpha: ArrayLike,
+        beta: ArrayLike,
+        duration_min: float,
+        timestep_min: float = 5.0,
+        dtype: DTypeLike = np.float64,
+    ) -> HietogramBatchResult:
+        """
+        Generate Beta hyetographs for many parameter sets at once.
+
+        ``total_mm``, ``alpha`` and ``beta`` are broadcast against each
+        other, so a parameter sweep can share one depth (and vice versa).
+        All shapes are evaluated in one pass over an (n, n_steps) grid;
+        row ``i`` matches ``BetaHietogram(alpha[i], beta[i]).generate(
+        total_mm[i], duration_min, timestep_min)`` up to floating-point
+        rounding.
+
+        Parameters
+        ----------
+        total_mm : ArrayLike
+            Total precipitation depths [mm]. Must be positive.
+        alpha : ArrayLike
+            Alpha parameters of the Beta distribution. Must be positive.
+        beta : ArrayLike
+            Beta parameters of the Beta distribution. Must be positive.
+        duration_min : float
+            Duration of the storm event [min].
+        timestep_min : float, optional
+            Time step for discretization [min], by default 5.0.
+        dtype : DTypeLike, optional
+            Floating-point type of the depth matrix, by default float64.
+
+        Returns
+        -------
+        HietogramBatchResult
+            Common time axis and the (n, n_steps) matrix of depths.
+
+        Raises
+        ------
+        InvalidParameterError
+            If any parameter is not positive, the parameter lengths cannot
+            be broadcast together, the duration and time step are invalid,
+            or dtype is not a floating-point type.
+
+        Examples
+        --------
+        >>> result = BetaHietogram.generate_ensemble(
+        ...     30.0, alpha=[2.0, 5.0], beta=[5.0, 2.0], duration_min=60.0
+        ... )
+        >>> result.intensities_mm.shape
+        (2, 12)
+        """
+        arrays = []
+        for name, values in (("total_mm", total_mm), ("alpha", alpha), ("beta", beta)):
+            array = np.ravel(np.asarray(values, dtype=np.float64))
+            if not np.all(array > 0):
+                raise InvalidParameterError(f"all {name} values must be positive")
+            arrays.append(array)
+        try:
+            totals, alphas, betas = np.broadcast_arrays(*arrays)
+        except ValueError:
+            raise InvalidParameterError(
+                f"total_mm, alpha, beta have incompatible lengths: "
+                f"{', '.join(str(array.size) for array in arrays)}"
+            ) from None
+
+        n_steps = Hietogram._validate_params(1.0, duration_min, timestep_min)
+        Hietogram._validate_dtype(dtype)
+
+        # Same PDF as _beta_shape(), one row per parameter set
+        t_mid = (np.arange(n_steps) + 0.5) / n_steps
+        weights = t_mid ** (alphas[:, np.newaxis] - 1)
+        weights *= (1 - t_mid) ** (betas[:, np.newaxis] - 1)
+
+        # Rows whose PDF underflows to zero fall back to uniform
+        sums = weights.sum(axis=1)
+        underflow = ~(sums > 0)
+        if underflow.any():
+            weights[underflow] = 1.0
+            sums[underflow] = n_steps
+
+        weights /= sums[:, np.newaxis]
+        weights *= totals[:, np.newaxis]
+
+        return HietogramBatchResult(
+            times_min=_interval_end_times(n_steps, timestep_min),
+            intensities_mm=weights.astype(dtype, copy=False),
+            total_mm=np.array(totals),
+            duration_min=duration_min,
+            timestep_min=timestep_min,
+        )
+
 
 class EulerIIHietogram(Hietogram):
     """
@@ -466,6 +893,7 @@ class EulerIIHietogram(Hietogram):
         total_mm: float,
         duration_min: float,
         timestep_min: float = 5.0,
+        dtype: DTypeLike = np.float64,
     ) -> HietogramResult:
         """
         Generate DVWK Euler Type II hyetograph.
@@ -478,6 +906,8 @@ class EulerIIHietogram(Hietogram):
             Duration of the storm event [min].
         timestep_min : float, optional
             Time step for discretization [min], by default 5.0.
+        dtype : DTypeLike, optional
+            Floating-point type of the depths, by default float64.
 
         Returns
         -------
@@ -492,49 +922,27 @@ class EulerIIHietogram(Hietogram):
         Peak intensity: 12.47 mm
         """
         n_steps = self._validate_params(total_mm, duration_min, timestep_min)
+        self._validate_dtype(dtype)
 
-        # Generate ranked intensities using exponential decay
-        # This approximates the behavior of IDF curves
-        ranks = np.arange(1, n_steps + 1, dtype=np.float64)
-        ranked_intensities = 1.0 / ranks**0.7  # Decay exponent ~0.7 typical for IDF
-
-        # Normalize ranked intensities
-        ranked_intensities = ranked_intensities / ranked_intensities.sum()
+        # Ranked intensities (highest first), normalized to unit sum
+        ranked_intensities = _euler_ii_rank_weights(n_steps)
 
         # Place intensities using alternating block method
         # Peak at specified position
-        peak_idx = int(n_steps * self.peak_position)
-        if peak_idx == 0:
-            peak_idx = 1
-        if peak_idx >= n_steps:
-            peak_idx = n_steps - 1
+        peak_idx = self._clamp_peak(n_steps, self.peak_position)
 
-        intensities = np.zeros(n_steps, dtype=np.float64)
+        offsets = _alternating_block_offsets(n_steps, peak_idx)
+        # The peak plus its offsets index every step exactly once, so the
+        # buffer needs no zero fill
+        intensities = np.empty(n_steps, dtype=dtype)
         intensities[peak_idx] = ranked_intensities[0]  # Highest at peak
-
-        # Alternate placement: before and after peak
-        left_idx = peak_idx - 1
-        right_idx = peak_idx + 1
-        place_left = True  # Start by placing to the left (Euler II characteristic)
-
-        for i in range(1, n_steps):
-            if place_left and left_idx >= 0:
-                intensities[left_idx] = ranked_intensities[i]
-                left_idx -= 1
-                place_left = False
-            elif right_idx < n_steps:
-                intensities[right_idx] = ranked_intensities[i]
-                right_idx += 1
-                place_left = True
-            elif left_idx >= 0:
-                intensities[left_idx] = ranked_intensities[i]
-                left_idx -= 1
+        intensities[peak_idx + offsets] = ranked_intensities[1:]
 
         # Scale to total precipitation
-        intensities = intensities * total_mm
+        intensities *= total_mm
 
         # Time at end of each interval
-        times = np.arange(1, n_steps + 1, dtype=np.float64) * timestep_min
+        times = _interval_end_times(n_steps, timestep_min)
 
         return HietogramResult(
             times_min=times,
@@ -1049,7 +1049,7 @@ class TableGenerator:
     @staticmethod
     def precipitation_table(
         times: NDArray[np.float64],
-        precip_mm: NDArray[np.float64],
+        precip_mm: NDArray[np.floating],
         effective_mm: Optional[NDArray[np.float64]] = None,
         max_rows: int = 30,
     ) -> str:
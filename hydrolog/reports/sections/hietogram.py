@@ -22,7 +22,7 @@ def generate_hietogram_section(
     duration_min: float,
     timestep_min: float,
     times_min: NDArray[np.float64],
-    intensities_mm: NDArray[np.float64],
+    intensities_mm: NDArray[np.floating],
     distribution: str = "beta",
     distribution_params: Optional[str] = None,
     include_table: bool = True,
@@ -41,7 +41,7 @@ def generate_hietogram_section(
         Time step [min].
     times_min : NDArray[np.float64]
         Time values at end of each interval [min].
-    intensities_mm : NDArray[np.float64]
+    intensities_mm : NDArray[np.floating]
         Precipitation depth in each interval [mm].
     distribution : str, optional
         Distribution type ("beta", "block", "triangular", "euler_ii").
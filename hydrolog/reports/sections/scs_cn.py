@@ -28,7 +28,7 @@ def generate_scs_cn_section(
     total_effective_mm: float,
     ia_coefficient: float = 0.2,
     times_min: Optional[NDArray[np.float64]] = None,
-    precip_mm: Optional[NDArray[np.float64]] = None,
+    precip_mm: Optional[NDArray[np.floating]] = None,
     effective_mm: Optional[NDArray[np.float64]] = None,
     include_formulas: bool = True,
     include_table: bool = True,
@@ -57,7 +57,7 @@ def generate_scs_cn_section(
         Initial abstraction coefficient, by default 0.2.
     times_min : NDArray[np.float64], optional
         Time values [min] for distribution table.
-    precip_mm : NDArray[np.float64], optional
+    precip_mm : NDArray[np.floating], optional
         Precipitation in each interval [mm].
     effective_mm : NDArray[np.float64], optional
         Effective precipitation in each interval [mm].
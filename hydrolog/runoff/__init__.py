@@ -2,6 +2,7 @@
 
 from hydrolog.runoff.clark_iuh import ClarkIUH, ClarkIUHResult, ClarkUHResult
 from hydrolog.runoff.cn_lookup import (
+    CATEGORIZED_COVERS,
     CNLookupResult,
     HydrologicCondition,
     LandCover,
@@ -9,6 +10,7 @@ from hydrolog.runoff.cn_lookup import (
     get_cn,
     get_cn_range,
     list_land_covers,
+    list_land_covers_by_category,
     lookup_cn,
 )
 from hydrolog.runoff.convolution import HydrographResult, convolve_discrete
@@ -21,7 +23,11 @@ from hydrolog.runoff.nash_iuh import (
 )
 from hydrolog.runoff.scs_cn import AMC, SCSCN, EffectivePrecipitationResult
 from hydrolog.runoff.snyder_uh import SnyderUH, SnyderUHResult
-from hydrolog.runoff.unit_hydrograph import SCSUnitHydrograph, UnitHydrographResult
+from hydrolog.runoff.unit_hydrograph import (
+    SCSUnitHydrograph,
+    UnitHydrographBatchResult,
+    UnitHydrographResult,
+)
 
 __all__ = [
     # Main generator
@@ -36,6 +42,8 @@ __all__ = [
     "lookup_cn",
     "get_cn_range",
     "list_land_covers",
+    "list_land_covers_by_category",
+    "CATEGORIZED_COVERS",
     "calculate_weighted_cn",
     "LandCover",
     "HydrologicCondition",
@@ -43,6 +51,7 @@ __all__ = [
     # Unit hydrograph (SCS)
     "SCSUnitHydrograph",
     "UnitHydrographResult",
+    "UnitHydrographBatchResult",
     # Instantaneous Unit Hydrograph (Nash)
     "NashIUH",
     "IUHResult",
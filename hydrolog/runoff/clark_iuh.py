@@ -254,9 +254,12 @@ class ClarkIUH:
         NDArray[np.float64]
             Incremental area fractions for each time interval.
         """
-        # Calculate cumulative fractions
-        cumulative = np.array(
-            [self.cumulative_time_area(t) for t in times_min], dtype=np.float64
+        # Calculate cumulative fractions (vectorized cumulative_time_area)
+        tau = np.clip(np.asarray(times_min, dtype=np.float64) / self.tc_min, 0.0, 1.0)
+        cumulative = np.where(
+            tau <= 0.5,
+            1.414 * tau**1.5,
+            1.0 - 1.414 * (1.0 - tau) ** 1.5,
         )
 
         # Calculate incremental (difference)
@@ -282,16 +285,23 @@ class ClarkIUH:
         NDArray[np.float64]
             Routed outflow hydrograph.
         """
+        from scipy.signal import lfilter
+
         # Routing coefficient
         c1 = timestep_min / (2.0 * self.r_min + timestep_min)
 
         # Initialize output array
         outflow = np.zeros_like(inflow)
 
-        # Route through reservoir
-        for i in range(1, len(inflow)):
-            outflow[i] = outflow[i - 1] + c1 * (
-                inflow[i] + inflow[i - 1] - 2.0 * outflow[i - 1]
+        # O[i] = O[i-1] + c1 * (I[i] + I[i-1] - 2 * O[i-1]) is a first-order
+        # IIR filter: O[i] = c1 * I[i] + c1 * I[i-1] + (1 - 2 * c1) * O[i-1].
+        # lfilter runs the recurrence in C; zi carries I[0] (with O[0] = 0).
+        if len(inflow) > 1:
+            outflow[1:], _ = lfilter(
+                [c1, c1],
+                [1.0, 2.0 * c1 - 1.0],
+                inflow[1:],
+                zi=[c1 * inflow[0]],
             )
 
         return outflow
@@ -12,7 +12,8 @@ Reference:
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Union
 
 from hydrolog.exceptions import InvalidParameterError
 
@@ -73,6 +74,32 @@ class LandCover(Enum):
     WATER = "water"
 
 
+# Land cover types grouped by TR-55 category (display order)
+CATEGORIZED_COVERS: Mapping[str, Tuple[LandCover, ...]] = MappingProxyType(
+    {
+        "Agricultural": (
+            LandCover.FALLOW,
+            LandCover.ROW_CROPS,
+            LandCover.SMALL_GRAIN,
+            LandCover.PASTURE,
+            LandCover.MEADOW,
+        ),
+        "Natural": (LandCover.BRUSH, LandCover.FOREST, LandCover.HERBACEOUS),
+        "Developed": (
+            LandCover.FARMSTEAD,
+            LandCover.RESIDENTIAL_LOW,
+            LandCover.RESIDENTIAL_MEDIUM,
+            LandCover.RESIDENTIAL_HIGH,
+            LandCover.COMMERCIAL,
+            LandCover.INDUSTRIAL,
+            LandCover.OPEN_SPACE,
+        ),
+        "Impervious": (LandCover.PAVED, LandCover.GRAVEL, LandCover.DIRT),
+        "Water": (LandCover.WATER,),
+    }
+)
+
+
 # CN lookup tables from TR-55
 # Format: {(LandCover, HydrologicCondition): {"A": cn, "B": cn, "C": cn, "D": cn}}
 # For land covers without condition variation, use None as condition key
@@ -415,6 +442,25 @@ def list_land_covers() -> Dict[str, str]:
     return {lc.name: lc.value for lc in LandCover}
 
 
+def list_land_covers_by_category() -> Iterator[Tuple[str, str, str]]:
+    """
+    Iterate over land cover types grouped by TR-55 category.
+
+    Yields
+    ------
+    tuple[str, str, str]
+        (category, enum name, enum value), in ``CATEGORIZED_COVERS`` order.
+
+    Examples
+    --------
+    >>> next(list_land_covers_by_category())
+    ('Agricultural', 'FALLOW', 'fallow')
+    """
+    for category, covers in CATEGORIZED_COVERS.items():
+        for lc in covers:
+            yield category, lc.name, lc.value
+
+
 def calculate_weighted_cn(
     cn_area_pairs: list[Tuple[int, float]],
 ) -> float:
@@ -20,16 +20,32 @@ KZGW (2017). Aktualizacja metodyki obliczania przepływów i opadów
 maksymalnych. Załącznik 2, Tabela C.2.
 """
 
+import math
 import warnings
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Union
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 from scipy.optimize import brentq
 from scipy.special import gamma
 
 from hydrolog.exceptions import InvalidParameterError
+from hydrolog.runoff.unit_hydrograph import (
+    UnitHydrographBatchResult,
+    _broadcast_positive,
+)
+
+
+@lru_cache(maxsize=1024)
+def _nash_log_norm(n: float, k_min: float) -> float:
+    """Log of the Nash IUH normalization constant, ln(K · Γ(n)).
+
+    Cached so that parameter sweeps re-creating NashIUH with repeated
+    (n, K) pairs do not recompute the log-gamma function.
+    """
+    return math.lgamma(n) + math.log(k_min)
 
 
 @dataclass
@@ -318,10 +334,13 @@ class NashIUH:
         if self.n <= 1:
             return 1.0 / self.k_min
 
+        # Log space: (n-1)^(n-1) and Γ(n) overflow separately for large n
         n_minus_1 = self.n - 1
-        numerator = (n_minus_1**n_minus_1) * np.exp(-n_minus_1)
-        denominator = self.k_min * gamma(self.n)
-        return float(numerator / denominator)
+        return math.exp(
+            n_minus_1 * math.log(n_minus_1)
+            - n_minus_1
+            - _nash_log_norm(self.n, self.k_min)
+        )
 
     def ordinate(self, t_min: float) -> float:
         """
@@ -341,8 +360,11 @@ class NashIUH:
             return 0.0
 
         t_over_k = t_min / self.k_min
-        coefficient = 1.0 / (self.k_min * gamma(self.n))
-        return float(coefficient * (t_over_k ** (self.n - 1)) * np.exp(-t_over_k))
+        return math.exp(
+            (self.n - 1) * math.log(t_over_k)
+            - t_over_k
+            - _nash_log_norm(self.n, self.k_min)
+        )
 
     def generate(
         self,
@@ -455,12 +477,13 @@ class NashIUH:
         n_steps = int(np.ceil(duration_min / timestep_min)) + 1
         times = np.arange(n_steps, dtype=np.float64) * timestep_min
 
-        # Calculate ordinates using vectorized operations
+        # Evaluate the Gamma PDF in log space in a single pass:
+        # ln u = (n-1) ln(t/K) - t/K - ln Γ(n) - ln K
+        # (stable for large n, where Γ(n) and (t/K)^(n-1) overflow)
         ordinates = np.zeros(n_steps, dtype=np.float64)
-        mask = times > 0
-        t_over_k = times[mask] / self.k_min
-        coefficient = 1.0 / (self.k_min * gamma(self.n))
-        ordinates[mask] = coefficient * (t_over_k ** (self.n - 1)) * np.exp(-t_over_k)
+        t_over_k = times[1:] / self.k_min  # times[0] == 0, u(0) = 0
+        log_norm = _nash_log_norm(self.n, self.k_min)
+        np.exp((self.n - 1) * np.log(t_over_k) - t_over_k - log_norm, out=ordinates[1:])
 
         return IUHResult(
             times_min=times,
@@ -584,6 +607,98 @@ class NashIUH:
             k_min=self.k_min,
         )
 
+    @staticmethod
+    def to_unit_hydrograph_batch(
+        n: ArrayLike,
+        k_min: ArrayLike,
+        area_km2: ArrayLike,
+        duration_min: ArrayLike,
+        timestep_min: float = 5.0,
+    ) -> UnitHydrographBatchResult:
+        """
+        Convert many Nash IUHs to D-minute unit hydrographs at once.
+
+        Parameters are broadcast against each other (e.g. one ``n`` with
+        many ``k_min`` values for a sensitivity sweep). The S-curves of all
+        hydrographs are evaluated with a single broadcast call to the
+        regularized incomplete gamma function; row ``i`` matches
+        ``NashIUH(n[i], k_min[i]).to_unit_hydrograph(area_km2[i], ...)``
+        over its own time base.
+
+        Parameters
+        ----------
+        n : ArrayLike
+            Numbers of reservoirs. Must be positive.
+        k_min : ArrayLike
+            Reservoir storage constants [min]. Must be positive.
+        area_km2 : ArrayLike
+            Watershed areas [km²]. Must be positive.
+        duration_min : ArrayLike
+            Rainfall durations D [min]; a scalar is shared by all
+            hydrographs. Must be positive.
+        timestep_min : float, optional
+            Time step for discretization [min], by default 5.0.
+
+        Returns
+        -------
+        UnitHydrographBatchResult
+            Common time axis (largest 5 × lag time + D) and the
+            ordinate matrix [m³/s per mm].
+
+        Raises
+        ------
+        InvalidParameterError
+            If any parameter is not positive or the parameter lengths
+            cannot be broadcast together.
+
+        Examples
+        --------
+        >>> result = NashIUH.to_unit_hydrograph_batch(
+        ...     n=3.0, k_min=[20.0, 30.0], area_km2=45.0, duration_min=10.0
+        ... )
+        >>> result.n_hydrographs
+        2
+        """
+        from scipy.special import gammainc
+
+        if timestep_min <= 0:
+            raise InvalidParameterError(
+                f"timestep_min must be positive, got {timestep_min}"
+            )
+
+        n_arr, k_arr, area, duration = _broadcast_positive(
+            n=n, k_min=k_min, area_km2=area_km2, duration_min=duration_min
+        )
+
+        total_duration_min = float((5.0 * (n_arr * k_arr) + duration).max())
+        n_steps = int(np.ceil(total_duration_min / timestep_min)) + 1
+        times = np.arange(n_steps, dtype=np.float64) * timestep_min
+
+        # S(t) = P(n, t/K) for t > 0, else 0; gammainc(n, 0) == 0, so
+        # clipping negative (shifted) times to zero matches _s_curve()
+        shape = n_arr[:, np.newaxis]
+        scale = k_arr[:, np.newaxis]
+        d_col = duration[:, np.newaxis]
+        s_curve = gammainc(shape, times / scale)
+        s_curve_shifted = gammainc(shape, np.maximum(times - d_col, 0.0) / scale)
+        uh_dimensionless = (s_curve - s_curve_shifted) / d_col
+
+        volume_m3_per_mm = area[:, np.newaxis] * 1000.0
+        ordinates_m3s = uh_dimensionless * volume_m3_per_mm / 60.0
+
+        peak_idx = np.argmax(ordinates_m3s, axis=1)
+        peak_discharge = np.take_along_axis(
+            ordinates_m3s, peak_idx[:, np.newaxis], axis=1
+        )[:, 0]
+
+        return UnitHydrographBatchResult(
+            times_min=times,
+            ordinates_m3s=ordinates_m3s,
+            time_to_peak_min=times[peak_idx],
+            peak_discharge_m3s=peak_discharge,
+            timestep_min=timestep_min,
+        )
+
     def _s_curve(self, times: NDArray[np.float64]) -> NDArray[np.float64]:
         """
         Compute S-curve (cumulative IUH).
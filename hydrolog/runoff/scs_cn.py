@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Union
+from typing import Optional, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -49,6 +49,10 @@ class EffectivePrecipitationResult:
         Initial abstraction Ia [mm].
     cn_adjusted : int
         CN value used (adjusted for AMC if applicable).
+    runoff_coefficient : float, optional
+        Runoff coefficient C = Pe_total / P_total (0 when P_total is 0).
+        Always set by :meth:`SCSCN.effective_precipitation`; None for
+        results constructed without it.
     """
 
     effective_mm: Union[NDArray[np.float64], float]
@@ -56,6 +60,7 @@ class EffectivePrecipitationResult:
     retention_mm: float
     initial_abstraction_mm: float
     cn_adjusted: int
+    runoff_coefficient: Optional[float] = None
 
 
 class SCSCN:
@@ -212,7 +217,7 @@ class SCSCN:
 
     def effective_precipitation(
         self,
-        precipitation_mm: Union[NDArray[np.float64], float, list],
+        precipitation_mm: Union[NDArray[np.floating], float, list],
         amc: AMC = AMC.II,
     ) -> EffectivePrecipitationResult:
         """
@@ -220,7 +225,7 @@ class SCSCN:
 
         Parameters
         ----------
-        precipitation_mm : NDArray[np.float64] | float | list
+        precipitation_mm : NDArray[np.floating] | float | list
             Precipitation depth(s) [mm]. Can be:
             - Single value (total precipitation)
             - Array of values (hyetograph intervals)
@@ -253,13 +258,28 @@ class SCSCN:
         s = self.retention(cn_adjusted)
         ia = self.initial_abstraction(s)
 
-        # Convert input to numpy array
         if isinstance(precipitation_mm, (int, float)):
-            p_array = np.array([precipitation_mm], dtype=np.float64)
-            is_scalar = True
-        else:
-            p_array = np.asarray(precipitation_mm, dtype=np.float64)
-            is_scalar = False
+            # Scalar fast path: plain float arithmetic, no array temporaries
+            p_total = float(precipitation_mm)
+            excess = p_total - ia
+            if excess <= 0:
+                total_effective = 0.0
+            elif s > 0:
+                total_effective = excess * excess / (excess + s)
+            else:
+                # CN=100: all precipitation after Ia becomes runoff
+                total_effective = excess
+
+            return EffectivePrecipitationResult(
+                effective_mm=total_effective,
+                total_effective_mm=total_effective,
+                retention_mm=s,
+                initial_abstraction_mm=ia,
+                cn_adjusted=cn_adjusted,
+                runoff_coefficient=(total_effective / p_total if p_total > 0 else 0.0),
+            )
+
+        p_array = np.asarray(precipitation_mm, dtype=np.float64)
 
         # Calculate cumulative precipitation
         p_cumulative = np.cumsum(p_array)
@@ -285,21 +305,78 @@ class SCSCN:
         pe_incremental = np.maximum(pe_incremental, 0.0)
 
         total_effective = float(pe_cumulative[-1])
-
-        effective: Union[NDArray[np.float64], float]
-        if is_scalar:
-            effective = float(pe_incremental[0])
-        else:
-            effective = pe_incremental
+        total_precipitation = float(p_cumulative[-1])
 
         return EffectivePrecipitationResult(
-            effective_mm=effective,
+            effective_mm=pe_incremental,
             total_effective_mm=total_effective,
             retention_mm=s,
             initial_abstraction_mm=ia,
             cn_adjusted=cn_adjusted,
+            runoff_coefficient=(
+                total_effective / total_precipitation
+                if total_precipitation > 0
+                else 0.0
+            ),
         )
 
+    def effective_precipitation_batch(
+        self,
+        precipitation_mm: Union[NDArray[np.float64], list],
+        amc: AMC = AMC.II,
+        out: Optional[NDArray[np.float64]] = None,
+    ) -> NDArray[np.float64]:
+        """
+        Calculate effective precipitation for many independent storm totals.
+
+        Unlike :meth:`effective_precipitation`, each element is treated as a
+        separate total precipitation depth (not a hyetograph interval), so
+        the SCS equation is evaluated element-wise with in-place NumPy
+        operations (a single temporary besides the output).
+
+        Parameters
+        ----------
+        precipitation_mm : NDArray[np.float64] | list
+            Total precipitation depths [mm], any shape.
+        amc : AMC, optional
+            Antecedent Moisture Condition, by default AMC.II.
+        out : NDArray[np.float64], optional
+            Preallocated float64 array for the result, same shape as
+            ``precipitation_mm``. May be the input array itself.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Effective precipitation [mm], same shape as the input
+            (``out`` if given).
+
+        Examples
+        --------
+        >>> scs = SCSCN(cn=72)
+        >>> scs.effective_precipitation_batch([10.0, 50.0, 100.0]).round(2)
+        array([ 0.  ,  7.09, 35.97])
+        """
+        s = self.retention(self.adjust_cn_for_amc(amc))
+        ia = self.initial_abstraction(s)
+
+        p_array = np.asarray(precipitation_mm, dtype=np.float64)
+        if out is None:
+            out = np.empty_like(p_array)
+
+        # excess = max(P - Ia, 0)
+        np.subtract(p_array, ia, out=out)
+        np.maximum(out, 0.0, out=out)
+
+        if s == 0:
+            # CN=100: all precipitation after Ia becomes runoff
+            return out
+
+        # Pe = excess² / (excess + S)
+        denominator = out + s
+        np.multiply(out, out, out=out)
+        np.divide(out, denominator, out=out)
+        return out
+
     def runoff_coefficient(
         self,
         precipitation_mm: float,
@@ -330,5 +407,8 @@ class SCSCN:
         if precipitation_mm <= 0:
             return 0.0
 
-        result = self.effective_precipitation(precipitation_mm, amc)
-        return result.total_effective_mm / precipitation_mm
+        coefficient = self.effective_precipitation(
+            precipitation_mm, amc
+        ).runoff_coefficient
+        assert coefficient is not None, "set by effective_precipitation()"
+        return coefficient
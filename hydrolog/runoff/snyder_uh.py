@@ -8,7 +8,9 @@ Reference:
     Transactions of the American Geophysical Union, 19, 447-454.
 """
 
+import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -16,6 +18,20 @@ from numpy.typing import NDArray
 
 from hydrolog.exceptions import InvalidParameterError
 
+# Gamma shape parameter of the Snyder curve (n ≈ 3.7 matches the W50/W75
+# width ratios); the exponent n - 1 is fixed, so it is precomputed once
+_SHAPE_N_MINUS_1 = 3.7 - 1.0
+
+
+@lru_cache(maxsize=1024)
+def _snyder_lag_hours(ct: float, L_km: float, Lc_km: float) -> float:
+    """Snyder basin lag tL = Ct · (L · Lc)^0.3 [hours].
+
+    Cached because one generate() call evaluates the lag several times
+    (tp, qp, tb, tD) and sweeps often repeat the same (Ct, L, Lc).
+    """
+    return float(ct * ((L_km * Lc_km) ** 0.3))
+
 
 @dataclass
 class SnyderUHResult:
@@ -204,7 +220,7 @@ class SnyderUH:
         -----
         Formula: tL = Ct * (L * Lc)^0.3
         """
-        return float(self.ct * ((self.L_km * self.Lc_km) ** 0.3))
+        return _snyder_lag_hours(self.ct, self.L_km, self.Lc_km)
 
     @property
     def lag_time_min(self) -> float:
@@ -458,20 +474,21 @@ class SnyderUH:
         tp_min = self.time_to_peak_min(duration_min)
         qp = self.peak_discharge(duration_min)
 
-        # Use gamma distribution approximation
-        # Shape parameter chosen to match Snyder widths
-        # n ≈ 3.7 gives good agreement with W50/W75 ratios
-        n = 3.7
-        k_min = tp_min / (n - 1) if n > 1 else tp_min
-
-        # Gamma distribution scaled to peak
-        ordinates = np.zeros_like(times_min)
-        mask = times_min > 0
-
-        t_over_k = times_min[mask] / k_min
-        # Gamma PDF: f(t) = (t/k)^(n-1) * exp(-t/k) / (k * Gamma(n))
-        # Normalized to peak at qp
-        ordinates[mask] = qp * ((t_over_k ** (n - 1)) * np.exp(-(t_over_k - (n - 1))))
+        # Gamma distribution with fixed shape n (peak at t = (n-1)·k = tp)
+        m = _SHAPE_N_MINUS_1
+        k_min = tp_min / m
+
+        # Gamma-shaped curve scaled by qp (generate() rescales it to unit volume):
+        # q(t) = qp · (t/k)^(n-1) · exp(-(t/k - (n-1)))
+        # evaluated in log space as one exp over a single buffer:
+        # q(t) = exp((n-1)·ln(t/k) - t/k + (n-1) + ln qp), q(t <= 0) = 0
+        t_over_k = times_min / k_min
+        ordinates = np.full_like(t_over_k, -np.inf)
+        np.log(t_over_k, out=ordinates, where=t_over_k > 0)
+        ordinates *= m
+        ordinates -= t_over_k
+        ordinates += m + math.log(qp)
+        np.exp(ordinates, out=ordinates)
 
         return ordinates
 
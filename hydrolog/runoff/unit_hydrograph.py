@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 from hydrolog.exceptions import InvalidParameterError
 
@@ -47,6 +47,14 @@ SCS_DIMENSIONLESS_UH = np.array(
     ],
     dtype=np.float64,
 )
+SCS_DIMENSIONLESS_UH.flags.writeable = False
+
+# Contiguous read-only columns of the table for np.interp (column slices of
+# SCS_DIMENSIONLESS_UH are strided and would be copied on every call)
+_SCS_T: NDArray[np.float64] = np.ascontiguousarray(SCS_DIMENSIONLESS_UH[:, 0])
+_SCS_Q: NDArray[np.float64] = np.ascontiguousarray(SCS_DIMENSIONLESS_UH[:, 1])
+_SCS_T.flags.writeable = False
+_SCS_Q.flags.writeable = False
 
 
 @dataclass
@@ -86,6 +94,76 @@ class UnitHydrographResult:
         return len(self.times_min)
 
 
+@dataclass
+class UnitHydrographBatchResult:
+    """
+    Result of batch unit hydrograph generation (many watersheds at once).
+
+    Attributes
+    ----------
+    times_min : NDArray[np.float64]
+        Common time axis [min], long enough for the slowest watershed.
+    ordinates_m3s : NDArray[np.float64]
+        Unit hydrograph ordinates [m³/s per mm], shape
+        (n_hydrographs, n_steps). Each row is zero past its own time base.
+    time_to_peak_min : NDArray[np.float64]
+        Time to peak discharge of each hydrograph [min].
+    peak_discharge_m3s : NDArray[np.float64]
+        Peak discharge of each hydrograph [m³/s per mm].
+    timestep_min : float
+        Time step [min].
+    """
+
+    times_min: NDArray[np.float64]
+    ordinates_m3s: NDArray[np.float64]
+    time_to_peak_min: NDArray[np.float64]
+    peak_discharge_m3s: NDArray[np.float64]
+    timestep_min: float
+
+    @property
+    def n_steps(self) -> int:
+        """Number of time steps."""
+        return len(self.times_min)
+
+    @property
+    def n_hydrographs(self) -> int:
+        """Number of hydrographs (rows of the ordinate matrix)."""
+        return int(self.ordinates_m3s.shape[0])
+
+
+def _broadcast_positive(**params: ArrayLike) -> list[NDArray[np.float64]]:
+    """Broadcast parameter arrays to a common 1-D shape, checking positivity.
+
+    Parameters
+    ----------
+    **params : ArrayLike
+        Parameter values (scalars or 1-D arrays) keyed by parameter name.
+
+    Returns
+    -------
+    list[NDArray[np.float64]]
+        Broadcast float64 arrays, in keyword order.
+
+    Raises
+    ------
+    InvalidParameterError
+        If any element is not positive or the shapes are incompatible.
+    """
+    arrays = []
+    for name, values in params.items():
+        array = np.ravel(np.asarray(values, dtype=np.float64))
+        if not np.all(array > 0):
+            raise InvalidParameterError(f"all {name} values must be positive")
+        arrays.append(array)
+    try:
+        return list(np.broadcast_arrays(*arrays))
+    except ValueError:
+        raise InvalidParameterError(
+            f"{', '.join(params)} have incompatible lengths: "
+            f"{', '.join(str(array.size) for array in arrays)}"
+        ) from None
+
+
 class SCSUnitHydrograph:
     """
     SCS (NRCS) Dimensionless Unit Hydrograph.
@@ -286,8 +364,8 @@ class SCSUnitHydrograph:
         # Interpolate q/qp ratios from dimensionless UH
         q_qp_ratios = np.interp(
             t_tp_ratios,
-            SCS_DIMENSIONLESS_UH[:, 0],
-            SCS_DIMENSIONLESS_UH[:, 1],
+            _SCS_T,
+            _SCS_Q,
             left=0.0,
             right=0.0,
         )
@@ -304,3 +382,78 @@ class SCSUnitHydrograph:
             lag_time_min=self.lag_time_min,
             timestep_min=timestep_min,
         )
+
+    @staticmethod
+    def generate_batch(
+        area_km2: ArrayLike,
+        tc_min: ArrayLike,
+        timestep_min: float = 5.0,
+    ) -> UnitHydrographBatchResult:
+        """
+        Generate SCS unit hydrographs for many watersheds at once.
+
+        Parameters are broadcast against each other, so a single ``tc_min``
+        can be combined with many areas (and vice versa). All hydrographs
+        are evaluated with one interpolation over an (n, n_steps) grid;
+        row ``i`` matches ``SCSUnitHydrograph(area_km2[i], tc_min[i])
+        .generate(timestep_min)`` over its own time base.
+
+        Parameters
+        ----------
+        area_km2 : ArrayLike
+            Watershed areas [km²]. Must be positive.
+        tc_min : ArrayLike
+            Times of concentration [min]. Must be positive.
+        timestep_min : float, optional
+            Time step for discretization [min], by default 5.0.
+
+        Returns
+        -------
+        UnitHydrographBatchResult
+            Common time axis and the ordinate matrix.
+
+        Raises
+        ------
+        InvalidParameterError
+            If any parameter is not positive or the parameter lengths
+            cannot be broadcast together.
+
+        Examples
+        --------
+        >>> result = SCSUnitHydrograph.generate_batch([45.0, 90.0], 90.0)
+        >>> result.ordinates_m3s.shape
+        (2, 58)
+        """
+        if timestep_min <= 0:
+            raise InvalidParameterError(
+                f"timestep_min must be positive, got {timestep_min}"
+            )
+
+        area, tc = _broadcast_positive(area_km2=area_km2, tc_min=tc_min)
+
+        # Same formulas as time_to_peak() / peak_discharge() / time_base()
+        tp = (timestep_min / 2.0) + 0.6 * tc
+        qp = 0.208 * area / (tp / 60.0)
+        tb = 5.0 * tp
+
+        n_steps = int(np.ceil(tb.max() / timestep_min)) + 1
+        times = np.arange(n_steps, dtype=np.float64) * timestep_min
+
+        # np.interp accepts any shape, so the whole (n, n_steps) t/tp grid
+        # is interpolated in one call
+        q_qp_ratios = np.interp(
+            times / tp[:, np.newaxis],
+            _SCS_T,
+            _SCS_Q,
+            left=0.0,
+            right=0.0,
+        )
+        ordinates = q_qp_ratios * qp[:, np.newaxis]
+
+        return UnitHydrographBatchResult(
+            times_min=times,
+            ordinates_m3s=ordinates,
+            time_to_peak_min=tp,
+            peak_discharge_m3s=qp,
+            timestep_min=timestep_min,
+        )
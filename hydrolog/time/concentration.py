@@ -2,6 +2,9 @@
 
 import warnings
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 from hydrolog.exceptions import InvalidParameterError
 
 # Typical parameter ranges for validation warnings
@@ -59,6 +62,64 @@ def _warn_if_out_of_range(
         )
 
 
+def _as_positive_array(values: ArrayLike, param_name: str) -> NDArray[np.float64]:
+    """Convert input to a float64 array and check all elements are positive.
+
+    Parameters
+    ----------
+    values : ArrayLike
+        Parameter values.
+    param_name : str
+        Name of the parameter for the error message.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Values as a float64 array.
+
+    Raises
+    ------
+    InvalidParameterError
+        If any element is not positive.
+    """
+    array = np.asarray(values, dtype=np.float64)
+    if not np.all(array > 0):
+        raise InvalidParameterError(f"all {param_name} values must be positive")
+    return array
+
+
+def _warn_if_any_out_of_range(
+    values: NDArray[np.float64],
+    param_name: str,
+    min_val: float,
+    max_val: float,
+    method_name: str,
+) -> None:
+    """Issue a single warning if any array element is outside typical range.
+
+    Parameters
+    ----------
+    values : NDArray[np.float64]
+        The parameter values to check.
+    param_name : str
+        Name of the parameter for the warning message.
+    min_val : float
+        Minimum typical value.
+    max_val : float
+        Maximum typical value.
+    method_name : str
+        Name of the method for the warning message.
+    """
+    n_outside = int(np.count_nonzero((values < min_val) | (values > max_val)))
+    if n_outside:
+        warnings.warn(
+            f"{method_name}: {n_outside} {param_name} value(s) outside typical "
+            f"range [{min_val}, {max_val}]. Results may be unreliable.",
+            UserWarning,
+            stacklevel=3,
+        )
+
+
 class ConcentrationTime:
     """
     Calculate time of concentration using various empirical methods.
@@ -189,6 +250,58 @@ class ConcentrationTime:
 
         return tc_min
 
+    @staticmethod
+    def kirpich_batch(
+        length_km: ArrayLike,
+        slope_m_per_m: ArrayLike,
+    ) -> NDArray[np.float64]:
+        """
+        Calculate Kirpich time of concentration for many channels at once.
+
+        Vectorized counterpart of :meth:`kirpich`; inputs are broadcast
+        against each other and the formula is evaluated in one NumPy pass.
+
+        Parameters
+        ----------
+        length_km : ArrayLike
+            Main channel lengths [km]. All must be positive.
+        slope_m_per_m : ArrayLike
+            Average channel slopes [m/m]. All must be positive.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Time of concentration [min], broadcast shape of the inputs.
+
+        Raises
+        ------
+        InvalidParameterError
+            If any length or slope is not positive.
+
+        Warns
+        -----
+        UserWarning
+            Once per parameter if any value is outside the typical range
+            (see :meth:`kirpich`).
+
+        Examples
+        --------
+        >>> ConcentrationTime.kirpich_batch([1.0, 8.2], [0.01, 0.023]).round(1)
+        array([23.4, 86. ])
+        """
+        length = _as_positive_array(length_km, "length_km")
+        slope = _as_positive_array(slope_m_per_m, "slope_m_per_m")
+
+        _warn_if_any_out_of_range(
+            length, "length_km", *_KIRPICH_LENGTH_RANGE, "kirpich"
+        )
+        _warn_if_any_out_of_range(
+            slope, "slope_m_per_m", *_KIRPICH_SLOPE_RANGE, "kirpich"
+        )
+
+        tc_min: NDArray[np.float64] = 3.981 * length**0.77 * slope ** (-0.385)
+        return tc_min
+
     @staticmethod
     def nrcs(
         length_km: float,
@@ -407,6 +520,67 @@ class ConcentrationTime:
 
         return tc_min
 
+    @staticmethod
+    def giandotti_batch(
+        area_km2: ArrayLike,
+        length_km: ArrayLike,
+        elevation_diff_m: ArrayLike,
+    ) -> NDArray[np.float64]:
+        """
+        Calculate Giandotti time of concentration for many watersheds at once.
+
+        Vectorized counterpart of :meth:`giandotti`; inputs are broadcast
+        against each other and the formula is evaluated in one NumPy pass.
+
+        Parameters
+        ----------
+        area_km2 : ArrayLike
+            Watershed areas [km2]. All must be positive.
+        length_km : ArrayLike
+            Main channel lengths [km]. All must be positive.
+        elevation_diff_m : ArrayLike
+            Mean elevation above outlet [m]. All must be positive.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Time of concentration [min], broadcast shape of the inputs.
+
+        Raises
+        ------
+        InvalidParameterError
+            If any parameter value is not positive.
+
+        Warns
+        -----
+        UserWarning
+            Once per parameter if any value is outside the typical range
+            (see :meth:`giandotti`).
+
+        Examples
+        --------
+        >>> ConcentrationTime.giandotti_batch([45.0], [12.0], [350.0]).round(1)
+        array([179.7])
+        """
+        area = _as_positive_array(area_km2, "area_km2")
+        length = _as_positive_array(length_km, "length_km")
+        elevation = _as_positive_array(elevation_diff_m, "elevation_diff_m")
+
+        _warn_if_any_out_of_range(area, "area_km2", *_GIANDOTTI_AREA_RANGE, "giandotti")
+        _warn_if_any_out_of_range(
+            length, "length_km", *_GIANDOTTI_LENGTH_RANGE, "giandotti"
+        )
+        _warn_if_any_out_of_range(
+            elevation,
+            "elevation_diff_m",
+            *_GIANDOTTI_ELEVATION_RANGE,
+            "giandotti",
+        )
+
+        tc_hours = (4.0 * np.sqrt(area) + 1.5 * length) / (0.8 * np.sqrt(elevation))
+        tc_min: NDArray[np.float64] = tc_hours * 60.0
+        return tc_min
+
     @staticmethod
     def faa(
         length_km: float,
@@ -406,6 +406,21 @@ class TestClarkIUHBehavior:
         ]
         assert len(significant_peaks) == 1
 
+    def test_routing_matches_reservoir_recurrence(self):
+        """Test linear reservoir routing against the explicit recurrence."""
+        iuh = ClarkIUH(tc_min=60.0, r_min=30.0)
+        inflow = np.array([0.3, 1.0, 2.5, 0.0, 0.7, 0.0, 0.0])
+        c1 = 5.0 / (2.0 * 30.0 + 5.0)
+
+        expected = np.zeros_like(inflow)
+        for i in range(1, len(inflow)):
+            expected[i] = expected[i - 1] + c1 * (
+                inflow[i] + inflow[i - 1] - 2.0 * expected[i - 1]
+            )
+
+        outflow = iuh._route_linear_reservoir(inflow, timestep_min=5.0)
+        np.testing.assert_allclose(outflow, expected, rtol=1e-12)
+
 
 class TestClarkIUHWithArea:
     """Tests for ClarkIUH with area_km2 parameter in constructor."""
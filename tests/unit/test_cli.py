@@ -1,10 +1,13 @@
 """Tests for CLI interface."""
 
 import json
+import subprocess
+import sys
 
 import pytest
 
-from hydrolog.cli.main import main
+from hydrolog.cli.commands import cn, scs, tc, uh
+from hydrolog.cli.main import create_parser, main
 
 
 class TestCLIMain:
@@ -30,6 +33,29 @@ class TestCLIMain:
             main(["--help"])
         assert exc_info.value.code == 0
 
+    def test_create_parser_is_cached(self):
+        """Test that the parser tree is built once and reused."""
+        assert create_parser() is create_parser()
+
+    def test_parser_does_not_import_numpy(self):
+        """Test that building the parser (--help, --version) skips NumPy."""
+        code = (
+            "import sys\n"
+            "from hydrolog.cli.main import create_parser\n"
+            "create_parser()\n"
+            "sys.exit('numpy' in sys.modules)\n"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_register_parser_is_idempotent(self):
+        """Test that re-registering commands keeps the existing parsers."""
+        parser = create_parser()
+        subparsers = parser._subparsers._group_actions[0]
+        before = dict(subparsers.choices)
+        for module in (tc, cn, scs, uh):
+            module.register_parser(subparsers)
+        assert subparsers.choices == before
+
 
 class TestCLITc:
     """Tests for 'tc' command."""
@@ -77,6 +103,68 @@ class TestCLITc:
         assert "Giandotti" in captured.out
         assert "Watershed area" in captured.out
 
+    def test_tc_faa(self, capsys):
+        """Test tc faa calculation."""
+        result = main(
+            [
+                "tc",
+                "faa",
+                "--length",
+                "0.15",
+                "--slope",
+                "0.02",
+                "--runoff-coeff",
+                "0.6",
+            ]
+        )
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "FAA" in captured.out
+        assert "Runoff coefficient:   0.60" in captured.out
+
+    def test_tc_kerby(self, capsys):
+        """Test tc kerby calculation."""
+        result = main(
+            [
+                "tc",
+                "kerby",
+                "--length",
+                "0.1",
+                "--slope",
+                "0.008",
+                "--retardance",
+                "0.4",
+            ]
+        )
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Kerby" in captured.out
+        assert "Retardance (N):       0.40" in captured.out
+
+    def test_tc_kerby_kirpich(self, capsys):
+        """Test tc kerby-kirpich composite calculation."""
+        result = main(
+            [
+                "tc",
+                "kerby-kirpich",
+                "--ov-length",
+                "0.25",
+                "--ov-slope",
+                "0.008",
+                "--retardance",
+                "0.40",
+                "--ch-length",
+                "5.0",
+                "--ch-slope",
+                "0.005",
+            ]
+        )
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "t_overland" in captured.out
+        assert "t_channel" in captured.out
+        assert "Tc =" in captured.out
+
 
 class TestCLICN:
     """Tests for 'cn' command."""
@@ -105,6 +193,17 @@ class TestCLICN:
         captured = capsys.readouterr()
         assert "CN = 98" in captured.out
 
+    def test_cn_lookup_case_insensitive(self, capsys):
+        """Test cn lookup normalizes HSG, cover and condition case."""
+        result = main(
+            ["cn", "lookup", "--hsg", "b", "--cover", "FOREST", "--condition", "Good"]
+        )
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "HSG:        B" in captured.out
+        assert "Land cover: forest" in captured.out
+        assert "CN = 55" in captured.out
+
     def test_cn_list(self, capsys):
         """Test cn list."""
         result = main(["cn", "list"])
@@ -143,6 +242,19 @@ class TestCLISCS:
         assert "AMC" in captured.out
         assert "wet" in captured.out
 
+    def test_scs_with_numeric_amc(self, capsys):
+        """Test SCS-CN with numeric AMC alias."""
+        result = main(["scs", "--cn", "72", "--precipitation", "50", "--amc", "3"])
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "III (wet)" in captured.out
+
+    def test_scs_invalid_amc(self, capsys):
+        """Test SCS-CN with unknown AMC (argparse catches this)."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["scs", "--cn", "72", "--precipitation", "50", "--amc", "IV"])
+        assert exc_info.value.code != 0
+
     def test_scs_with_custom_ia(self, capsys):
         """Test SCS-CN with custom Ia coefficient."""
         result = main(["scs", "--cn", "72", "--precipitation", "50", "--ia", "0.1"])
@@ -157,6 +269,25 @@ class TestCLISCS:
         captured = capsys.readouterr()
         assert "No runoff" in captured.out
 
+    def test_scs_precipitation_file(self, capsys, tmp_path):
+        """Test SCS-CN effective precipitation series from a hyetograph file."""
+        hyetograph = tmp_path / "hyetograph.txt"
+        hyetograph.write_text("0 2.0\n10 10.0\n20 25.0\n30 8.0\n")
+        result = main(["scs", "--cn", "72", "--precipitation-file", str(hyetograph)])
+        assert result == 0
+        lines = capsys.readouterr().out.strip().split("\n")
+        assert lines[0] == "step,precipitation_mm,effective_mm"
+        assert len(lines) == 5
+        assert lines[1] == "1,2.000,0.000"
+        total = sum(float(line.split(",")[2]) for line in lines[1:])
+        assert total == pytest.approx(5.14, abs=0.01)
+
+    def test_scs_requires_precipitation_source(self, capsys):
+        """Test that -P or --precipitation-file is required (argparse)."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["scs", "--cn", "72"])
+        assert exc_info.value.code != 0
+
 
 class TestCLIUH:
     """Tests for 'uh' command."""
@@ -242,6 +373,200 @@ class TestCLIUH:
         lines = captured.out.strip().split("\n")
         assert len(lines) > 5
 
+    def test_uh_scs_batch(self, capsys):
+        """Test SCS batch mode with area and tc lists."""
+        result = main(
+            [
+                "uh",
+                "scs",
+                "--area-list",
+                "12,45",
+                "--tc-list",
+                "40,90",
+                "--timestep",
+                "10",
+            ]
+        )
+        assert result == 0
+        lines = capsys.readouterr().out.strip().split("\n")
+        assert lines[0] == "time_min,q1_m3s_per_mm,q2_m3s_per_mm"
+        assert lines[1] == "0.0,0.0000,0.0000"
+
+    def test_uh_scs_batch_invalid_list(self, capsys):
+        """Test that a malformed --area-list is rejected (argparse)."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["uh", "scs", "--area-list", "12,x", "--tc", "60"])
+        assert exc_info.value.code != 0
+
+    def test_uh_scs_batch_requires_tc(self, capsys):
+        """Test that --area-list without --tc/--tc-list reports the missing option."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["uh", "scs", "--area-list", "12,45"])
+        assert exc_info.value.code == 2
+        assert "--tc/--tc-list required" in capsys.readouterr().err
+
+    def test_uh_scs_requires_tc(self, capsys):
+        """Test that a missing --tc is a usage error for a single hydrograph."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["uh", "scs", "--area", "45"])
+        assert exc_info.value.code == 2
+        err = capsys.readouterr().err
+        assert err.startswith("usage: ")
+        assert "--tc/--tc-list required" in err
+
+    def test_uh_scs_input_csv_matches_lists(self, capsys, tmp_path):
+        """Test that --input-csv gives the same output as --area-list/--tc-list."""
+        catalogue = tmp_path / "catchments.csv"
+        catalogue.write_text("area,tc\n12,40\n45,90\n")
+
+        main(["uh", "scs", "--area-list", "12,45", "--tc-list", "40,90"])
+        expected = capsys.readouterr().out
+
+        result = main(["uh", "scs", "--input-csv", str(catalogue)])
+        assert result == 0
+        assert capsys.readouterr().out == expected
+
+    def test_uh_nash_input_csv_to_output_csv(self, capsys, tmp_path):
+        """Test Nash catalogue mode with per-row duration written to a file."""
+        catalogue = tmp_path / "catchments.csv"
+        catalogue.write_text("area,n,k,duration\n45,3,30,10\n12,2.5,15,20\n")
+        output = tmp_path / "uh.csv"
+
+        result = main(
+            [
+                "uh",
+                "nash",
+                "--input-csv",
+                str(catalogue),
+                "--output-csv",
+                str(output),
+                "--timestep",
+                "10",
+            ]
+        )
+        assert result == 0
+        assert capsys.readouterr().out == ""
+        lines = output.read_text().strip().split("\n")
+        assert lines[0] == "time_min,q1_m3s_per_mm,q2_m3s_per_mm"
+        assert lines[1] == "0.0,0.0000,0.0000"
+
+    @pytest.mark.parametrize(
+        "columns, extra, flag",
+        [
+            ("area,tc\n45,90\n", ["scs", "--tc", "60"], "--tc"),
+            ("area,tc\n45,90\n", ["scs", "--tc-list", "60"], "--tc-list"),
+            ("area,n,k\n45,3,30\n", ["nash", "--n", "2", "--k", "20"], "--n, --k"),
+            (
+                "area,n,k,duration\n45,3,30,10\n",
+                ["nash", "--duration", "20"],
+                "--duration",
+            ),
+        ],
+        ids=["scs_tc", "scs_tc_list", "nash_n_k", "nash_duration"],
+    )
+    def test_uh_input_csv_rejects_parameter_options(
+        self, capsys, tmp_path, columns, extra, flag
+    ):
+        """Test that options overridden by catalogue columns are rejected."""
+        catalogue = tmp_path / "catchments.csv"
+        catalogue.write_text(columns)
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["uh", *extra, "--input-csv", str(catalogue)])
+        assert exc_info.value.code == 2
+        assert f"{flag} cannot be used with --input-csv" in capsys.readouterr().err
+
+    def test_uh_nash_input_csv_duration_option(self, capsys, tmp_path):
+        """Test that --duration applies to a catalogue without a duration column."""
+        catalogue = tmp_path / "catchments.csv"
+        catalogue.write_text("area,n,k\n45,3,30\n")
+        with_column = tmp_path / "with_duration.csv"
+        with_column.write_text("area,n,k,duration\n45,3,30,20\n")
+
+        main(["uh", "nash", "--input-csv", str(with_column)])
+        expected = capsys.readouterr().out
+
+        result = main(["uh", "nash", "--input-csv", str(catalogue), "-D", "20"])
+        assert result == 0
+        assert capsys.readouterr().out == expected
+
+    def test_uh_input_csv_missing_column(self, capsys, tmp_path):
+        """Test that a catalogue without a required column is reported."""
+        catalogue = tmp_path / "catchments.csv"
+        catalogue.write_text("area,n\n45,3\n")
+
+        result = main(["uh", "nash", "--input-csv", str(catalogue)])
+        assert result == 1
+        assert "missing column(s) k" in capsys.readouterr().err
+
+    def test_uh_input_csv_empty_file(self, capsys, tmp_path):
+        """Test that an empty catalogue reports the missing columns."""
+        catalogue = tmp_path / "catchments.csv"
+        catalogue.write_text("")
+
+        with pytest.warns(UserWarning, match="Empty input file"):
+            result = main(["uh", "scs", "--input-csv", str(catalogue)])
+        assert result == 1
+        assert "missing column(s) area, tc" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["uh", "scs", "--area", "45", "--tc", "90", "--output-csv", "uh.csv"],
+            [
+                "uh",
+                "nash",
+                "--area",
+                "45",
+                "--n",
+                "3",
+                "--k",
+                "30",
+                "--output-csv",
+                "x",
+            ],
+        ],
+        ids=["scs", "nash"],
+    )
+    def test_uh_output_csv_requires_batch_mode(self, capsys, argv):
+        """Test that --output-csv is rejected for a single hydrograph."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        assert exc_info.value.code == 2
+        assert "--output-csv requires" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["uh", "scs", "--area-list", "12,45", "--tc", "60", "--json"],
+            ["uh", "scs", "--input-csv", "catchments.csv", "--json"],
+            ["uh", "nash", "--input-csv", "catchments.csv", "--json"],
+        ],
+        ids=["scs_list", "scs_catalogue", "nash_catalogue"],
+    )
+    def test_uh_json_rejected_in_batch_mode(self, capsys, argv):
+        """Test that --json is rejected where output is always CSV."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+        assert exc_info.value.code == 2
+        assert "--json cannot be used with" in capsys.readouterr().err
+
+    def test_uh_csv_flag_in_batch_mode(self, capsys):
+        """Test that --csv is accepted in batch mode (output is CSV)."""
+        argv = ["uh", "scs", "--area-list", "12,45", "--tc", "60"]
+        main(argv)
+        expected = capsys.readouterr().out
+
+        assert main(argv + ["--csv"]) == 0
+        assert capsys.readouterr().out == expected
+
+    def test_uh_nash_requires_k_without_input_csv(self, capsys):
+        """Test that --k is still required for a single hydrograph."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["uh", "nash", "--area", "45", "--n", "3"])
+        assert exc_info.value.code == 2
+        assert "--k required" in capsys.readouterr().err
+
     def test_uh_json_output(self, capsys):
         """Test JSON output format."""
         result = main(
@@ -255,6 +580,20 @@ class TestCLIUH:
         assert "hydrograph" in data
         assert "times_min" in data["hydrograph"]
 
+    def test_uh_json_output_without_orjson(self, capsys, monkeypatch):
+        """Test JSON output with the stdlib fallback matches orjson output."""
+        argv = ["uh", "nash", "--area", "45", "--n", "3", "--k", "30", "--json"]
+        main(argv)
+        default_out = capsys.readouterr().out
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        result = main(argv)
+        assert result == 0
+        fallback_out = capsys.readouterr().out
+        assert fallback_out == default_out
+        assert default_out.isascii()
+        assert '"Area [km\\u00b2]"' in default_out
+
 
 class TestCLIErrors:
     """Tests for CLI error handling."""
@@ -4,6 +4,7 @@ import pytest
 
 from hydrolog.exceptions import InvalidParameterError
 from hydrolog.runoff.cn_lookup import (
+    CATEGORIZED_COVERS,
     CNLookupResult,
     HydrologicCondition,
     LandCover,
@@ -11,6 +12,7 @@ from hydrolog.runoff.cn_lookup import (
     get_cn,
     get_cn_range,
     list_land_covers,
+    list_land_covers_by_category,
     lookup_cn,
 )
 
@@ -181,6 +183,31 @@ class TestListLandCovers:
         assert covers["PAVED"] == "paved"
 
 
+class TestListLandCoversByCategory:
+    """Tests for categorized land cover listing."""
+
+    def test_every_cover_in_exactly_one_category(self):
+        """Test that categories partition the LandCover enum."""
+        categorized = [lc for covers in CATEGORIZED_COVERS.values() for lc in covers]
+        assert sorted(categorized, key=lambda lc: lc.name) == sorted(
+            LandCover, key=lambda lc: lc.name
+        )
+
+    def test_yields_category_name_value(self):
+        """Test generator yields (category, name, value) in category order."""
+        rows = list(list_land_covers_by_category())
+
+        assert rows[0] == ("Agricultural", "FALLOW", "fallow")
+        assert ("Natural", "FOREST", "forest") in rows
+        assert rows[-1] == ("Water", "WATER", "water")
+        assert len(rows) == len(LandCover)
+
+    def test_categories_are_read_only(self):
+        """Test that the category mapping cannot be modified."""
+        with pytest.raises(TypeError):
+            CATEGORIZED_COVERS["Other"] = ()  # type: ignore[index]
+
+
 class TestCalculateWeightedCN:
     """Tests for calculate_weighted_cn function."""
 
@@ -1,5 +1,6 @@
 """Tests for time of concentration calculations."""
 
+import numpy as np
 import pytest
 
 from hydrolog.time import ConcentrationTime
@@ -802,6 +803,55 @@ class TestKerbyKirpich:
             )
 
 
+class TestBatch:
+    """Tests for vectorized batch methods."""
+
+    def test_kirpich_batch_matches_scalar(self):
+        """Test that kirpich_batch matches the scalar formula element-wise."""
+        lengths = np.array([1.0, 2.5, 8.2])
+        slopes = np.array([0.01, 0.02, 0.023])
+        tc = ConcentrationTime.kirpich_batch(lengths, slopes)
+        expected = [
+            ConcentrationTime.kirpich(length, slope)
+            for length, slope in zip(lengths, slopes)
+        ]
+        np.testing.assert_allclose(tc, expected)
+
+    def test_kirpich_batch_broadcasts(self):
+        """Test that a scalar slope broadcasts against an array of lengths."""
+        tc = ConcentrationTime.kirpich_batch([1.0, 2.0, 4.0], 0.02)
+        assert tc.shape == (3,)
+        assert np.all(np.diff(tc) > 0)
+
+    def test_kirpich_batch_invalid_length(self):
+        """Test that a non-positive length anywhere raises error."""
+        with pytest.raises(InvalidParameterError, match="length_km"):
+            ConcentrationTime.kirpich_batch([1.0, 0.0], [0.02, 0.02])
+
+    def test_kirpich_batch_warns_once(self):
+        """Test a single warning when several values are out of range."""
+        with pytest.warns(UserWarning, match="2 length_km value") as record:
+            ConcentrationTime.kirpich_batch([100.0, 120.0, 1.0], 0.02)
+        assert len(record) == 1
+
+    def test_giandotti_batch_matches_scalar(self):
+        """Test that giandotti_batch matches the scalar formula element-wise."""
+        areas = np.array([150.0, 500.0])
+        lengths = np.array([15.0, 40.0])
+        elevations = np.array([500.0, 800.0])
+        tc = ConcentrationTime.giandotti_batch(areas, lengths, elevations)
+        expected = [
+            ConcentrationTime.giandotti(a, length, h)
+            for a, length, h in zip(areas, lengths, elevations)
+        ]
+        np.testing.assert_allclose(tc, expected)
+
+    def test_giandotti_batch_invalid_elevation(self):
+        """Test that a non-positive elevation raises error."""
+        with pytest.raises(InvalidParameterError, match="elevation_diff_m"):
+            ConcentrationTime.giandotti_batch([150.0], [15.0], [-1.0])
+
+
 class TestConcentrationTimeImport:
     """Test module imports."""
 
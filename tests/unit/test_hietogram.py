@@ -1,10 +1,14 @@
 """Tests for hyetograph generation."""
 
+import dataclasses
+
 import numpy as np
 import pytest
 
 from hydrolog.precipitation import (
+    Hietogram,
     HietogramResult,
+    HietogramBatchResult,
     BlockHietogram,
     TriangularHietogram,
     BetaHietogram,
@@ -42,6 +46,14 @@ class TestHietogramResult:
         expected = np.array([30.0, 60.0, 30.0])
         np.testing.assert_array_almost_equal(result.intensity_mm_per_h, expected)
 
+    def test_frozen_slots(self):
+        """Test that results are immutable and carry no __dict__."""
+        result = BlockHietogram().generate(total_mm=30.0, duration_min=60.0)
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.total_mm = 60.0
+
 
 class TestBlockHietogram:
     """Tests for BlockHietogram (uniform distribution)."""
@@ -87,6 +99,27 @@ class TestBlockHietogram:
         assert result.timestep_min == 5.0
         assert result.n_steps == 12
 
+    def test_block_depths_writable(self):
+        """Test that block depths are a separate writable array per result."""
+        hietogram = BlockHietogram()
+        first = hietogram.generate(total_mm=30.0, duration_min=60.0)
+        second = hietogram.generate(total_mm=30.0, duration_min=60.0)
+
+        first.intensities_mm[0] = 0.0
+
+        assert first.intensities_mm.flags.owndata
+        assert second.intensities_mm[0] == 2.5
+
+    def test_block_times_shared_read_only(self):
+        """Test that repeated storms share one read-only time axis."""
+        first = BlockHietogram().generate(total_mm=30.0, duration_min=60.0)
+        second = TriangularHietogram().generate(total_mm=10.0, duration_min=60.0)
+
+        assert second.times_min is first.times_min
+        with pytest.raises(ValueError, match="read-only"):
+            first.times_min[0] = 0.0
+        first.intensities_mm[0] = 0.0  # depths are per-result and writable
+
 
 class TestTriangularHietogram:
     """Tests for TriangularHietogram."""
@@ -146,6 +179,24 @@ class TestTriangularHietogram:
         ):
             TriangularHietogram(peak_position=-0.5)
 
+    @pytest.mark.parametrize("peak_position", [0.01, 0.4, 0.5, 0.99])
+    @pytest.mark.parametrize("duration_min", [5.0, 10.0, 15.0, 60.0, 1440.0])
+    def test_triangular_shape(self, peak_position, duration_min):
+        """Test the limbs against the linear rise and fall definition."""
+        result = TriangularHietogram(peak_position).generate(
+            total_mm=1.0, duration_min=duration_min, timestep_min=5.0
+        )
+        n_steps = result.n_steps
+        peak_idx = min(max(int(n_steps * peak_position), 1), n_steps - 1)
+        remaining = n_steps - peak_idx - 1
+        shape = [(i + 1) / (peak_idx + 1) for i in range(peak_idx + 1)] + [
+            (remaining - i) / (remaining + 1) for i in range(remaining)
+        ]
+
+        expected = np.array(shape) / sum(shape)
+        np.testing.assert_allclose(result.intensities_mm, expected, rtol=1e-12)
+        assert result.intensities_mm.argmax() == peak_idx
+
 
 class TestBetaHietogram:
     """Tests for BetaHietogram."""
@@ -213,6 +264,80 @@ class TestBetaHietogram:
         assert result.intensities_mm[0] > result.intensities_mm[-1]
         assert np.isclose(result.intensities_mm.sum(), 30.0)
 
+    def test_beta_shape_reused_between_calls(self):
+        """Test that repeated storms share the shape but not the result."""
+        hietogram = BetaHietogram(alpha=2.0, beta=5.0)
+        first = hietogram.generate(total_mm=30.0, duration_min=60.0)
+        second = hietogram.generate(total_mm=60.0, duration_min=60.0)
+
+        first.intensities_mm[0] = -1.0  # results stay writable and separate
+        np.testing.assert_allclose(
+            second.intensities_mm[1:], 2.0 * first.intensities_mm[1:]
+        )
+        assert second.intensities_mm[0] > 0
+
+    def test_beta_parameters_reassigned(self):
+        """Test that changing alpha/beta after construction changes the shape."""
+        hietogram = BetaHietogram(alpha=2.0, beta=5.0)
+        hietogram.generate(total_mm=30.0, duration_min=60.0)
+
+        hietogram.alpha, hietogram.beta = 5.0, 2.0
+        result = hietogram.generate(total_mm=30.0, duration_min=60.0)
+        expected = BetaHietogram(alpha=5.0, beta=2.0).generate(30.0, 60.0)
+
+        assert (hietogram.alpha, hietogram.beta) == (5.0, 2.0)
+        np.testing.assert_array_equal(result.intensities_mm, expected.intensities_mm)
+
+    @pytest.mark.parametrize(
+        ("alpha", "beta"), [(1e-9, 1e-9), (1e-9, 50.0), (0.3, 1e-9), (1.0, 1.0)]
+    )
+    def test_beta_extreme_parameters_finite(self, alpha, beta):
+        """Test that the PDF stays finite near the alpha, beta -> 0 limit."""
+        hietogram = BetaHietogram(alpha=alpha, beta=beta)
+        result = hietogram.generate(total_mm=30.0, duration_min=1440.0)
+
+        assert np.all(np.isfinite(result.intensities_mm))
+        assert np.all(result.intensities_mm > 0)
+        assert np.isclose(result.intensities_mm.sum(), 30.0)
+
+    def test_beta_underflow_falls_back_to_uniform(self):
+        """Test that a PDF underflowing to zero gives a uniform storm."""
+        hietogram = BetaHietogram(alpha=1e6, beta=2.0)
+        result = hietogram.generate(total_mm=30.0, duration_min=60.0, timestep_min=10.0)
+
+        np.testing.assert_allclose(result.intensities_mm, 5.0)
+
+    @pytest.mark.parametrize(("alpha", "beta"), [(2.0, 5.0), (0.5, 0.5), (1e6, 2.0)])
+    def test_beta_specialize_matches_generate(self, alpha, beta):
+        """Test that a specialized generator returns generate()'s depths."""
+        hietogram = BetaHietogram(alpha=alpha, beta=beta)
+        depths = hietogram.specialize(duration_min=90.0, timestep_min=5.0)
+
+        for total in (10.0, 37.5, 120.0):
+            expected = hietogram.generate(total, duration_min=90.0, timestep_min=5.0)
+            np.testing.assert_array_equal(depths(total), expected.intensities_mm)
+        assert depths(10.0) is not depths(10.0)
+
+    def test_beta_specialize_keeps_parameters(self):
+        """Test that a specialized generator ignores later parameter changes."""
+        hietogram = BetaHietogram(alpha=2.0, beta=5.0)
+        depths = hietogram.specialize(duration_min=60.0, dtype=np.float32)
+        expected = hietogram.generate(30.0, duration_min=60.0, dtype=np.float32)
+
+        hietogram.alpha = 5.0
+        result = depths(30.0)
+
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, expected.intensities_mm)
+
+    def test_beta_specialize_invalid_raises(self):
+        """Test validation at specialization and at call time."""
+        with pytest.raises(InvalidParameterError, match="timestep_min"):
+            BetaHietogram().specialize(duration_min=60.0, timestep_min=90.0)
+        depths = BetaHietogram().specialize(duration_min=60.0)
+        with pytest.raises(InvalidParameterError, match="total_mm must be positive"):
+            depths(0.0)
+
 
 class TestHietogramValidation:
     """Tests for parameter validation common to all hyetograms."""
@@ -267,6 +392,22 @@ class TestHietogramValidation:
         with pytest.raises(InvalidParameterError, match="timestep_min.*cannot exceed"):
             hietogram.generate(total_mm=30.0, duration_min=10.0, timestep_min=20.0)
 
+    def test_first_failing_check_reported(self):
+        """Test that with several bad values the total is reported first."""
+        hietogram = BlockHietogram()
+        with pytest.raises(InvalidParameterError, match="total_mm must be positive"):
+            hietogram.generate(total_mm=0.0, duration_min=10.0, timestep_min=20.0)
+
+    @pytest.mark.parametrize(
+        ("duration_min", "timestep_min", "n_steps"),
+        [(5.0, 5.0, 1), (7.0, 5.0, 1), (60.0, 5.0, 12), (100.0, 0.7, 142)],
+    )
+    def test_step_count(self, duration_min, timestep_min, n_steps):
+        """Test that partial trailing steps are dropped."""
+        result = BlockHietogram().generate(10.0, duration_min, timestep_min)
+
+        assert result.n_steps == n_steps
+
     def test_triangular_validation(self):
         """Test that TriangularHietogram validates generate params."""
         hietogram = TriangularHietogram(peak_position=0.5)
@@ -281,6 +422,18 @@ class TestHietogramValidation:
         ):
             hietogram.generate(total_mm=30.0, duration_min=-60.0, timestep_min=10.0)
 
+    @pytest.mark.parametrize("n_steps", [1, 2, 3, 12, 100])
+    @pytest.mark.parametrize("peak_position", [0.01, 0.33, 0.5, 0.99, 1.0])
+    def test_clamp_peak(self, n_steps, peak_position):
+        """Test peak clamping against the first/last step rules."""
+        expected = int(n_steps * peak_position)
+        if expected == 0:
+            expected = 1
+        if expected >= n_steps:
+            expected = n_steps - 1
+
+        assert Hietogram._clamp_peak(n_steps, peak_position) == expected
+
 
 class TestHietogramImport:
     """Test module imports."""
@@ -304,6 +457,157 @@ class TestHietogramImport:
         assert EulerIIHietogram is not None
 
 
+class TestHietogramBatch:
+    """Tests for Hietogram.generate_batch()."""
+
+    @pytest.mark.parametrize(
+        "hietogram",
+        [
+            BlockHietogram(),
+            TriangularHietogram(peak_position=0.4),
+            BetaHietogram(alpha=2.0, beta=5.0),
+            BetaHietogram(alpha=0.5, beta=0.5),
+            EulerIIHietogram(),
+        ],
+        ids=["block", "triangular", "beta", "beta_u_shaped", "euler_ii"],
+    )
+    def test_rows_match_generate(self, hietogram):
+        """Test that each row equals the single-storm hyetograph."""
+        totals = [10.0, 25.5, 80.0]
+        batch = hietogram.generate_batch(totals, duration_min=90.0, timestep_min=5.0)
+
+        assert isinstance(batch, HietogramBatchResult)
+        assert batch.intensities_mm.shape == (3, 18)
+        assert batch.n_hietograms == 3
+        assert batch.n_steps == 18
+        for row, total in zip(batch.intensities_mm, totals):
+            single = hietogram.generate(total, duration_min=90.0, timestep_min=5.0)
+            np.testing.assert_allclose(row, single.intensities_mm, rtol=1e-14)
+            np.testing.assert_array_equal(batch.times_min, single.times_min)
+        np.testing.assert_allclose(batch.intensities_mm.sum(axis=1), totals)
+
+    def test_scalar_total(self):
+        """Test that a scalar depth gives a single row."""
+        batch = BlockHietogram().generate_batch(30.0, duration_min=60.0)
+
+        assert batch.intensities_mm.shape == (1, 12)
+        np.testing.assert_allclose(batch.intensity_mm_per_h, 30.0)
+
+    def test_invalid_total_raises(self):
+        """Test that non-positive depths are rejected."""
+        with pytest.raises(InvalidParameterError, match="total_mm"):
+            BlockHietogram().generate_batch([10.0, 0.0], duration_min=60.0)
+
+
+class TestHietogramDtype:
+    """Tests for the optional dtype of generated depths."""
+
+    @pytest.mark.parametrize(
+        "hietogram",
+        [
+            BlockHietogram(),
+            TriangularHietogram(peak_position=0.4),
+            BetaHietogram(alpha=2.0, beta=5.0),
+            EulerIIHietogram(),
+        ],
+        ids=["block", "triangular", "beta", "euler_ii"],
+    )
+    def test_float32_matches_float64(self, hietogram):
+        """Test float32 depths against the default float64 hyetograph."""
+        expected = hietogram.generate(50.0, duration_min=120.0, timestep_min=5.0)
+        result = hietogram.generate(
+            50.0, duration_min=120.0, timestep_min=5.0, dtype=np.float32
+        )
+
+        assert expected.intensities_mm.dtype == np.float64
+        assert result.intensities_mm.dtype == np.float32
+        assert result.intensity_mm_per_h.dtype == np.float32
+        assert result.times_min.dtype == np.float64
+        np.testing.assert_allclose(
+            result.intensities_mm, expected.intensities_mm, rtol=1e-6
+        )
+        assert result.intensities_mm.sum() == pytest.approx(50.0, rel=1e-6)
+
+    def test_batch_float32(self):
+        """Test float32 depth matrices from the batch generators."""
+        batch = TriangularHietogram().generate_batch(
+            [10.0, 20.0], duration_min=60.0, dtype=np.float32
+        )
+        ensemble = BetaHietogram.generate_ensemble(
+            10.0, alpha=[2.0, 3.0], beta=2.0, duration_min=60.0, dtype=np.float32
+        )
+
+        assert batch.intensities_mm.dtype == np.float32
+        assert ensemble.intensities_mm.dtype == np.float32
+        np.testing.assert_allclose(batch.intensities_mm.sum(axis=1), [10.0, 20.0])
+
+    @pytest.mark.parametrize("dtype", [np.int32, bool])
+    def test_invalid_dtype_raises(self, dtype):
+        """Test that a non-floating dtype raises error."""
+        with pytest.raises(InvalidParameterError, match="dtype"):
+            BlockHietogram().generate(30.0, duration_min=60.0, dtype=dtype)
+        with pytest.raises(InvalidParameterError, match="dtype"):
+            BlockHietogram().generate_batch([30.0], duration_min=60.0, dtype=dtype)
+
+
+class TestBetaHietogramEnsemble:
+    """Tests for BetaHietogram.generate_ensemble()."""
+
+    def test_rows_match_generate(self):
+        """Test that each row equals the single-parameter hyetograph."""
+        totals = [10.0, 40.0, 25.0, 60.0]
+        alphas = [2.0, 5.0, 0.5, 1.0]
+        betas = [5.0, 2.0, 0.5, 1.0]
+        batch = BetaHietogram.generate_ensemble(
+            totals, alphas, betas, duration_min=120.0, timestep_min=10.0
+        )
+
+        assert isinstance(batch, HietogramBatchResult)
+        assert batch.intensities_mm.shape == (4, 12)
+        for row, total, a, b in zip(batch.intensities_mm, totals, alphas, betas):
+            single = BetaHietogram(a, b).generate(total, 120.0, 10.0)
+            np.testing.assert_allclose(row, single.intensities_mm, rtol=1e-12)
+            np.testing.assert_array_equal(batch.times_min, single.times_min)
+
+    def test_scalar_broadcast(self):
+        """Test that a scalar depth is shared across a parameter sweep."""
+        batch = BetaHietogram.generate_ensemble(
+            30.0, alpha=[2.0, 3.0, 4.0], beta=2.0, duration_min=60.0
+        )
+
+        assert batch.n_hietograms == 3
+        np.testing.assert_array_equal(batch.total_mm, [30.0, 30.0, 30.0])
+        np.testing.assert_allclose(batch.intensities_mm.sum(axis=1), 30.0)
+
+    def test_underflow_row_is_uniform(self):
+        """Test that a degenerate PDF row falls back to a uniform hyetograph."""
+        batch = BetaHietogram.generate_ensemble(
+            12.0, alpha=[2.0, 1e6], beta=[5.0, 1.0], duration_min=60.0
+        )
+
+        np.testing.assert_allclose(batch.intensities_mm[1], 1.0)
+        assert batch.intensities_mm[0].argmax() < 6
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"total_mm": [10.0, -1.0], "alpha": 2.0, "beta": 2.0}, "total_mm"),
+            ({"total_mm": 10.0, "alpha": [2.0, 0.0], "beta": 2.0}, "alpha"),
+            ({"total_mm": 10.0, "alpha": 2.0, "beta": [-2.0]}, "beta"),
+            ({"total_mm": [1.0, 2.0], "alpha": [2.0] * 3, "beta": 2.0}, "lengths"),
+        ],
+    )
+    def test_invalid_params_raise(self, kwargs, match):
+        """Test that invalid or mismatched parameters are rejected."""
+        with pytest.raises(InvalidParameterError, match=match):
+            BetaHietogram.generate_ensemble(duration_min=60.0, **kwargs)
+
+    def test_invalid_duration_raises(self):
+        """Test that the duration and time step are validated."""
+        with pytest.raises(InvalidParameterError, match="cannot exceed"):
+            BlockHietogram().generate_batch([10.0], 10.0, timestep_min=15.0)
+
+
 class TestEulerIIHietogram:
     """Tests for DVWK Euler Type II hyetograph."""
 
@@ -429,3 +733,54 @@ class TestEulerIIHietogram:
         # Peak should be around index 8 (1/3 of 24)
         peak_idx = np.argmax(result.intensities_mm)
         assert 7 <= peak_idx <= 9
+
+    def test_euler_ii_rank_weights_shared(self):
+        """Test that storms of one length reuse the ranked depths."""
+        early = EulerIIHietogram(peak_position=0.2)
+        late = EulerIIHietogram(peak_position=0.8)
+        first = early.generate(total_mm=30.0, duration_min=60.0)
+        second = late.generate(total_mm=30.0, duration_min=60.0)
+
+        first.intensities_mm[:] *= 2.0  # must not leak into the shared weights
+        np.testing.assert_array_equal(
+            np.sort(second.intensities_mm),
+            np.sort(early.generate(30.0, 60.0).intensities_mm),
+        )
+        ranks = np.arange(1, 13)
+        expected = ranks**-0.7 / np.sum(ranks**-0.7) * 30.0
+        np.testing.assert_allclose(np.sort(second.intensities_mm)[::-1], expected)
+
+    @pytest.mark.parametrize("peak_position", [0.01, 0.33, 0.5, 0.8, 0.99])
+    @pytest.mark.parametrize("n_steps", [1, 2, 3, 4, 7, 12, 13, 50])
+    def test_euler_ii_alternating_block_order(self, peak_position, n_steps):
+        """Test placement against the step-by-step alternating block rule."""
+        result = EulerIIHietogram(peak_position).generate(
+            total_mm=1.0, duration_min=5.0 * n_steps, timestep_min=5.0
+        )
+        ranked = np.sort(result.intensities_mm)[::-1]
+
+        # Reference: highest at peak, then left/right alternately starting
+        # left, continuing on the remaining side once one side is full
+        peak_idx = min(max(int(n_steps * peak_position), 1), n_steps - 1)
+        expected = np.zeros(n_steps)
+        expected[peak_idx] = ranked[0]
+        left, right, place_left = peak_idx - 1, peak_idx + 1, True
+        for value in ranked[1:]:
+            if place_left and left >= 0:
+                expected[left], left, place_left = value, left - 1, False
+            elif right < n_steps:
+                expected[right], right, place_left = value, right + 1, True
+            else:
+                expected[left], left = value, left - 1
+
+        np.testing.assert_array_equal(result.intensities_mm, expected)
+
+    @pytest.mark.parametrize("n_steps", [1, 2, 3, 8, 13, 288])
+    def test_euler_ii_offsets_cover_every_step(self, n_steps):
+        """Test that the peak and its offsets index each step exactly once."""
+        from hydrolog.precipitation.hietogram import _alternating_block_offsets
+
+        for peak_idx in range(n_steps):
+            offsets = _alternating_block_offsets(n_steps, peak_idx)
+            placed = np.concatenate(([peak_idx], peak_idx + offsets))
+            np.testing.assert_array_equal(np.sort(placed), np.arange(n_steps))
@@ -1,6 +1,7 @@
 """Tests for morphometry module."""
 
 import math
+import tracemalloc
 
 import numpy as np
 import pytest
@@ -15,6 +16,8 @@ from hydrolog.morphometry import (
     HypsometricCurve,
     HypsometricResult,
 )
+from hydrolog.morphometry import hypsometry
+from hydrolog.morphometry.terrain import _weighted_sum
 from hydrolog.exceptions import InvalidParameterError
 
 
@@ -166,6 +169,110 @@ class TestWatershedGeometry:
         with pytest.raises(InvalidParameterError, match="length_km"):
             WatershedGeometry(area_km2=45.0, perimeter_km=32.0, length_km=0)
 
+    def test_indicator_identities(self):
+        """Test the identities linking indicators to Cf and Cz."""
+        geom = WatershedGeometry(area_km2=45.0, perimeter_km=32.0, length_km=12.0)
+        cf = geom.form_factor()
+        cz = geom.compactness_coefficient()
+
+        assert geom.circularity_ratio() == pytest.approx(1.0 / cz**2, rel=1e-15)
+        assert geom.elongation_ratio() == pytest.approx(
+            2.0 * math.sqrt(cf / math.pi), rel=1e-15
+        )
+        assert geom.lemniscate_ratio() == pytest.approx(1.0 / (4.0 * cf), rel=1e-15)
+        assert geom.get_shape_indicators() is geom.get_shape_indicators()
+
+    def test_immutable_and_hashable(self):
+        """Test that geometry is frozen, compared and hashed by value."""
+        geom = WatershedGeometry(area_km2=45.0, perimeter_km=32.0, length_km=12.0)
+        same = WatershedGeometry(area_km2=45.0, perimeter_km=32.0, length_km=12.0)
+
+        with pytest.raises(AttributeError):
+            geom.area_km2 = 50.0
+        assert geom == same
+        assert hash(geom) == hash(same)
+        assert not hasattr(geom, "__dict__")
+
+    def test_result_dataclasses_are_frozen(self):
+        """Test that parameter and indicator results are slotted and frozen."""
+        geom = WatershedGeometry(area_km2=45.0, perimeter_km=32.0, length_km=12.0)
+        params = geom.get_parameters()
+        indicators = geom.get_shape_indicators()
+
+        assert not hasattr(params, "__dict__")
+        assert not hasattr(indicators, "__dict__")
+        with pytest.raises(AttributeError):
+            params.area_km2 = 50.0
+        with pytest.raises(AttributeError):
+            indicators.form_factor = 1.0
+        assert {indicators: "cached"}[geom.get_shape_indicators()] == "cached"
+
+
+class TestShapeIndicatorsFromArrays:
+    """Tests for vectorized ShapeIndicators.from_arrays()."""
+
+    def test_matches_watershed_geometry(self):
+        """Test that each element equals the per-watershed result."""
+        areas = [45.0, 12.0, 310.5]
+        perimeters = [32.0, 15.0, 98.2]
+        lengths = [12.0, 5.0, 31.0]
+
+        result = ShapeIndicators.from_arrays(areas, perimeters, lengths)
+
+        for i in range(3):
+            expected = WatershedGeometry(
+                area_km2=areas[i], perimeter_km=perimeters[i], length_km=lengths[i]
+            ).get_shape_indicators()
+            assert result["form_factor"][i] == expected.form_factor
+            assert (
+                result["compactness_coefficient"][i] == expected.compactness_coefficient
+            )
+            assert result["circularity_ratio"][i] == expected.circularity_ratio
+            assert result["elongation_ratio"][i] == expected.elongation_ratio
+            assert result["lemniscate_ratio"][i] == expected.lemniscate_ratio
+
+    def test_broadcasts_scalar(self):
+        """Test that a scalar perimeter is broadcast against arrays."""
+        result = ShapeIndicators.from_arrays([45.0, 90.0], 32.0, [12.0, 12.0])
+
+        assert result["circularity_ratio"].shape == (2,)
+        assert result["circularity_ratio"][1] == pytest.approx(
+            2.0 * result["circularity_ratio"][0]
+        )
+
+    def test_invalid_values(self):
+        """Test that a non-positive value raises error."""
+        with pytest.raises(InvalidParameterError, match="length_km"):
+            ShapeIndicators.from_arrays([45.0, 12.0], [32.0, 15.0], [12.0, 0.0])
+
+
+class TestShapeIndicatorsFromRecords:
+    """Tests for ShapeIndicators.from_records()."""
+
+    def test_matches_from_arrays(self):
+        """Test that records give the same result as from_arrays()."""
+        records = [
+            {"area_km2": 45.0, "perimeter_km": 32.0, "length_km": 12.0},
+            {"area_km2": 12.0, "perimeter_km": 15.0, "length_km": 5.0, "cn": 72},
+        ]
+
+        result = ShapeIndicators.from_records(records)
+        expected = ShapeIndicators.from_arrays([45.0, 12.0], [32.0, 15.0], [12.0, 5.0])
+
+        for name, values in expected.items():
+            np.testing.assert_array_equal(result[name], values)
+
+    def test_missing_key(self):
+        """Test that a record without a required key raises KeyError."""
+        with pytest.raises(KeyError):
+            ShapeIndicators.from_records([{"area_km2": 45.0, "perimeter_km": 32.0}])
+
+    def test_invalid_value(self):
+        """Test that a non-positive value raises error."""
+        records = [{"area_km2": -1.0, "perimeter_km": 32.0, "length_km": 12.0}]
+        with pytest.raises(InvalidParameterError, match="area_km2"):
+            ShapeIndicators.from_records(records)
+
 
 class TestTerrainAnalysis:
     """Tests for TerrainAnalysis class."""
@@ -305,6 +412,20 @@ class TestTerrainAnalysis:
         assert params.watershed_slope_percent > 0
         assert params.channel_slope_percent > 0
 
+    def test_result_dataclasses_are_frozen(self):
+        """Test that elevation and slope results are slotted and frozen."""
+        terrain = TerrainAnalysis(
+            elevation_min_m=150.0, elevation_max_m=520.0, length_km=12.0
+        )
+
+        for params in (
+            terrain.get_elevation_parameters(),
+            terrain.get_slope_parameters(),
+        ):
+            assert not hasattr(params, "__dict__")
+        with pytest.raises(AttributeError):
+            terrain.get_elevation_parameters().relief_m = 1.0
+
     def test_mean_elevation_from_dem(self):
         """Test mean elevation calculation from DEM."""
         elevations = np.array([100, 150, 200, 250, 300])
@@ -322,6 +443,53 @@ class TestTerrainAnalysis:
         # Weighted mean: (100*1 + 200*2 + 300*1) / 4 = 200
         assert mean_elev == 200.0
 
+    def test_mean_elevation_from_dem_weighted_grid(self):
+        """Test weighted mean of a 2-D DEM with matching cell areas."""
+        elevations = np.array([[100.0, 200.0], [300.0, 400.0]])
+        weights = np.array([[1.0, 1.0], [1.0, 3.0]])
+
+        mean_elev = TerrainAnalysis.mean_elevation_from_dem(elevations, weights)
+
+        assert mean_elev == pytest.approx(np.average(elevations, weights=weights))
+
+    def test_weighted_sum_dtypes(self):
+        """Test the BLAS and einsum weighted sums against a float64 loop."""
+        rng = np.random.default_rng(15)
+        values = rng.normal(300.0, 40.0, (30, 40))
+        weights = rng.uniform(0.5, 1.5, (30, 40))
+        expected = math.fsum((values * weights).ravel())
+
+        assert _weighted_sum(values, weights) == pytest.approx(expected, rel=1e-13)
+        assert _weighted_sum(
+            values.astype(np.float32), weights.astype(np.float32)
+        ) == pytest.approx(expected, rel=1e-6)
+        assert _weighted_sum(np.arange(4), np.array([1, 2, 3, 4])) == 20.0
+
+    def test_mean_elevation_from_dem_float32_and_int(self):
+        """Test non-float64 DEMs (no coercion copy) against float64."""
+        elevations = np.random.default_rng(4).normal(300.0, 40.0, 1000)
+        expected = TerrainAnalysis.mean_elevation_from_dem(elevations)
+
+        mean32 = TerrainAnalysis.mean_elevation_from_dem(elevations.astype(np.float32))
+        assert mean32 == pytest.approx(expected, rel=1e-6)
+        assert TerrainAnalysis.mean_elevation_from_dem(
+            np.array([100, 200, 400]), np.array([1, 1, 2])
+        ) == pytest.approx(275.0)
+
+    def test_mean_elevation_from_dem_weights_shape_mismatch(self):
+        """Test that weights of a different shape raise error."""
+        with pytest.raises(InvalidParameterError, match="must match"):
+            TerrainAnalysis.mean_elevation_from_dem(
+                np.array([100.0, 200.0, 300.0]), np.array([1.0, 2.0])
+            )
+
+    def test_mean_elevation_from_dem_zero_weights(self):
+        """Test that weights summing to zero raise error."""
+        with pytest.raises(InvalidParameterError, match="sum to zero"):
+            TerrainAnalysis.mean_elevation_from_dem(
+                np.array([100.0, 200.0]), np.array([0.0, 0.0])
+            )
+
     def test_invalid_elevation_order(self):
         """Test that max <= min raises error."""
         with pytest.raises(InvalidParameterError, match="elevation_max_m"):
@@ -387,6 +555,211 @@ class TestHypsometricCurve:
         assert rel_a[0] == 1.0  # All area above minimum
         assert rel_a[-1] <= 0.2 + 0.01  # Small area above maximum
 
+    def test_generate_curve_matches_threshold_sums(self):
+        """Test the sorted curve against area sums above each threshold."""
+        rng = np.random.default_rng(42)
+        elevations = np.round(rng.normal(300.0, 40.0, 2000))  # with ties
+        areas = rng.uniform(0.5, 1.5, 2000)
+        hypso = HypsometricCurve(elevations, cell_areas=areas)
+
+        rel_h, rel_a = hypso.generate_curve(n_points=51)
+
+        thresholds = np.linspace(hypso.elevation_min, hypso.elevation_max, 51)
+        expected = [areas[elevations >= t].sum() / areas.sum() for t in thresholds]
+        np.testing.assert_allclose(rel_a, expected, rtol=1e-12)
+
+    def test_bucketed_curve_matches_sorted(self, monkeypatch):
+        """Test the sort-free large-DEM path against the sorted path."""
+        rng = np.random.default_rng(7)
+        elevations = np.round(rng.normal(300.0, 40.0, 5000))
+        areas = rng.uniform(0.5, 1.5, 5000)
+        expected = HypsometricCurve(elevations, areas).generate_curve(n_points=51)
+
+        monkeypatch.setattr(hypsometry, "_BUCKET_MIN_CELLS", 0)
+        hypso = HypsometricCurve(elevations, areas)
+        rel_h, rel_a = hypso.generate_curve(n_points=51)
+
+        assert hypso._sorted is None  # no sort was needed
+        np.testing.assert_array_equal(rel_h, expected[0])
+        np.testing.assert_allclose(rel_a, expected[1], rtol=1e-12)
+
+    def test_uniform_curve_from_histogram(self):
+        """Test the equal-area histogram path against threshold counts."""
+        elevations = np.round(np.random.default_rng(8).normal(300.0, 40.0, 3000))
+        hypso = HypsometricCurve(elevations)
+
+        rel_h, rel_a = hypso.generate_curve(n_points=41)
+
+        assert hypso._sorted is None  # no sort was needed
+        thresholds = np.linspace(hypso.elevation_min, hypso.elevation_max, 41)
+        expected = [np.count_nonzero(elevations >= t) / 3000 for t in thresholds]
+        np.testing.assert_array_equal(rel_a, expected)
+
+    def test_default_curve_thresholds_cached(self):
+        """Test that the default curve reuses its linspace thresholds."""
+        rng = np.random.default_rng(12)
+        elevations = rng.uniform(100.0, 500.0, 500)
+        hypso = HypsometricCurve(elevations, cell_areas=rng.uniform(0.5, 1.5, 500))
+        assert hypso._default_thresholds is None
+
+        rel_h, rel_a = hypso.generate_curve()
+        thresholds = hypso._default_thresholds
+        np.testing.assert_array_equal(
+            thresholds, np.linspace(hypso.elevation_min, hypso.elevation_max, 101)
+        )
+        assert hypso._elevation_thresholds(101) is thresholds
+        assert hypso._elevation_thresholds(51).size == 51
+        assert rel_a[-1] > 0 and rel_a[0] == pytest.approx(1.0)
+
+    def test_integer_curve_from_level_counts(self):
+        """Test the per-level path for integer DEMs against threshold sums."""
+        rng = np.random.default_rng(13)
+        elevations = np.round(rng.normal(-20.0, 40.0, 3000)).astype(np.int32)
+        areas = rng.uniform(0.5, 1.5, 3000)
+
+        for cell_areas in (None, areas):
+            hypso = HypsometricCurve(elevations, cell_areas=cell_areas)
+            weights = np.ones(3000) if cell_areas is None else areas
+
+            rel_h, rel_a = hypso.generate_curve(n_points=37)
+
+            assert hypso._sorted is None  # no sort was needed
+            assert hypso._level_areas is not None
+            thresholds = np.linspace(hypso.elevation_min, hypso.elevation_max, 37)
+            expected = [
+                weights[elevations >= t].sum() / weights.sum() for t in thresholds
+            ]
+            np.testing.assert_allclose(rel_a, expected, rtol=1e-12)
+
+    def test_integer_curve_skips_sparse_levels(self):
+        """Test that integer DEMs spanning more levels than cells are sorted."""
+        hypso = HypsometricCurve(
+            np.array([0, 5000, 10000]), cell_areas=np.array([1.0, 2.0, 1.0])
+        )
+
+        rel_h, rel_a = hypso.generate_curve(n_points=3)
+
+        assert hypso._level_areas is None
+        np.testing.assert_allclose(rel_a, [1.0, 0.75, 0.25])
+
+    def test_relative_heights_shared_across_dems(self):
+        """Test that relative heights are the exact [0, 1] grid for any DEM."""
+        first = HypsometricCurve(np.array([103.7, 250.0, 411.3]))
+        second = HypsometricCurve(np.array([-12.0, 0.5, 3.25, 8.0]))
+
+        rel_h, _ = first.generate_curve(n_points=21)
+        np.testing.assert_array_equal(rel_h, np.linspace(0.0, 1.0, 21))
+        rel_h[:] = -1.0  # callers get their own copy
+        np.testing.assert_array_equal(
+            second.generate_curve(n_points=21)[0], np.linspace(0.0, 1.0, 21)
+        )
+
+    def test_curve_computed_once_per_n_points(self, monkeypatch):
+        """Test that analyze() reuses one cached curve per n_points."""
+        hypso = HypsometricCurve(np.linspace(100, 500, 1000))
+        calls = []
+        compute = HypsometricCurve._compute_curve
+        monkeypatch.setattr(
+            HypsometricCurve,
+            "_compute_curve",
+            lambda self, n: calls.append(n) or compute(self, n),
+        )
+
+        result = hypso.analyze(n_points=51)
+        assert hypso.hypsometric_integral(n_points=51) == result.hypsometric_integral
+        hypso.hypsometric_integral(n_points=21)
+
+        assert calls == [51, 21]
+
+    def test_sorted_profile_peak_memory(self):
+        """Test that sorting a weighted DEM peaks at three N-sized arrays."""
+        rng = np.random.default_rng(16)
+        n = 200_000
+        hypso = HypsometricCurve(
+            rng.normal(300.0, 40.0, n), cell_areas=rng.uniform(0.5, 1.5, n)
+        )
+
+        tracemalloc.start()
+        try:
+            hypso._sorted_profile()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 3.1 * 8 * n
+
+    def test_analyze_sorts_dem_once(self, monkeypatch):
+        """Test that analyze() and later queries share a single sort."""
+        rng = np.random.default_rng(14)
+        hypso = HypsometricCurve(
+            rng.normal(300.0, 40.0, 1000), cell_areas=rng.uniform(0.5, 1.5, 1000)
+        )
+        calls = []
+        argsort = np.argsort
+        monkeypatch.setattr(
+            hypsometry.np,
+            "argsort",
+            lambda *a, **kw: calls.append(1) or argsort(*a, **kw),
+        )
+
+        result = hypso.analyze()
+        assert hypso.hypsometric_integral() == result.hypsometric_integral
+        assert hypso.elevation_at_percentile(50) == result.elevation_median_m
+        hypso.generate_curve(n_points=51)
+
+        assert len(calls) == 1
+
+    def test_integral_matches_trapezoid(self):
+        """Test the equal-spacing trapezoid against np.trapezoid."""
+        elevations = np.random.default_rng(11).gamma(2.0, 50.0, 5000) + 100.0
+        hypso = HypsometricCurve(elevations)
+
+        for n_points in (2, 11, 101):
+            rel_h, rel_a = hypso.generate_curve(n_points)
+            assert hypso.hypsometric_integral(n_points) == pytest.approx(
+                np.trapezoid(rel_a, rel_h), rel=1e-14
+            )
+
+    def test_integral_flat_dem_is_nan(self):
+        """Test that a flat DEM (no relief) has an undefined integral."""
+        hypso = HypsometricCurve(np.full(10, 200.0))
+
+        with np.errstate(invalid="ignore"):
+            rel_h, _ = hypso.generate_curve()
+            result = hypso.analyze()
+
+        assert np.all(np.isnan(rel_h))
+        assert np.isnan(hypso.hypsometric_integral())
+        assert np.isnan(result.hypsometric_integral)
+
+    @pytest.mark.parametrize("nodata", [np.nan, np.inf])
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_non_finite_dem(self, nodata, weighted):
+        """Test that NaN/inf cells give a NaN integral instead of raising."""
+        elevations = np.array([100.0, 150.0, nodata, 250.0, 300.0])
+        areas = np.ones(5) if weighted else None
+        hypso = HypsometricCurve(elevations, areas)
+
+        with np.errstate(invalid="ignore"):
+            rel_h, rel_a = hypso.generate_curve(n_points=11)
+            result = hypso.analyze()
+
+        assert np.isnan(hypso.hypsometric_integral())
+        assert np.isnan(result.hypsometric_integral)
+        assert np.all(np.isnan(rel_h[1:]))
+        # A cell is at or above a threshold only by direct comparison
+        expected = [0.0] + [0.2] * 10 if nodata == np.inf else [0.0] * 11
+        np.testing.assert_array_equal(rel_a, expected)
+
+    def test_generate_curve_returns_copies(self):
+        """Test that modifying a returned curve does not affect the cache."""
+        hypso = HypsometricCurve(np.array([100, 150, 200, 250, 300]))
+
+        rel_h, rel_a = hypso.generate_curve(n_points=11)
+        rel_a[:] = 0.0
+
+        assert hypso.generate_curve(n_points=11)[1][0] == 1.0
+
     def test_mean_elevation(self):
         """Test mean elevation calculation."""
         elevations = np.array([100, 150, 200, 250, 300])
@@ -417,6 +790,117 @@ class TestHypsometricCurve:
         # Should be close to middle elevation
         assert 290 < median < 310
 
+    def test_uniform_percentile_matches_sorted_lookup(self):
+        """Test the selection path for equal areas against the sorted path."""
+        elevations = np.round(np.random.default_rng(3).normal(300.0, 30.0, 101))
+        hypso = HypsometricCurve(elevations)
+        percentiles = [0.0, 0.1, 100.0 / 3.0, 50.0, 99.9, 100.0]
+
+        selected = [hypso.elevation_at_percentile(p) for p in percentiles]
+        assert hypso._sorted is None  # answered without sorting
+        hypso._sorted_profile()
+        looked_up = [hypso.elevation_at_percentile(p) for p in percentiles]
+
+        assert selected == looked_up
+
+    def test_slots_and_cached_extremes(self):
+        """Test that the instance has no __dict__ and extremes are cached."""
+        hypso = HypsometricCurve(np.array([120.0, 480.0, 300.0]))
+
+        assert not hasattr(hypso, "__dict__")
+        assert hypso.elevation_min == 120.0
+        assert hypso.elevation_max == 480.0
+        assert hypso.relief == 360.0
+
+    def test_float32_storage(self):
+        """Test float32 storage against the default float64 analysis."""
+        rng = np.random.default_rng(5)
+        elevations = rng.normal(300.0, 40.0, 10000)
+        areas = rng.uniform(0.5, 1.5, 10000)
+
+        expected = HypsometricCurve(elevations, areas).analyze()
+        hypso = HypsometricCurve(elevations, areas, dtype=np.float32)
+        result = hypso.analyze()
+
+        assert hypso.elevations.dtype == np.float32
+        assert hypso.cell_areas.dtype == np.float32
+        assert hypso.total_area == pytest.approx(areas.sum(), rel=1e-6)
+        assert result.hypsometric_integral == pytest.approx(
+            expected.hypsometric_integral, rel=1e-4
+        )
+        assert result.elevation_mean_m == pytest.approx(
+            expected.elevation_mean_m, rel=1e-6
+        )
+
+    def test_contiguous_input_not_copied(self):
+        """Test that a contiguous float64 DEM grid is used without a copy."""
+        dem = np.linspace(100.0, 500.0, 600).reshape(20, 30)
+        areas = np.full((20, 30), 0.01)
+
+        hypso = HypsometricCurve(dem, cell_areas=areas)
+
+        assert hypso.elevations.shape == (600,)
+        assert np.shares_memory(hypso.elevations, dem)
+        assert np.shares_memory(hypso.cell_areas, areas)
+
+    def test_invalid_dtype(self):
+        """Test that a non-floating dtype raises error."""
+        with pytest.raises(InvalidParameterError, match="dtype"):
+            HypsometricCurve(np.array([100.0, 200.0]), dtype=np.int32)
+
+    def test_elevation_at_percentiles_matches_scalar(self):
+        """Test the batch lookup against single-percentile calls."""
+        rng = np.random.default_rng(9)
+        elevations = rng.normal(300.0, 40.0, 500)
+        percentiles = [0.0, 10.0, 50.0, 90.0, 100.0]
+
+        for areas in (None, rng.uniform(0.5, 1.5, 500)):
+            hypso = HypsometricCurve(elevations, cell_areas=areas)
+            batch = hypso.elevation_at_percentiles(percentiles)
+
+            assert batch.shape == (5,)
+            assert batch.tolist() == [
+                hypso.elevation_at_percentile(p) for p in percentiles
+            ]
+
+    @pytest.mark.parametrize("case", ["uniform", "weighted", "presorted"])
+    def test_elevation_at_percentiles_scalar_input(self, case):
+        """Test that a 0-d percentile gives a 0-d array on every path."""
+        elevations = np.linspace(100, 500, 101)
+        areas = np.ones(101) if case == "weighted" else None
+        hypso = HypsometricCurve(elevations, cell_areas=areas)
+        if case == "presorted":
+            hypso._sorted_profile()  # equal areas search the sorted profile
+
+        result = hypso.elevation_at_percentiles(50)
+
+        assert isinstance(result, np.ndarray)
+        assert result.shape == ()
+        assert result == hypso.elevation_at_percentile(50)
+
+    def test_large_percentile_batch_keeps_order_and_shape(self):
+        """Test the ordered lookup of large batches against small ones."""
+        rng = np.random.default_rng(10)
+        hypso = HypsometricCurve(
+            rng.normal(300.0, 40.0, 2000), cell_areas=rng.uniform(0.5, 1.5, 2000)
+        )
+        percentiles = rng.uniform(0.0, 100.0, (40, 25))  # 1000 queries
+
+        batch = hypso.elevation_at_percentiles(percentiles)
+
+        assert batch.shape == (40, 25)
+        expected = np.concatenate(
+            [hypso.elevation_at_percentiles(row) for row in percentiles]
+        )
+        np.testing.assert_array_equal(batch.ravel(), expected)
+
+    def test_invalid_percentiles(self):
+        """Test that any percentile outside 0-100 raises error."""
+        hypso = HypsometricCurve(np.array([100.0, 200.0, 300.0]))
+
+        with pytest.raises(InvalidParameterError, match="percentiles"):
+            hypso.elevation_at_percentiles([10.0, 101.0])
+
     def test_analyze(self):
         """Test complete analysis."""
         elevations = np.linspace(100, 500, 1000)
@@ -431,6 +915,15 @@ class TestHypsometricCurve:
         assert 290 < result.elevation_mean_m < 310
         assert 290 < result.elevation_median_m < 310
 
+    def test_result_is_frozen(self):
+        """Test that the analysis result is slotted and frozen."""
+        result = HypsometricCurve(np.linspace(100, 500, 50)).analyze(n_points=11)
+
+        assert result.n_points == 11
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.hypsometric_integral = 0.5
+
     def test_young_watershed(self):
         """Test hypsometric integral for young (convex) watershed."""
         # High elevations dominate - HI > 0.6
@@ -473,6 +966,14 @@ class TestHypsometricCurve:
         with pytest.raises(InvalidParameterError, match="must match"):
             HypsometricCurve(elevations, cell_areas=areas)
 
+    def test_invalid_cell_areas_non_positive(self):
+        """Test that a zero cell area raises error."""
+        elevations = np.array([100, 200, 300])
+        areas = np.array([1.0, 0.0, 2.0])
+
+        with pytest.raises(InvalidParameterError, match="must be positive"):
+            HypsometricCurve(elevations, cell_areas=areas)
+
     def test_invalid_percentile(self):
         """Test that invalid percentile raises error."""
         elevations = np.array([100, 200, 300])
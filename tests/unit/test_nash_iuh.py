@@ -121,6 +121,31 @@ class TestNashIUHOrdinate:
         for t in [10.0, 30.0, 60.0, 90.0, 120.0]:
             assert iuh.ordinate(t) > 0
 
+    def test_large_n_is_finite(self):
+        """Test that a large n (Γ(n) beyond float range) stays finite."""
+        iuh = NashIUH(n=200.0, k_min=1.0)
+
+        result = iuh.generate_iuh(timestep_min=1.0)
+
+        assert np.all(np.isfinite(result.ordinates_per_min))
+        assert np.isfinite(iuh.peak_ordinate_per_min)
+        assert iuh.ordinate(iuh.time_to_peak_min) == pytest.approx(
+            iuh.peak_ordinate_per_min
+        )
+
+    def test_normalization_is_cached(self):
+        """Test that repeated (n, K) pairs reuse the cached constant."""
+        from hydrolog.runoff.nash_iuh import _nash_log_norm
+
+        _nash_log_norm.cache_clear()
+        first = NashIUH(n=3.0, k_min=30.0).generate_iuh(timestep_min=5.0)
+        second = NashIUH(n=3.0, k_min=30.0).generate_iuh(timestep_min=5.0)
+
+        info = _nash_log_norm.cache_info()
+        assert info.misses == 1
+        assert info.hits >= 1
+        np.testing.assert_array_equal(first.ordinates_per_min, second.ordinates_per_min)
+
 
 class TestNashIUHGenerate:
     """Tests for IUH generation."""
@@ -275,6 +300,69 @@ class TestNashIUHToUnitHydrograph:
             iuh.to_unit_hydrograph(area_km2=45.0, duration_min=0)
 
 
+class TestNashIUHToUnitHydrographBatch:
+    """Tests for batch conversion to D-minute unit hydrographs."""
+
+    def test_batch_matches_single(self):
+        """Test that each row matches the single-hydrograph result."""
+        n = [3.0, 1.5, 0.8]
+        k = [30.0, 10.0, 45.0]
+        area = [45.0, 2.0, 300.0]
+
+        batch = NashIUH.to_unit_hydrograph_batch(
+            n=n, k_min=k, area_km2=area, duration_min=10.0, timestep_min=5.0
+        )
+
+        for i in range(3):
+            single = NashIUH(n=n[i], k_min=k[i]).to_unit_hydrograph(
+                area_km2=area[i], duration_min=10.0, timestep_min=5.0
+            )
+            np.testing.assert_allclose(
+                batch.ordinates_m3s[i, : single.n_steps], single.ordinates_m3s
+            )
+            assert batch.time_to_peak_min[i] == single.time_to_peak_min
+            assert batch.peak_discharge_m3s[i] == pytest.approx(
+                single.peak_discharge_m3s
+            )
+
+    def test_batch_broadcasts_scalars(self):
+        """Test that scalar parameters are reused for every hydrograph."""
+        batch = NashIUH.to_unit_hydrograph_batch(
+            n=3.0, k_min=[20.0, 30.0, 40.0], area_km2=45.0, duration_min=10.0
+        )
+
+        assert batch.n_hydrographs == 3
+        assert batch.ordinates_m3s.shape == (3, batch.n_steps)
+
+    def test_batch_per_row_duration(self):
+        """Test that an array of durations is applied row by row."""
+        batch = NashIUH.to_unit_hydrograph_batch(
+            n=3.0, k_min=30.0, area_km2=45.0, duration_min=[10.0, 30.0]
+        )
+
+        for i, duration in enumerate((10.0, 30.0)):
+            single = NashIUH(n=3.0, k_min=30.0).to_unit_hydrograph(
+                area_km2=45.0, duration_min=duration
+            )
+            np.testing.assert_allclose(
+                batch.ordinates_m3s[i, : single.n_steps], single.ordinates_m3s
+            )
+
+    def test_batch_invalid_k_raises(self):
+        """Test that a non-positive storage constant raises error."""
+        with pytest.raises(InvalidParameterError, match="k_min"):
+            NashIUH.to_unit_hydrograph_batch(
+                n=3.0, k_min=[30.0, 0.0], area_km2=45.0, duration_min=10.0
+            )
+
+    def test_batch_incompatible_lengths_raises(self):
+        """Test that parameter arrays of different lengths raise error."""
+        with pytest.raises(InvalidParameterError, match="incompatible"):
+            NashIUH.to_unit_hydrograph_batch(
+                n=[2.0, 3.0], k_min=[10.0, 20.0, 30.0], area_km2=45.0, duration_min=10.0
+            )
+
+
 class TestNashIUHFromTC:
     """Tests for creating NashIUH from time of concentration.
 
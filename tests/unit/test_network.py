@@ -1,5 +1,7 @@
 """Unit tests for hydrolog.network module."""
 
+import dataclasses
+
 import pytest
 import numpy as np
 
@@ -13,6 +15,7 @@ from hydrolog.network import (
     stream_frequency,
 )
 from hydrolog.exceptions import InvalidParameterError
+from hydrolog.network import stream_order
 
 
 class TestStreamSegment:
@@ -31,6 +34,15 @@ class TestStreamSegment:
         seg = StreamSegment(segment_id=3, upstream_ids=[1, 2], length_km=2.0)
         assert seg.upstream_ids == [1, 2]
 
+    def test_slots(self):
+        """Test that segments carry no per-instance __dict__."""
+        seg = StreamSegment(segment_id=3, upstream_ids=[1, 2], length_km=2.0)
+
+        assert not hasattr(seg, "__dict__")
+        assert dataclasses.asdict(seg)["upstream_ids"] == [1, 2]
+        with pytest.raises(AttributeError):
+            seg.name = "Wisła"
+
 
 class TestStreamNetwork:
     """Tests for StreamNetwork class."""
@@ -185,6 +197,142 @@ class TestStrahlerDifferentOrders:
 
         assert network.segments[5].order == 2  # Higher order continues
 
+    @pytest.mark.parametrize(
+        "upstream_orders, expected",
+        [
+            ([], 1),
+            ([3], 3),
+            ([2, 1], 2),
+            ([1, 2], 2),
+            ([2, 2], 3),
+            ([1, 2, 1], 2),
+            ([2, 1, 2], 3),
+            ([1, 1, 3, 2, 3], 4),
+        ],
+    )
+    def test_strahler_order_rule(self, upstream_orders, expected):
+        """Test the confluence rule for various upstream combinations."""
+        network = StreamNetwork([StreamSegment(1, [])])
+        assert network._strahler_order(upstream_orders) == expected
+
+
+def _random_network(n_headwaters: int, seed: int) -> list[StreamSegment]:
+    """Build a random binary river network (shuffled segment order)."""
+    rng = np.random.default_rng(seed)
+    segments = [
+        StreamSegment(i, [], length_km=float(rng.uniform(0.2, 2.0)))
+        for i in range(n_headwaters)
+    ]
+    open_ids = list(range(n_headwaters))
+    next_id = n_headwaters
+    while len(open_ids) > 1:
+        i, j = sorted(rng.choice(len(open_ids), size=2, replace=False))
+        up = [open_ids.pop(j), open_ids.pop(i)]
+        segments.append(StreamSegment(next_id, up, float(rng.uniform(0.5, 3.0))))
+        open_ids.append(next_id)
+        next_id += 1
+    return [segments[k] for k in rng.permutation(len(segments))]
+
+
+class TestLargeNetwork:
+    """Tests of the network traversal on larger random networks."""
+
+    def test_downstream_index_matches_scan(self):
+        """Test the prebuilt downstream index against a full scan."""
+        segments = _random_network(200, seed=1)
+        segments.append(StreamSegment(10_000, [5, 5, 99_999]))  # odd input
+        network = StreamNetwork(segments)
+
+        for seg_id in network.segments:
+            expected = [
+                other.segment_id for other in segments if seg_id in other.upstream_ids
+            ]
+            assert network._get_downstream_segments(seg_id) == expected
+
+    @pytest.mark.parametrize("min_level_size", [0, 10**9])
+    @pytest.mark.parametrize("method", list(OrderingMethod))
+    def test_classify_matches_recursive_definition(
+        self, method, min_level_size, monkeypatch
+    ):
+        """Test both classification passes against the recursive definition."""
+        monkeypatch.setattr(stream_order, "_VECTORIZED_MIN_LEVEL_SIZE", min_level_size)
+        segments = _random_network(300, seed=2)
+        segments.append(StreamSegment(10_000, [0, 0]))  # repeated upstream ID
+        by_id = {seg.segment_id: seg for seg in segments}
+        network = StreamNetwork(segments)
+        network.classify(method)
+
+        def expected(seg_id: int) -> int:
+            upstream = [expected(up) for up in by_id[seg_id].upstream_ids]
+            if not upstream:
+                return 1
+            if method is OrderingMethod.SHREVE:
+                return sum(upstream)
+            top = max(upstream)
+            return top + 1 if upstream.count(top) >= 2 else top
+
+        for seg in segments:
+            assert seg.order == expected(seg.segment_id)
+
+    @pytest.mark.parametrize("min_level_size", [0, 10**9])
+    def test_unresolvable_segments_keep_order_zero(self, min_level_size, monkeypatch):
+        """Test that unknown upstream IDs and cycles do not hang classify."""
+        monkeypatch.setattr(stream_order, "_VECTORIZED_MIN_LEVEL_SIZE", min_level_size)
+        segments = [
+            StreamSegment(1, []),
+            StreamSegment(2, [1, 99]),  # 99 does not exist
+            StreamSegment(3, [2]),
+            StreamSegment(4, [1, 5]),  # 4 and 5 form a cycle
+            StreamSegment(5, [4]),
+        ]
+        network = StreamNetwork(segments)
+        for seg in segments:
+            seg.order = 7  # stale orders must be cleared
+        network.classify()
+
+        assert [seg.order for seg in segments] == [1, 0, 0, 0, 0]
+
+    def test_statistics_match_grouped_segments(self):
+        """Test the per-order tallies against grouping the segments."""
+        segments = _random_network(500, seed=4)
+        network = StreamNetwork(segments, area_km2=120.0)
+        network.classify(OrderingMethod.STRAHLER)
+
+        stats = network.get_statistics()
+
+        for order, count in stats.segment_counts.items():
+            group = [seg.length_km for seg in segments if seg.order == order]
+            assert count == len(group)
+            assert stats.total_lengths_km[order] == pytest.approx(sum(group))
+            assert stats.mean_lengths_km[order] == pytest.approx(np.mean(group))
+        assert sum(stats.segment_counts.values()) == len(segments)
+        assert stats.drainage_density == pytest.approx(
+            sum(seg.length_km for seg in segments) / 120.0
+        )
+
+        stats.segment_counts[1] = -1  # results do not share the tallies
+        assert network.get_statistics().segment_counts[1] > 0
+
+    def test_reclassify_reuses_topology(self):
+        """Test that Strahler and Shreve passes share one traversal plan."""
+        network = StreamNetwork(_random_network(2000, seed=3))
+        network.classify(OrderingMethod.SHREVE)
+        topology = network._topology
+
+        assert topology is not None and topology.vectorized
+        network.classify(OrderingMethod.STRAHLER)
+        assert network._topology is topology
+        assert max(seg.order for seg in network.segments.values()) > 2
+
+    def test_headwaters_found_at_construction(self):
+        """Test that headwaters are listed once, in input order."""
+        segments = _random_network(300, seed=4)
+        network = StreamNetwork(segments)
+        expected = tuple(seg.segment_id for seg in segments if not seg.upstream_ids)
+
+        assert network._headwaters == expected
+        assert network._find_headwaters() is network._headwaters
+
 
 class TestBifurcationRatio:
     """Tests for bifurcation_ratio function."""
@@ -0,0 +1,79 @@
+"""Tests for the hydrolog package and subpackage namespaces."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import hydrolog
+from hydrolog import exceptions
+
+
+class TestPackageExports:
+    """Tests for lazily resolved top-level exports."""
+
+    @pytest.mark.parametrize(
+        "name", ["HydrologError", "InvalidParameterError", "CalculationError"]
+    )
+    def test_exception_reexports(self, name):
+        """Test that exceptions resolve to the hydrolog.exceptions classes."""
+        assert getattr(hydrolog, name) is getattr(exceptions, name)
+
+    def test_from_import(self):
+        """Test that 'from hydrolog import ...' still works."""
+        from hydrolog import HydrologError, InvalidParameterError
+
+        assert issubclass(InvalidParameterError, HydrologError)
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ is available."""
+        for name in hydrolog.__all__:
+            assert getattr(hydrolog, name) is not None
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            hydrolog.missing  # noqa: B018
+
+
+class TestSubpackageExports:
+    """Tests for lazily resolved subpackage re-exports."""
+
+    @pytest.mark.parametrize(
+        "package",
+        ["hydrolog.precipitation", "hydrolog.network"],
+    )
+    def test_all_names_resolve(self, package):
+        """Test that every name in __all__ matches its defining submodule."""
+        module = importlib.import_module(package)
+        for name in module.__all__:
+            source = importlib.import_module(module._LAZY[name])
+            assert getattr(module, name) is getattr(source, name)
+
+    def test_from_import(self):
+        """Test that 'from hydrolog.precipitation import ...' still works."""
+        from hydrolog.precipitation import BlockHietogram, Station
+
+        assert BlockHietogram.__module__ == "hydrolog.precipitation.hietogram"
+        assert Station.__module__ == "hydrolog.precipitation.interpolation"
+
+    def test_submodules_not_imported_eagerly(self):
+        """Test that importing the package does not load its submodules."""
+        code = (
+            "import sys, hydrolog.precipitation, hydrolog.network; "
+            "assert 'hydrolog.precipitation.hietogram' not in sys.modules; "
+            "assert 'hydrolog.precipitation.interpolation' not in sys.modules; "
+            "assert 'hydrolog.network.stream_order' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.parametrize(
+        "package",
+        ["hydrolog.precipitation", "hydrolog.network"],
+    )
+    def test_unknown_attribute(self, package):
+        """Test that unknown attributes raise AttributeError."""
+        module = importlib.import_module(package)
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            module.missing  # noqa: B018
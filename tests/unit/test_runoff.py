@@ -131,6 +131,84 @@ class TestSCSCN:
         c = scs.runoff_coefficient(0.0)
         assert c == 0.0
 
+    def test_result_runoff_coefficient(self):
+        """Test runoff coefficient carried on the result."""
+        scs = SCSCN(cn=72)
+        result = scs.effective_precipitation(50.0)
+        assert result.runoff_coefficient == pytest.approx(
+            result.total_effective_mm / 50.0
+        )
+
+    def test_result_runoff_coefficient_hyetograph(self):
+        """Test runoff coefficient for array input uses total depths."""
+        scs = SCSCN(cn=72)
+        precip = np.array([10.0, 20.0, 15.0, 5.0])
+        result = scs.effective_precipitation(precip)
+        assert result.runoff_coefficient == pytest.approx(
+            result.total_effective_mm / precip.sum()
+        )
+
+    def test_result_runoff_coefficient_zero_precip(self):
+        """Test runoff coefficient on the result with zero precipitation."""
+        scs = SCSCN(cn=72)
+        result = scs.effective_precipitation(0.0)
+        assert result.runoff_coefficient == 0.0
+
+    def test_result_constructed_without_runoff_coefficient(self):
+        """Test that the result can still be built with the original fields."""
+        from hydrolog.runoff import EffectivePrecipitationResult
+
+        positional = EffectivePrecipitationResult(7.1, 7.1, 98.8, 19.8, 72)
+        keyword = EffectivePrecipitationResult(
+            effective_mm=7.1,
+            total_effective_mm=7.1,
+            retention_mm=98.8,
+            initial_abstraction_mm=19.8,
+            cn_adjusted=72,
+        )
+
+        assert positional == keyword
+        assert keyword.runoff_coefficient is None
+
+    def test_effective_precipitation_batch_matches_scalar(self):
+        """Test batch Pe matches scalar calls for independent totals."""
+        scs = SCSCN(cn=72)
+        precip = np.array([0.0, 10.0, 25.0, 50.0, 100.0])
+        pe = scs.effective_precipitation_batch(precip, amc=AMC.III)
+        expected = [
+            scs.effective_precipitation(float(p), amc=AMC.III).total_effective_mm
+            for p in precip
+        ]
+        np.testing.assert_allclose(pe, expected)
+
+    def test_effective_precipitation_batch_keeps_shape(self):
+        """Test batch Pe preserves input shape (e.g. a raster)."""
+        scs = SCSCN(cn=80)
+        precip = np.full((3, 4), 40.0)
+        pe = scs.effective_precipitation_batch(precip)
+        assert pe.shape == (3, 4)
+        assert np.all(pe == pe[0, 0])
+
+    def test_effective_precipitation_batch_out(self):
+        """Test batch Pe written into a preallocated (or input) buffer."""
+        scs = SCSCN(cn=72)
+        precip = np.array([5.0, 30.0, 60.0, 120.0])
+        expected = scs.effective_precipitation_batch(precip)
+
+        out = np.empty_like(precip)
+        result = scs.effective_precipitation_batch(precip, out=out)
+        assert result is out
+        np.testing.assert_array_equal(out, expected)
+
+        scs.effective_precipitation_batch(precip, out=precip)
+        np.testing.assert_array_equal(precip, expected)
+
+    def test_effective_precipitation_batch_cn100(self):
+        """Test batch Pe with CN=100 (no retention)."""
+        scs = SCSCN(cn=100)
+        pe = scs.effective_precipitation_batch([0.0, 30.0])
+        np.testing.assert_allclose(pe, [0.0, 30.0])
+
     def test_invalid_cn_too_low(self):
         """Test that CN < 1 raises error."""
         with pytest.raises(InvalidParameterError, match="cn must be in range"):
@@ -219,6 +297,46 @@ class TestSCSUnitHydrograph:
         with pytest.raises(InvalidParameterError, match="timestep_min"):
             uh.generate(timestep_min=0)
 
+    def test_dimensionless_table_is_read_only(self):
+        """Test that the shared NRCS dimensionless table cannot be modified."""
+        from hydrolog.runoff.unit_hydrograph import SCS_DIMENSIONLESS_UH
+
+        with pytest.raises(ValueError):
+            SCS_DIMENSIONLESS_UH[10, 1] = 0.5
+
+    def test_generate_batch_matches_generate(self):
+        """Test that each batch row equals the single-watershed hydrograph."""
+        areas = [45.0, 3.0, 100.0]
+        tcs = [90.0, 20.0, 300.0]
+
+        batch = SCSUnitHydrograph.generate_batch(areas, tcs, timestep_min=7.0)
+
+        for i, (area, tc) in enumerate(zip(areas, tcs)):
+            single = SCSUnitHydrograph(area_km2=area, tc_min=tc).generate(7.0)
+            np.testing.assert_array_equal(
+                batch.ordinates_m3s[i, : single.n_steps], single.ordinates_m3s
+            )
+            assert np.all(batch.ordinates_m3s[i, single.n_steps :] == 0.0)
+            assert batch.peak_discharge_m3s[i] == single.peak_discharge_m3s
+            assert batch.time_to_peak_min[i] == single.time_to_peak_min
+
+    def test_generate_batch_broadcasts_scalar(self):
+        """Test that a scalar tc is reused for every area."""
+        batch = SCSUnitHydrograph.generate_batch([10.0, 20.0], 60.0)
+
+        assert batch.n_hydrographs == 2
+        np.testing.assert_allclose(batch.ordinates_m3s[1], 2.0 * batch.ordinates_m3s[0])
+
+    def test_generate_batch_invalid_area(self):
+        """Test that a non-positive area in the batch raises error."""
+        with pytest.raises(InvalidParameterError, match="area_km2"):
+            SCSUnitHydrograph.generate_batch([45.0, -1.0], 90.0)
+
+    def test_generate_batch_incompatible_lengths(self):
+        """Test that area and tc arrays of different lengths raise error."""
+        with pytest.raises(InvalidParameterError, match="incompatible"):
+            SCSUnitHydrograph.generate_batch([1.0, 2.0, 3.0], [60.0, 90.0])
+
 
 class TestConvolution:
     """Tests for discrete convolution."""
@@ -359,6 +477,26 @@ class TestHydrographGenerator:
             abs(np.sum(result.effective_precip_mm) - result.total_effective_mm) < 0.01
         )
 
+    def test_generator_float32_hietogram(self):
+        """Test that a float32 hyetograph gives the float64 hydrograph."""
+        hietogram = BetaHietogram(alpha=2.0, beta=5.0)
+        generator = HydrographGenerator(area_km2=45.0, cn=75, tc_min=60.0)
+
+        expected = generator.generate(hietogram.generate(80.0, 120.0, 5.0))
+        result = generator.generate(
+            hietogram.generate(80.0, 120.0, 5.0, dtype=np.float32)
+        )
+
+        assert result.total_effective_mm == pytest.approx(
+            expected.total_effective_mm, rel=1e-6
+        )
+        np.testing.assert_allclose(
+            result.hydrograph.discharge_m3s,
+            expected.hydrograph.discharge_m3s,
+            rtol=1e-5,
+            atol=1e-9,
+        )
+
     def test_generator_invalid_area(self):
         """Test that invalid area raises error."""
         with pytest.raises(InvalidParameterError, match="area_km2"):
@@ -81,6 +81,19 @@ class TestSnyderUHProperties:
 
         assert abs(uh.lag_time_min - uh.lag_time_hours * 60.0) < 0.01
 
+    def test_lag_time_is_cached(self):
+        """Test that repeated (Ct, L, Lc) triples reuse the cached lag."""
+        from hydrolog.runoff.snyder_uh import _snyder_lag_hours
+
+        _snyder_lag_hours.cache_clear()
+        uh = SnyderUH(area_km2=100.0, L_km=15.0, Lc_km=8.0, ct=1.5)
+        uh.generate(timestep_min=5.0)
+
+        info = _snyder_lag_hours.cache_info()
+        assert info.misses == 1
+        assert info.hits >= 1
+        assert uh.lag_time_hours == 1.5 * (120.0**0.3)
+
     def test_standard_duration_calculation(self):
         """Test standard duration calculation."""
         uh = SnyderUH(area_km2=100.0, L_km=15.0, Lc_km=8.0)
@@ -216,6 +229,21 @@ class TestSnyderUHWidth:
 class TestSnyderUHGenerate:
     """Tests for UH generation."""
 
+    def test_shape_matches_gamma_formula(self):
+        """Test the log-space shape against the direct gamma expression."""
+        uh = SnyderUH(area_km2=100.0, L_km=15.0, Lc_km=8.0)
+        times = np.array([-10.0, 0.0, 30.0, uh.time_to_peak_min(), 600.0])
+
+        ordinates = uh._generate_shape(times)
+
+        qp = uh.peak_discharge()
+        t_over_k = times[2:] / (uh.time_to_peak_min() / 2.7)
+        expected = qp * t_over_k**2.7 * np.exp(-(t_over_k - 2.7))
+        assert ordinates[0] == 0.0
+        assert ordinates[1] == 0.0
+        np.testing.assert_allclose(ordinates[2:], expected, rtol=1e-12)
+        assert np.argmax(ordinates) == 3
+
     def test_generate_returns_result(self):
         """Test generate returns SnyderUHResult."""
         uh = SnyderUH(area_km2=100.0, L_km=15.0, Lc_km=8.0)
@@ -1,6 +1,8 @@
 """Tests for WatershedParameters and from_dict() methods."""
 
+import dataclasses
 import json
+import math
 
 import pytest
 
@@ -10,6 +12,8 @@ from hydrolog.morphometry import (
     WatershedGeometry,
     WatershedParameters,
 )
+from hydrolog.morphometry import watershed_params
+from hydrolog.time import ConcentrationTime
 
 
 class TestWatershedParameters:
@@ -80,6 +84,17 @@ class TestWatershedParameters:
         expected_relief = 520.0 - 150.0  # max - min
         assert params.relief_m == expected_relief
 
+    def test_derived_properties_follow_field_updates(self, minimal_data: dict) -> None:
+        """Test that width and relief are not stale after field changes."""
+        params = WatershedParameters.from_dict(minimal_data)
+        assert params.relief_m == 370.0
+
+        params.elevation_max_m = 600.0
+        params.length_km = 10.0
+
+        assert params.relief_m == 450.0
+        assert params.width_km == pytest.approx(4.53)
+
     def test_validation_negative_area(self, minimal_data: dict) -> None:
         """Test validation rejects negative area."""
         minimal_data["area_km2"] = -10.0
@@ -121,6 +136,31 @@ class TestWatershedParameters:
         ):
             WatershedParameters(**minimal_data)
 
+    @pytest.mark.parametrize(
+        ("name", "value", "message"),
+        [
+            ("channel_length_km", 0.0, "channel_length_km must be positive"),
+            ("channel_slope_m_per_m", -0.1, "must be non-negative, got -0.1"),
+            ("runoff_coeff", 1.5, r"runoff_coeff must be in range \(0, 1.0\]"),
+            ("retardance", 0.0, "retardance must be positive"),
+            ("overland_length_km", -1.0, "must be positive, got -1.0"),
+            ("overland_slope_m_per_m", -0.2, "must be non-negative, got -0.2"),
+            ("Lc_km", 0.0, "Lc_km must be positive"),
+            ("manning_n", 0.0, "manning_n must be positive"),
+            ("urban_pct", 101.0, "urban_pct must be 0-100"),
+            ("forest_pct", -1.0, "forest_pct must be 0-100"),
+        ],
+    )
+    def test_validation_optional_fields(
+        self, minimal_data: dict, name: str, value: float, message: str
+    ) -> None:
+        """Test that optional fields are checked only when set."""
+        WatershedParameters(**minimal_data)
+        minimal_data[name] = value
+
+        with pytest.raises(InvalidParameterError, match=message):
+            WatershedParameters(**minimal_data)
+
 
 class TestWatershedParametersFromDict:
     """Tests for WatershedParameters.from_dict() method."""
@@ -177,6 +217,53 @@ class TestWatershedParametersFromDict:
         assert params.area_km2 == 45.0
         assert not hasattr(params, "unknown_field")
 
+    def test_slots(self) -> None:
+        """Test that parameters carry no per-instance __dict__."""
+        params = WatershedParameters(
+            area_km2=45.3,
+            perimeter_km=32.1,
+            length_km=12.5,
+            elevation_min_m=150.0,
+            elevation_max_m=520.0,
+        )
+
+        assert not hasattr(params, "__dict__")
+        assert dataclasses.asdict(params)["area_km2"] == 45.3
+        with pytest.raises(AttributeError):
+            params.unknown_field = 1.0
+
+    def test_known_fields_match_constructor(self) -> None:
+        """Test that accepted keys are exactly the dataclass fields."""
+        names = {f.name for f in dataclasses.fields(WatershedParameters)}
+
+        assert watershed_params._KNOWN_FIELDS == names
+        assert "forest_pct" in watershed_params._KNOWN_FIELDS
+
+    def test_from_dict_large_payload(self) -> None:
+        """Test extracting parameters from a payload with many extra keys."""
+        data = {f"attribute_{i}": i for i in range(50)}
+        data.update(
+            area_km2=45.0,
+            perimeter_km=32.0,
+            length_km=12.0,
+            elevation_min_m=150.0,
+            elevation_max_m=520.0,
+            cn=72,
+            geometry={"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [0, 1]]]},
+        )
+
+        params = WatershedParameters.from_dict(data)
+
+        assert params.cn == 72
+        assert params.to_dict() == {
+            "area_km2": 45.0,
+            "perimeter_km": 32.0,
+            "length_km": 12.0,
+            "elevation_min_m": 150.0,
+            "elevation_max_m": 520.0,
+            "cn": 72,
+        }
+
     def test_from_dict_missing_required_key(self) -> None:
         """Test that from_dict raises error for missing required keys."""
         data = {
@@ -212,6 +299,162 @@ class TestWatershedParametersFromJson:
         assert params.area_km2 == 45.0
         assert params.cn == 72
 
+    def test_from_json_bytes(self) -> None:
+        """Test creating from a UTF-8 JSON bytes payload."""
+        payload = (
+            '{"area_km2": 45.0, "perimeter_km": 32.0, "length_km": 12.0, '
+            '"elevation_min_m": 150.0, "elevation_max_m": 520.0, "name": "Wisłoka"}'
+        ).encode()
+
+        params = WatershedParameters.from_json(payload)
+
+        assert params.name == "Wisłoka"
+        assert params.area_km2 == 45.0
+
+    def test_from_json_accepts_nan(self) -> None:
+        """Test that non-strict JSON accepted by the stdlib still parses."""
+        json_str = (
+            '{"area_km2": 45.0, "perimeter_km": 32.0, "length_km": 12.0, '
+            '"elevation_min_m": 150.0, "elevation_max_m": 520.0, '
+            '"elevation_mean_m": NaN}'
+        )
+
+        params = WatershedParameters.from_json(json_str)
+
+        assert params.elevation_mean_m != params.elevation_mean_m  # NaN
+
+    def test_from_json_invalid(self) -> None:
+        """Test that malformed JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            WatershedParameters.from_json('{"area_km2": 45.0,')
+
+
+class TestWatershedParametersFromJsonArray:
+    """Tests for WatershedParameters.from_json_array() method."""
+
+    @pytest.fixture
+    def records(self) -> list[dict]:
+        """Bulk export with an unknown key and optional fields."""
+        return [
+            {
+                "name": f"W{i}",
+                "area_km2": 10.0 + i,
+                "perimeter_km": 20.0,
+                "length_km": 5.0,
+                "elevation_min_m": 100.0,
+                "elevation_max_m": 300.0 + i,
+                "cn": 60 + i,
+                "gis_id": i,
+            }
+            for i in range(5)
+        ]
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    def test_matches_from_dict(self, records, has_orjson, monkeypatch) -> None:
+        """Test that each element equals from_dict() of the same record."""
+        if has_orjson and not watershed_params.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(watershed_params, "HAS_ORJSON", has_orjson)
+
+        result = WatershedParameters.from_json_array(json.dumps(records))
+
+        assert result == [WatershedParameters.from_dict(r) for r in records]
+
+    def test_accepts_bytes_and_empty(self, records) -> None:
+        """Test bytes input and an empty array."""
+        payload = json.dumps(records).encode("utf-8")
+
+        assert len(WatershedParameters.from_json_array(payload)) == 5
+        assert WatershedParameters.from_json_array(b"[]") == []
+
+    def test_rejects_non_array(self) -> None:
+        """Test that a single object is rejected."""
+        with pytest.raises(InvalidParameterError, match="Expected a JSON array"):
+            WatershedParameters.from_json_array('{"area_km2": 45.0}')
+
+    def test_invalid_element(self, records) -> None:
+        """Test that element validation errors propagate."""
+        records[3]["area_km2"] = -1.0
+
+        with pytest.raises(InvalidParameterError, match="area_km2 must be positive"):
+            WatershedParameters.from_json_array(json.dumps(records))
+
+
+class TestWatershedParametersToJson:
+    """Tests for WatershedParameters.to_json() method."""
+
+    @pytest.fixture
+    def params(self) -> WatershedParameters:
+        """Parameters with a non-ASCII name and an integer CN."""
+        return WatershedParameters(
+            name="Dunajec – Nowy Targ",
+            area_km2=45.0,
+            perimeter_km=32.0,
+            length_km=12.0,
+            elevation_min_m=150.0,
+            elevation_max_m=520.0,
+            mean_slope_m_per_m=0.025,
+            cn=72,
+        )
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"name": "Raba"},
+            {"name": "Wisłok"},
+            {"name": "Raba", "elevation_mean_m": float("nan")},
+            {"name": "Soła", "mean_slope_m_per_m": 1e-5, "area_km2": 1e16},
+        ],
+        ids=["non_ascii", "ascii", "polish", "nan", "exponents"],
+    )
+    def test_to_json_text_matches_stdlib(
+        self, params: WatershedParameters, indent, overrides, monkeypatch
+    ) -> None:
+        """Test that the text is json.dumps()'s with and without orjson."""
+        for name, value in overrides.items():
+            setattr(params, name, value)
+        expected = json.dumps(params.to_dict(), indent=indent)
+
+        fast = params.to_json(indent=indent)
+        fast_bytes = params.to_json_bytes(indent=indent)
+        monkeypatch.setattr(watershed_params, "HAS_ORJSON", False)
+
+        assert fast == params.to_json(indent=indent) == expected
+        assert fast_bytes == params.to_json_bytes(indent=indent)
+        assert fast_bytes == expected.encode("ascii")
+
+    def test_to_json_nan_round_trip(self, params: WatershedParameters) -> None:
+        """Test that a NaN field survives to_json() / from_json()."""
+        params.elevation_mean_m = float("nan")
+
+        for indent in (None, 2):
+            restored = WatershedParameters.from_json(params.to_json(indent=indent))
+            assert math.isnan(restored.elevation_mean_m)
+            assert restored.name == params.name
+
+    def test_to_json_indent(self, params: WatershedParameters) -> None:
+        """Test that the requested indentation is honoured."""
+        assert '\n  "area_km2"' in params.to_json(indent=2)
+        assert '\n    "area_km2"' in params.to_json(indent=4)
+        assert "\n" not in params.to_json()
+
+    @pytest.mark.parametrize("has_orjson", [True, False])
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_to_json_bytes(
+        self, params: WatershedParameters, indent, has_orjson, monkeypatch
+    ) -> None:
+        """Test that bytes output decodes to to_json() and round-trips."""
+        if has_orjson and not watershed_params.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(watershed_params, "HAS_ORJSON", has_orjson)
+        raw = params.to_json_bytes(indent=indent)
+
+        assert isinstance(raw, bytes)
+        assert json.loads(raw) == json.loads(params.to_json(indent=indent))
+        assert WatershedParameters.from_json(raw) == params
+
 
 class TestWatershedParametersToDict:
     """Tests for WatershedParameters.to_dict() method."""
@@ -247,6 +490,24 @@ class TestWatershedParametersToDict:
         assert d["cn"] == 72
         assert d["source"] == "Test"
 
+    def test_to_dict_matches_asdict(self) -> None:
+        """Test that to_dict keeps asdict() key order minus None values."""
+        params = WatershedParameters(
+            name="Test",
+            area_km2=45.0,
+            perimeter_km=32.0,
+            length_km=12.0,
+            elevation_min_m=150.0,
+            elevation_max_m=520.0,
+            cn=72,
+            crs="EPSG:2180",
+        )
+        expected = {
+            k: v for k, v in dataclasses.asdict(params).items() if v is not None
+        }
+
+        assert list(params.to_dict().items()) == list(expected.items())
+
 
 class TestWatershedParametersRoundTrip:
     """Tests for to_dict/from_dict round-trip."""
@@ -453,6 +714,49 @@ class TestWatershedParametersCalculateTc:
         with pytest.raises(ValueError, match="Unknown method"):
             params_with_slope.calculate_tc(method="unknown")
 
+    def test_calculate_tc_method_built_at_runtime(
+        self, params_with_slope: WatershedParameters
+    ) -> None:
+        """Test that method names match by value, not identity."""
+        method = "".join(["kir", "pich"])
+
+        assert params_with_slope.calculate_tc(method) == (
+            params_with_slope.calculate_tc("kirpich")
+        )
+
+    def test_calculate_tc_unhashable_method(
+        self, params_with_slope: WatershedParameters
+    ) -> None:
+        """Test that a non-string method raises ValueError, not TypeError."""
+        with pytest.raises(ValueError, match="Unknown method"):
+            params_with_slope.calculate_tc(method=["kirpich"])  # type: ignore
+
+    def test_calculate_tc_dispatches_to_concentration_time(
+        self, params_with_slope: WatershedParameters
+    ) -> None:
+        """Test that each method matches the ConcentrationTime formula."""
+        params_with_slope.cn = 72
+        params_with_slope.runoff_coeff = 0.5
+        params_with_slope.retardance = 0.4
+        length, slope = 12.0, 0.025
+
+        assert params_with_slope.calculate_tc("kirpich") == pytest.approx(
+            ConcentrationTime.kirpich(length_km=length, slope_m_per_m=slope)
+        )
+        assert params_with_slope.calculate_tc("nrcs") == pytest.approx(
+            ConcentrationTime.nrcs(length_km=length, slope_m_per_m=slope, cn=72)
+        )
+        assert params_with_slope.calculate_tc("faa") == pytest.approx(
+            ConcentrationTime.faa(
+                length_km=length, slope_m_per_m=slope, runoff_coeff=0.5
+            )
+        )
+        assert params_with_slope.calculate_tc("kerby") == pytest.approx(
+            ConcentrationTime.kerby(
+                length_km=length, slope_m_per_m=slope, retardance=0.4
+            )
+        )
+
     def test_calculate_tc_slope_from_relief(self) -> None:
         """Test tc calculation with slope calculated from relief."""
         params = WatershedParameters(